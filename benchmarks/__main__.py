@@ -0,0 +1,91 @@
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import time
+import warnings
+from typing import Optional
+
+from benchmarks.cases import CASES
+from benchmarks.harness import BenchmarkComparison, BenchmarkResult, compare
+
+
+def _get_git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_results(results: list[BenchmarkResult], comparisons: Optional[list[BenchmarkComparison]]) -> None:
+    by_name = {comparison.name: comparison for comparison in comparisons or []}
+    print(f"{'Benchmark':<40}{'us/op':>12}{'ops/s':>14}{'baseline us/op':>16}{'change':>10}")
+    for result in results:
+        line = f"{result.name:<40}{result.seconds_per_op * 1e6:>12.2f}{result.ops_per_second:>14.0f}"
+        comparison = by_name.get(result.name)
+        if comparison and comparison.ratio is not None and comparison.baseline_seconds_per_op is not None:
+            change = f"{(comparison.ratio - 1) * 100:+.1f}%"
+            line += f"{comparison.baseline_seconds_per_op * 1e6:>16.2f}{change:>10}"
+            if comparison.regressed:
+                line += "  REGRESSED"
+        print(line)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(prog="benchmarks")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to save the results as JSON.")
+    parser.add_argument("--baseline", help="Results of an earlier run to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Slowdown relative to the baseline that fails the run (default: 0.2, i.e. 20%%).",
+    )
+    parser.add_argument("--only", action="append", choices=list(CASES), help="Run only these benchmarks.")
+    parser.add_argument("--quick", action="store_true", help="Smaller workloads, e.g. for a CI smoke run.")
+    args = parser.parse_args()
+
+    # per-call logs would dominate every measurement except the formatter's, which calls `format` directly
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    results = []
+    for name in args.only or CASES:
+        print(f"Running {name}...", file=sys.stderr)
+        results.append(CASES[name](args.quick))
+
+    comparisons = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("metadata", {}).get("quick") != args.quick:
+            print("Baseline was run with a different --quick setting, timings may not compare.", file=sys.stderr)
+        comparisons = compare(results=results, baseline=baseline, threshold=args.threshold)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "metadata": {
+                    "timestamp": time.time(),
+                    "revision": _get_git_revision(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "quick": args.quick,
+                },
+                "benchmarks": {result.name: result.model_dump() for result in results},
+            },
+            f,
+            indent=2,
+        )
+
+    _print_results(results=results, comparisons=comparisons)
+    if comparisons and any(comparison.regressed for comparison in comparisons):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import uuid
+from typing import Callable
+
+from benchmarks.harness import BenchmarkResult, measure, measure_allocations, measure_async
+from livekit_voice_call_runner import factory
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
+from livekit_voice_call_runner.concurrency.tasks_runner import ConcurrentTasksRunner
+from livekit_voice_call_runner.livekit.realtime_model_provider import shutdown_realtime_model_provider
+from livekit_voice_call_runner.logger import ColoredJsonFormatter, JsonFormatter, create_logger
+from livekit_voice_call_runner.outbound.call_orchestrator import OutboundCallOrchestrator
+from livekit_voice_call_runner.simulation.factory import create_simulation_config, create_simulation_outbound_config
+from livekit_voice_call_runner.simulation.fake_livekit import FakeLiveKitAPI, FakeLiveKitServer, SimulationProfile
+from livekit_voice_call_runner.simulation.simulator import simulate_outbound
+from livekit_voice_call_runner.telemetry.tracing import CallTracer
+
+BenchmarkCase = Callable[[bool], BenchmarkResult]
+
+
+def _create_orchestrator(instructions: int, phone_numbers: int, concurrency: int) -> OutboundCallOrchestrator:
+    return OutboundCallOrchestrator(
+        instructions=[f"Instructions {i}." for i in range(instructions)],
+        phone_numbers=[f"+1555{i:07d}" for i in range(phone_numbers)],
+        concurrency=concurrency,
+        rounds=1,
+        concurrent_tasks_runner=ConcurrentTasksRunner(logger=create_logger(name="ConcurrentTasksRunner")),
+        logger=create_logger(name="OutboundCallOrchestrator"),
+        cfg=create_simulation_config(),
+        outbound_cfg=create_simulation_outbound_config(),
+        livekit_api=FakeLiveKitAPI(server=FakeLiveKitServer()),  # type: ignore
+        rate_limiter=LiveKitRateLimiter(),
+        tracer=CallTracer(),
+    )
+
+
+def bench_build_call_runner_props(quick: bool) -> BenchmarkResult:
+    instructions, phone_numbers = (5, 20) if quick else (10, 100)
+    orchestrator = _create_orchestrator(instructions=instructions, phone_numbers=phone_numbers, concurrency=10)
+
+    async def build() -> None:
+        try:
+            for instructions_, phone_number_to in orchestrator._iter_round_scenarios():
+                orchestrator._create_call_runner_props(instructions=instructions_, phone_number_to=phone_number_to)
+        finally:
+            # the shared realtime models belong to this run's loop, so their HTTP session is closed before it ends
+            await shutdown_realtime_model_provider()
+
+    return measure_async(
+        name="orchestrator_build_call_runner_props",
+        fn=build,
+        number=orchestrator._calls_per_round(),
+        repeat=3,
+        extra={"matrix": f"{instructions}x{phone_numbers}"},
+    )
+
+
+def bench_tasks_runner_run(quick: bool) -> BenchmarkResult:
+    tasks, concurrency = (2_000 if quick else 10_000), 100
+    runner = ConcurrentTasksRunner(logger=create_logger(name="ConcurrentTasksRunner"))
+
+    async def noop() -> None:
+        await asyncio.sleep(0)
+
+    async def run() -> None:
+        await runner.run(tasks=[noop() for _ in range(tasks)], concurrency=concurrency)
+
+    return measure_async(
+        name="tasks_runner_run",
+        fn=run,
+        number=tasks,
+        extra={"tasks": tasks, "concurrency": concurrency},
+    )
+
+
+def _create_log_record() -> logging.LogRecord:
+    record = logging.LogRecord(
+        name="OutboundCallDialer",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="Successfully dialed call.",
+        args=None,
+        exc_info=None,
+    )
+    extra = {
+        "sip_trunk_id": "ST_simulated",
+        "sip_call_to": "+15550000000",
+        "sip_number": "+10000000000",
+        "room_name": f"simulated-{uuid.uuid4()}",
+        "sip_call_id": "SCL_1",
+        "rate_limit_wait_seconds": 0.0,
+    }
+    record.__dict__.update(extra)
+    return record
+
+
+def _bench_formatter(name: str, formatter: JsonFormatter, quick: bool) -> BenchmarkResult:
+    records = 5_000 if quick else 50_000
+    record = _create_log_record()
+
+    def format_records() -> None:
+        for _ in range(records):
+            formatter.format(record)
+
+    return measure(name=name, fn=format_records, number=records)
+
+
+def bench_json_formatter_format(quick: bool) -> BenchmarkResult:
+    return _bench_formatter(
+        name="json_formatter_format", formatter=JsonFormatter(correlation_id=str(uuid.uuid4())), quick=quick
+    )
+
+
+def bench_colored_json_formatter_format(quick: bool) -> BenchmarkResult:
+    return _bench_formatter(
+        name="colored_json_formatter_format",
+        formatter=ColoredJsonFormatter(correlation_id=str(uuid.uuid4())),
+        quick=quick,
+    )
+
+
+def bench_create_call_runner_props(quick: bool) -> BenchmarkResult:
+    props = 100 if quick else 1_000
+    cfg = create_simulation_config()
+    outbound_cfg = create_simulation_outbound_config()
+    livekit_api = FakeLiveKitAPI(server=FakeLiveKitServer())
+    rate_limiter = LiveKitRateLimiter()
+    tracer = CallTracer()
+
+    async def create() -> None:
+        try:
+            for _ in range(props):
+                factory.create_call_runner_props(
+                    instructions="Instructions.",
+                    phone_number_to="+15550000000",
+                    correlation_id=str(uuid.uuid4()),
+                    cfg=cfg,
+                    outbound_cfg=outbound_cfg,
+                    livekit_api=livekit_api,  # type: ignore
+                    rate_limiter=rate_limiter,
+                    tracer=tracer,
+                )
+        finally:
+            await shutdown_realtime_model_provider()
+
+    result = measure_async(name="factory_create_call_runner_props", fn=create, number=props, repeat=3)
+    result.extra.update(measure_allocations(fn=lambda: asyncio.run(create()), number=props))
+    return result
+
+
+def bench_simulated_outbound_calls(quick: bool) -> BenchmarkResult:
+    calls, concurrency = (200, 50) if quick else (2_000, 200)
+    profile = SimulationProfile(time_scale=0.001, seed=1)
+
+    async def simulate() -> None:
+        await simulate_outbound(calls=calls, concurrency=concurrency, profile=profile)
+
+    return measure_async(
+        name="simulated_outbound_calls",
+        fn=simulate,
+        number=calls,
+        repeat=3,
+        extra={"calls": calls, "concurrency": concurrency, "time_scale": profile.time_scale},
+    )
+
+
+CASES: dict[str, BenchmarkCase] = {
+    "orchestrator_build_call_runner_props": bench_build_call_runner_props,
+    "tasks_runner_run": bench_tasks_runner_run,
+    "json_formatter_format": bench_json_formatter_format,
+    "colored_json_formatter_format": bench_colored_json_formatter_format,
+    "factory_create_call_runner_props": bench_create_call_runner_props,
+    "simulated_outbound_calls": bench_simulated_outbound_calls,
+}
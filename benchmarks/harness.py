@@ -0,0 +1,117 @@
+import asyncio
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Optional
+
+from pydantic import Field
+
+from livekit_voice_call_runner.model import BaseModel
+
+
+class BenchmarkResult(BaseModel):
+    name: str
+    # operations timed per repeat, e.g. formatted log records or scheduled tasks
+    number: int
+    repeat: int
+    seconds_per_op: float
+    min_seconds_per_op: float
+    ops_per_second: float
+    extra: dict[str, Any] = Field(default_factory=dict)
+
+
+class BenchmarkComparison(BaseModel):
+    name: str
+    baseline_seconds_per_op: Optional[float]
+    seconds_per_op: float
+    # current / baseline; above 1 is slower
+    ratio: Optional[float]
+    regressed: bool
+
+
+def _create_result(name: str, number: int, timings: list[float], extra: Optional[dict[str, Any]]) -> BenchmarkResult:
+    per_op = [timing / number for timing in timings]
+    median = statistics.median(per_op)
+    return BenchmarkResult(
+        name=name,
+        number=number,
+        repeat=len(timings),
+        seconds_per_op=median,
+        min_seconds_per_op=min(per_op),
+        ops_per_second=1 / median if median else 0.0,
+        extra=extra or {},
+    )
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    number: int,
+    repeat: int = 5,
+    extra: Optional[dict[str, Any]] = None,
+) -> BenchmarkResult:
+    """
+    Time `repeat` runs of `fn`, which performs `number` operations, and report the median time per operation.
+    """
+    fn()  # warm up caches and lazy imports
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started_at = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started_at)
+    return _create_result(name=name, number=number, timings=timings, extra=extra)
+
+
+def measure_async(
+    name: str,
+    fn: Callable[[], Awaitable[Any]],
+    number: int,
+    repeat: int = 5,
+    extra: Optional[dict[str, Any]] = None,
+) -> BenchmarkResult:
+    """
+    Like `measure`, with each run in a fresh event loop so loop state does not carry over between repeats.
+    """
+    return measure(name=name, fn=lambda: asyncio.run(fn()), number=number, repeat=repeat, extra=extra)
+
+
+def measure_allocations(fn: Callable[[], Any], number: int) -> dict[str, float]:
+    """
+    Bytes allocated and retained per operation while `fn` performs `number` operations.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"retained_bytes_per_op": current / number, "peak_bytes_per_op": peak / number}
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[BenchmarkComparison]:
+    """
+    Compare median time per operation against a saved run; slower by more than `threshold` (e.g. 0.2) regresses.
+    """
+    baseline_results = baseline.get("benchmarks", {})
+    comparisons = []
+    for result in results:
+        baseline_result = baseline_results.get(result.name)
+        baseline_seconds_per_op = baseline_result["seconds_per_op"] if baseline_result else None
+        ratio = result.seconds_per_op / baseline_seconds_per_op if baseline_seconds_per_op else None
+        comparisons.append(
+            BenchmarkComparison(
+                name=result.name,
+                baseline_seconds_per_op=baseline_seconds_per_op,
+                seconds_per_op=result.seconds_per_op,
+                ratio=ratio,
+                regressed=ratio is not None and ratio > 1 + threshold,
+            )
+        )
+    return comparisons
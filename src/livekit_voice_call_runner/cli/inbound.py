@@ -1,13 +1,37 @@
 from functools import partial
 import sys
+import tempfile
+from typing import Any
 
 from livekit.agents import cli
 from livekit.agents.worker import WorkerOptions
 from livekit_voice_call_runner.inbound import worker
 
 
+def _get_metrics_options(args) -> dict[str, Any]:
+    if args.metrics_port is None:
+        return {}
+    # calls run in job processes, which report through prometheus_client's multiprocess mode; the worker's own
+    # server aggregates them along with the LiveKit agents metrics
+    return {
+        "prometheus_port": args.metrics_port,
+        "prometheus_multiproc_dir": tempfile.mkdtemp(prefix="livekit_voice_call_runner-metrics-"),
+    }
+
+
 def run(args) -> None:
     instructions = open(args.instructions_path, encoding="utf-8").read()
     # Force the LiveKit agents worker into dev mode, bypassing the livekit CLI sub-command requirement.
     sys.argv = [sys.argv[0], "dev"]
-    cli.run_app(opts=WorkerOptions(entrypoint_fnc=partial(worker.handle, instructions=instructions)))
+    cli.run_app(
+        opts=WorkerOptions(
+            # calls run in job processes, so the profile settings go along with the entrypoint
+            entrypoint_fnc=partial(
+                worker.handle,
+                instructions=instructions,
+                profile_mode=args.profile,
+                profile_path=args.profile_path,
+            ),
+            **_get_metrics_options(args),
+        )
+    )
@@ -1,7 +1,15 @@
 import argparse
+import os
 from enum import Enum
 
 from livekit_voice_call_runner.cli import inbound, outbound
+from livekit_voice_call_runner.concurrency.arrival_profiles import ArrivalProfileType
+from livekit_voice_call_runner.config.base import LogLevel, get_logging_config
+from livekit_voice_call_runner.logger import set_log_level
+from livekit_voice_call_runner.outbound.call_orchestrator import OutboundCallScheduler
+from livekit_voice_call_runner.outbound.call_record_sink import CallRecordFormat
+from livekit_voice_call_runner.outbound.campaign_queue import CampaignRole
+from livekit_voice_call_runner.telemetry.profiler import ProfileMode
 
 
 class Direction(str, Enum):
@@ -9,6 +17,23 @@ class Direction(str, Enum):
     INBOUND = "inbound"
 
 
+def _apply_logging_args(args: argparse.Namespace) -> None:
+    # exported rather than passed down, so inbound job processes, which read their logging config from the
+    # environment, get them too
+    overrides = {
+        "LOG_LEVEL": args.log_level,
+        "TRANSCRIPT_LOG_LEVEL": args.transcript_log_level,
+        "TRANSCRIPT_LOG_SAMPLE_RATE": args.transcript_sample_rate,
+        "TRANSCRIPT_LOG_MAX_CHARS": args.transcript_max_chars,
+        "TRANSCRIPT_DIR": args.transcript_dir,
+    }
+    for key, value in overrides.items():
+        if value is not None:
+            os.environ[key] = value.value if isinstance(value, Enum) else str(value)
+    get_logging_config.cache_clear()
+    set_log_level(get_logging_config().level)
+
+
 def run() -> None:
     parser = argparse.ArgumentParser(prog="livekit_voice_call_runner")
     parser.add_argument(
@@ -23,8 +48,7 @@ def run() -> None:
     )
     parser.add_argument(
         "--instructions-path",
-        required=True,
-        help="Path to the file containing the instructions for the call agent.",
+        help="Path to the file containing the instructions for the call agent (not needed by campaign workers).",
     )
     parser.add_argument(
         "--phone-number",
@@ -43,11 +67,207 @@ def run() -> None:
         default=1,
         help="Number of scenarios to run concurrently (outbound only).",
     )
+    parser.add_argument(
+        "--adaptive-concurrency",
+        action="store_true",
+        help=(
+            "Adapt the number of calls in flight to the error rate and setup latency of recent calls, growing it "
+            "while they meet their targets and halving it when they don't, with --concurrency as the upper bound "
+            "(outbound only; targets are set in the CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_* variables)."
+        ),
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help=(
+            "Number of processes to split the run across, each running a share of the concurrency, phone numbers, "
+            "calls per round and arrival rate on its own CPU core (outbound only)."
+        ),
+    )
+    parser.add_argument(
+        "--scheduler",
+        choices=list(OutboundCallScheduler),
+        type=OutboundCallScheduler,
+        default=OutboundCallScheduler.ROUNDS,
+        help=(
+            f"How calls are scheduled (outbound only): '{OutboundCallScheduler.ROUNDS.value}' waits for each round "
+            f"to finish, '{OutboundCallScheduler.STREAMING.value}' refills a slot as soon as any call ends, "
+            f"'{OutboundCallScheduler.OPEN_LOOP.value}' launches calls at --arrival-rate capped by --concurrency."
+        ),
+    )
+    parser.add_argument(
+        "--arrival-profile",
+        choices=list(ArrivalProfileType),
+        type=ArrivalProfileType,
+        default=ArrivalProfileType.CONSTANT,
+        help="Shape of the open-loop arrival rate (outbound open-loop only).",
+    )
+    parser.add_argument(
+        "--arrival-rate",
+        type=float,
+        action="append",
+        help=(
+            "Calls per second (outbound open-loop only). Repeat it for each step of a 'step' profile, "
+            "or pass the start and end rate of a 'ramp' profile."
+        ),
+    )
+    parser.add_argument(
+        "--arrival-interval-seconds",
+        type=float,
+        help="Duration of each step, or of the whole ramp, in seconds (outbound open-loop only).",
+    )
+    parser.add_argument(
+        "--prewarm-pool-size",
+        type=int,
+        default=0,
+        help=(
+            "Number of upcoming calls to prepare (room connected, agent ready) while other calls are in progress, "
+            "so only the dial is left when a slot frees (outbound only, 0 disables)."
+        ),
+    )
+    parser.add_argument(
+        "--prewarm-max-idle-seconds",
+        type=float,
+        default=60.0,
+        help="Prepared calls idle for longer than this are torn down and prepared again (outbound only).",
+    )
+    parser.add_argument(
+        "--trace-path",
+        help="Append per-call phase timings to this JSONL file (outbound only).",
+    )
+    parser.add_argument(
+        "--otlp-endpoint",
+        help="Export per-call phase timings to this OTLP/HTTP collector, e.g. http://localhost:4318 (outbound only).",
+    )
+    parser.add_argument(
+        "--results-path",
+        help="Write one structured record per call to this file as calls finish (outbound only).",
+    )
+    parser.add_argument(
+        "--results-format",
+        choices=list(CallRecordFormat),
+        type=CallRecordFormat,
+        default=CallRecordFormat.JSONL,
+        help=f"Format of --results-path; '{CallRecordFormat.PARQUET.value}' requires pyarrow (outbound only).",
+    )
+    parser.add_argument(
+        "--summary-path",
+        help="Write the run summary (outcome counts and latency percentiles) to this file as JSON (outbound only).",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help=(
+            "Serve live call metrics in Prometheus format at :<port>/metrics. Each process of a multi-process "
+            "outbound run serves its own on the next port up; the inbound worker serves its job processes' along "
+            "with the LiveKit agents metrics."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        choices=list(ProfileMode),
+        type=ProfileMode,
+        help=(
+            f"Profile every process of the run: '{ProfileMode.CPROFILE.value}' records every function call, "
+            f"'{ProfileMode.SAMPLING.value}' samples the event loop's stack, cheaply enough for a full-load run. "
+            f"Either way, the event loop's CPU time is logged by call phase."
+        ),
+    )
+    parser.add_argument(
+        "--profile-path",
+        default="profile",
+        help=(
+            "Where --profile writes, suffixed per process: the shard of a multi-process outbound run, the process id "
+            "of an inbound job process (default: profile.prof for cProfile, profile.folded for sampling)."
+        ),
+    )
+    parser.add_argument(
+        "--campaign-role",
+        choices=list(CampaignRole),
+        type=CampaignRole,
+        help=(
+            f"Run one side of a campaign shared through --campaign-db (outbound only): "
+            f"'{CampaignRole.COORDINATOR.value}' creates the campaign from the instructions, phone numbers and "
+            f"rounds and reports it once done, '{CampaignRole.WORKER.value}' leases batches of its calls and runs "
+            f"them at --concurrency. Run as many workers, on as many hosts, as needed."
+        ),
+    )
+    parser.add_argument(
+        "--campaign-db",
+        help=(
+            "Path to the SQLite database holding the campaign, on storage every node can reach with working file "
+            "locks (outbound only)."
+        ),
+    )
+    parser.add_argument(
+        "--campaign-lease-seconds",
+        type=float,
+        default=60.0,
+        help="How long a worker holds leased calls without renewing; calls of a dead worker are re-issued after it.",
+    )
+    parser.add_argument(
+        "--campaign-max-attempts",
+        type=int,
+        default=3,
+        help="Number of times a call is leased before it's abandoned.",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=list(LogLevel),
+        type=LogLevel,
+        help="Level of the logs (default: LOG_LEVEL, or INFO).",
+    )
+    parser.add_argument(
+        "--transcript-log-level",
+        choices=list(LogLevel),
+        type=LogLevel,
+        help="Level of the transcript lines, e.g. DEBUG to keep them out of an INFO log (default: INFO).",
+    )
+    parser.add_argument(
+        "--transcript-sample-rate",
+        type=float,
+        help="Share of calls, between 0 and 1, whose transcript is logged (default: 1).",
+    )
+    parser.add_argument(
+        "--transcript-max-chars",
+        type=int,
+        help="Cut transcript lines longer than this in the logs (default: no limit).",
+    )
+    parser.add_argument(
+        "--transcript-dir",
+        help="Write full transcripts to one JSONL file per call in this directory instead of the logs.",
+    )
     args = parser.parse_args()
 
-    if args.direction == Direction.OUTBOUND and not args.phone_number:
+    campaign_worker = args.direction == Direction.OUTBOUND and args.campaign_role == CampaignRole.WORKER
+
+    if not args.instructions_path and not campaign_worker:
+        parser.error("--instructions-path is required")
+
+    if args.direction == Direction.OUTBOUND and not args.phone_number and not campaign_worker:
         parser.error("--phone-number is required for outbound direction")
 
+    if args.campaign_role and not args.campaign_db:
+        parser.error("--campaign-db is required with --campaign-role")
+
+    if campaign_worker and args.prewarm_pool_size:
+        parser.error("--prewarm-pool-size can't be used by campaign workers")
+
+    if args.scheduler == OutboundCallScheduler.OPEN_LOOP and not args.arrival_rate:
+        parser.error(f"--arrival-rate is required for the {OutboundCallScheduler.OPEN_LOOP.value} scheduler")
+
+    if not 1 <= args.processes <= args.concurrency:
+        parser.error("--processes must be between 1 and --concurrency")
+
+    if args.metrics_port is not None and not 0 <= args.metrics_port <= 65535 - (args.processes - 1):
+        parser.error("--metrics-port must be a valid port, for each process")
+
+    if args.transcript_sample_rate is not None and not 0 <= args.transcript_sample_rate <= 1:
+        parser.error("--transcript-sample-rate must be between 0 and 1")
+
+    _apply_logging_args(args)
+
     if args.direction == Direction.OUTBOUND:
         outbound.run(args)
     else:
@@ -1,43 +1,371 @@
+import argparse
 import asyncio
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import socket
 import sys
+import time
 import uuid
+from typing import Any, Optional
 
 from livekit_voice_call_runner import config, factory
+from livekit_voice_call_runner.concurrency.arrival_profiles import create_arrival_profile
 from livekit_voice_call_runner.concurrency.tasks_runner import ConcurrentTasksRunner
-from livekit_voice_call_runner.logger import create_logger
-from livekit_voice_call_runner.outbound.call_orchestrator import OutboundCallOrchestrator
+from livekit_voice_call_runner.livekit.realtime_model_provider import shutdown_realtime_model_provider
+from livekit_voice_call_runner.log_pipeline import shutdown_log_pipeline
+from livekit_voice_call_runner.logger import bind_log_context, create_logger
+from livekit_voice_call_runner.model import BaseModel
+from livekit_voice_call_runner.outbound.call_orchestrator import OutboundCallOrchestrator, OutboundCallScheduler
+from livekit_voice_call_runner.outbound.campaign_queue import CampaignProgress, CampaignRole, CampaignStore
+from livekit_voice_call_runner.outbound.run_summary import RunSummary
+from livekit_voice_call_runner.telemetry.loop_monitor import get_event_loop_monitor, shutdown_event_loop_monitor
+from livekit_voice_call_runner.telemetry.metrics import get_call_metrics
 
-logger = create_logger(name=__name__, correlation_id=str(uuid.uuid4()))
+logger = create_logger(name=__name__)
 
+_SHARD_POLL_SECONDS = 0.5
+_CAMPAIGN_POLL_SECONDS = 5.0
+
+
+def _report_summary(summary: RunSummary, summary_path: Optional[str]) -> None:
+    print(summary.format())
+    if summary_path:
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(summary.to_dict(), f, indent=2)
 
-async def _run(args) -> None:
-    instructions = open(args.instructions_path, encoding="utf-8").read()
+
+async def _run_orchestrator(args, summary: Optional[RunSummary] = None) -> RunSummary:
+    # a campaign worker takes its calls, instructions included, from the campaign instead
+    instructions = [open(args.instructions_path, encoding="utf-8").read()] if args.instructions_path else []
+    campaign_store = (
+        CampaignStore(
+            path=args.campaign_db,
+            lease_seconds=args.campaign_lease_seconds,
+            max_attempts=args.campaign_max_attempts,
+        )
+        if args.campaign_role == CampaignRole.WORKER
+        else None
+    )
 
     cfg = config.base.get_config()
     outbound_cfg = config.outbound.get_config()
-    livekit_api = factory.create_livekit_api(cfg=cfg)
+    livekit_api = factory.create_livekit_api(cfg=cfg, max_concurrent_calls=args.concurrency + args.prewarm_pool_size)
+    tracer = factory.create_call_tracer(trace_path=args.trace_path, otlp_endpoint=args.otlp_endpoint)
+    concurrency_limiter = (
+        factory.create_adaptive_concurrency_limiter(
+            outbound_cfg=outbound_cfg, max_limit=args.concurrency, share=1 / args.processes
+        )
+        if args.adaptive_concurrency
+        else None
+    )
+    # each process of a multi-process run paces its share of the configured limits
+    rate_limiter = factory.create_livekit_rate_limiter(cfg=cfg, outbound_cfg=outbound_cfg, share=1 / args.processes)
+    event_loop_monitor = get_event_loop_monitor()
+    metrics_server = (
+        factory.create_metrics_server(
+            port=args.metrics_port,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            event_loop_monitor=event_loop_monitor,
+        )
+        if args.metrics_port is not None
+        else None
+    )
+    profiler = factory.create_run_profiler(mode=args.profile, path=args.profile_path)
 
     try:
+        if profiler:
+            profiler.start()
+        if metrics_server:
+            metrics_server.start()
+            logger.info("Serving metrics.", extra={"port": metrics_server.port})
         call_orchestrator = OutboundCallOrchestrator(
-            instructions=[instructions],
-            phone_numbers=args.phone_number,
+            instructions=instructions,
+            phone_numbers=args.phone_number or [],
             concurrency=args.concurrency,
             rounds=args.rounds,
             concurrent_tasks_runner=ConcurrentTasksRunner(
                 logger=create_logger(name="ConcurrentTasksRunner"),
+                limiter=concurrency_limiter,
             ),
             logger=create_logger(name="OutboundCallOrchestrator"),
             cfg=cfg,
             outbound_cfg=outbound_cfg,
             livekit_api=livekit_api,
+            rate_limiter=rate_limiter,
+            tracer=tracer,
+            call_record_sink=factory.create_call_record_sink(path=args.results_path, record_format=args.results_format),
+            transcript_sink=factory.create_call_transcript_sink(
+                directory=config.base.get_logging_config().transcript.directory
+            ),
+            scheduler=args.scheduler,
+            arrival_profile=(
+                create_arrival_profile(
+                    profile_type=args.arrival_profile,
+                    rates=args.arrival_rate,
+                    interval_seconds=args.arrival_interval_seconds,
+                )
+                if args.scheduler == OutboundCallScheduler.OPEN_LOOP
+                else None
+            ),
+            prewarm_pool_size=args.prewarm_pool_size,
+            prewarm_max_idle_seconds=args.prewarm_max_idle_seconds,
+            # only the shards of a multi-process run set it
+            calls_per_round=getattr(args, "calls_per_round", None),
+            summary=summary,
+            call_queue=(
+                factory.create_campaign_call_queue(
+                    store=campaign_store,
+                    # every process is a node of its own, so a multi-process worker leases per shard
+                    node_id=f"{socket.gethostname()}-{os.getpid()}",
+                    batch_size=args.concurrency,
+                )
+                if campaign_store
+                else None
+            ),
+            concurrency_limiter=concurrency_limiter,
+            call_metrics=get_call_metrics() if metrics_server else None,
+            event_loop_monitor=event_loop_monitor,
         )
         await call_orchestrator.run()
+        return call_orchestrator.summary
+    finally:
+        await shutdown_realtime_model_provider()
+        tracer.shutdown()
+        if metrics_server:
+            metrics_server.shutdown()
+        await shutdown_event_loop_monitor()
+        if campaign_store:
+            campaign_store.close()
+        if profiler:
+            profiler.stop()
+
+
+def _log_pipeline_stats() -> None:
+    log_pipeline_stats = shutdown_log_pipeline()
+    if log_pipeline_stats:
+        logger.info("Log pipeline stats.", extra=log_pipeline_stats.model_dump())
+
+
+async def _run(args) -> None:
+    try:
+        summary = await _run_orchestrator(args)
+        _report_summary(summary=summary, summary_path=args.summary_path)
         logger.info("Successfully ran.")
         sys.exit(0)
     except Exception as e:
         logger.error("Failed to run.", extra={"error": str(e)})
         sys.exit(1)
+    finally:
+        _log_pipeline_stats()
+
+
+class _ShardResult(BaseModel):
+    shard: int
+    # `RunSummary.to_mergeable_dict` of the calls that finished, also when the shard failed or was stopped
+    summary: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+def _split(total: int, parts: int) -> list[int]:
+    return [total // parts + (1 if index < total % parts else 0) for index in range(parts)]
+
+
+def _get_shard_path(path: Optional[str], shard: int) -> Optional[str]:
+    if not path:
+        return None
+    root, extension = os.path.splitext(path)
+    return f"{root}.shard-{shard}{extension}"
+
+
+def _create_shard_args(args, shard: int) -> argparse.Namespace:
+    """
+    The share of the run that one process runs: a slice of the concurrency, prewarm pool, phone numbers, calls per
+    round and arrival rate, and its own results, trace and profile files.
+    """
+    processes = args.processes
+    phone_numbers = args.phone_number or []
+    # the calls one process would place each round, so the shards together place no more
+    instructions_count = 1 if args.instructions_path else 0
+    calls_per_round = max(instructions_count * len(phone_numbers), args.concurrency)
+    if len(phone_numbers) >= processes:
+        shard_phone_numbers = phone_numbers[shard::processes]
+    else:
+        # with fewer numbers than processes, every process cycles through all of them, starting where one process
+        # would have been at its first call, so the calls still spread evenly across the numbers
+        offset = sum(_split(calls_per_round, processes)[:shard]) % len(phone_numbers) if phone_numbers else 0
+        shard_phone_numbers = phone_numbers[offset:] + phone_numbers[:offset]
+    return argparse.Namespace(
+        **{
+            **vars(args),
+            "shard": shard,
+            "phone_number": shard_phone_numbers,
+            "concurrency": _split(args.concurrency, processes)[shard],
+            "calls_per_round": _split(calls_per_round, processes)[shard],
+            "prewarm_pool_size": _split(args.prewarm_pool_size, processes)[shard],
+            "arrival_rate": [rate / processes for rate in args.arrival_rate] if args.arrival_rate else None,
+            "results_path": _get_shard_path(args.results_path, shard),
+            "trace_path": _get_shard_path(args.trace_path, shard),
+            "profile_path": _get_shard_path(args.profile_path, shard),
+            # every process serves its own metrics, on consecutive ports
+            "metrics_port": args.metrics_port + shard if args.metrics_port else args.metrics_port,
+            # the parent reports the merged summary
+            "summary_path": None,
+        }
+    )
+
+
+async def _run_shard_orchestrator(args, summary: RunSummary) -> None:
+    # the parent stops a shard with SIGTERM; cancelling lets the orchestrator shut its calls and sinks down
+    task = asyncio.current_task()
+    assert task is not None
+    loop = asyncio.get_running_loop()
+
+    def _on_sigterm() -> None:
+        loop.remove_signal_handler(signal.SIGTERM)
+        logger.warning("Received SIGTERM, stopping.")
+        task.cancel()
+
+    loop.add_signal_handler(signal.SIGTERM, _on_sigterm)
+    await _run_orchestrator(args, summary=summary)
+
+
+def _run_shard(args, run_id: str, results: multiprocessing.Queue) -> None:
+    # a Ctrl-C reaches the whole process group; the parent forwards it as a single SIGTERM instead
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    result = _ShardResult(shard=args.shard)
+    summary = RunSummary()
+    with bind_log_context(correlation_id=run_id, shard=args.shard):
+        try:
+            asyncio.run(_run_shard_orchestrator(args, summary=summary))
+        except asyncio.CancelledError:
+            result.error = "stopped"
+        except Exception as e:
+            logger.error("Failed to run shard.", extra={"error": str(e)})
+            result.error = str(e)
+        finally:
+            _log_pipeline_stats()
+    result.summary = summary.to_mergeable_dict()
+    results.put(result.model_dump())
+
+
+def _collect_shard_results(
+    processes: list[multiprocessing.process.BaseProcess], results: multiprocessing.Queue
+) -> dict[int, _ShardResult]:
+    collected: dict[int, _ShardResult] = {}
+    # results are drained while the shards run, so none blocks on a full pipe; a shard that dies without reporting is
+    # noticed once it has exited and the queue is empty
+    while len(collected) < len(processes):
+        try:
+            result = _ShardResult(**results.get(timeout=_SHARD_POLL_SECONDS))
+            collected[result.shard] = result
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                break
+    for process in processes:
+        process.join()
+    return collected
+
+
+def _run_processes(args, run_id: str) -> None:
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(
+            target=_run_shard,
+            kwargs={"args": _create_shard_args(args, shard=shard), "run_id": run_id, "results": results},
+            name=f"shard-{shard}",
+        )
+        for shard in range(args.processes)
+    ]
+
+    # a shard stops gracefully on the first SIGTERM and is killed by the next one, so a second Ctrl-C forces the stop
+    def _forward_signal(signum, frame) -> None:
+        logger.warning("Stopping shards.", extra={"signal": signal.Signals(signum).name})
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    previous_handlers = {signum: signal.signal(signum, _forward_signal) for signum in [signal.SIGINT, signal.SIGTERM]}
+    logger.info("Starting shards.", extra={"processes": args.processes, "concurrency": args.concurrency})
+    try:
+        for process in processes:
+            process.start()
+        collected = _collect_shard_results(processes=processes, results=results)
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+    summary = RunSummary()
+    failed = []
+    for shard, process in enumerate(processes):
+        result = collected.get(shard)
+        if result and result.summary is not None:
+            summary.merge(RunSummary.from_mergeable_dict(result.summary))
+        if not result or result.error is not None or process.exitcode:
+            failed.append(shard)
+            logger.error(
+                "Shard failed.",
+                extra={"shard": shard, "exitcode": process.exitcode, "error": result.error if result else None},
+            )
+
+    _report_summary(summary=summary, summary_path=args.summary_path)
+    if failed:
+        logger.error("Failed to run.", extra={"failed_shards": failed})
+        sys.exit(1)
+    logger.info("Successfully ran.", extra={"processes": args.processes})
+    sys.exit(0)
+
+
+def _wait_for_campaign(store: CampaignStore) -> CampaignProgress:
+    while True:
+        # workers re-issue expired leases themselves when they lease; this also abandons calls nobody is left to take
+        reclaimed = store.reclaim_expired()
+        if reclaimed:
+            logger.warning("Re-issued expired leases.", extra={"count": reclaimed})
+        progress = store.progress()
+        logger.info("Campaign progress.", extra=progress.model_dump())
+        if progress.finished:
+            return progress
+        time.sleep(_CAMPAIGN_POLL_SECONDS)
+
+
+def _run_coordinator(args) -> None:
+    instructions = open(args.instructions_path, encoding="utf-8").read()
+    store = CampaignStore(
+        path=args.campaign_db,
+        lease_seconds=args.campaign_lease_seconds,
+        max_attempts=args.campaign_max_attempts,
+    )
+    try:
+        created = store.create(instructions=[instructions], phone_numbers=args.phone_number, rounds=args.rounds)
+        logger.info("Running campaign.", extra={"campaign_db": args.campaign_db, "new_calls": created})
+        progress = _wait_for_campaign(store)
+        summary = RunSummary()
+        for record in store.iter_records():
+            summary.record(record)
+    finally:
+        store.close()
+
+    _report_summary(summary=summary, summary_path=args.summary_path)
+    if progress.abandoned:
+        logger.error("Failed to run.", extra={"abandoned": progress.abandoned})
+        sys.exit(1)
+    logger.info("Successfully ran.", extra={"calls": progress.done})
+    sys.exit(0)
 
 
 def run(args) -> None:
-    asyncio.run(_run(args))
+    run_id = str(uuid.uuid4())
+    # run-level lines carry the run's id; each call binds its own correlation id on top, and in a multi-process run
+    # each process adds its shard
+    with bind_log_context(correlation_id=run_id):
+        if args.campaign_role == CampaignRole.COORDINATOR:
+            _run_coordinator(args)
+        elif args.processes > 1:
+            _run_processes(args, run_id=run_id)
+        else:
+            asyncio.run(_run(args))
@@ -0,0 +1,148 @@
+import asyncio
+import math
+from collections import deque
+from typing import Optional
+
+from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.model import BaseModel
+from livekit_voice_call_runner.telemetry.histogram import sample_percentile
+
+
+class AdaptiveConcurrencyStats(BaseModel):
+    limit: int
+    in_flight: int = 0
+    increases: int = 0
+    decreases: int = 0
+    lowest_limit: int
+    # of the last window a decision was made on
+    last_error_rate: Optional[float] = None
+    last_setup_latency_p90_seconds: Optional[float] = None
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limit that adapts to how the backends cope, AIMD-style.
+
+    The outcome of every finished task is recorded, and a decision is made once per `window_size` outcomes: while the
+    window's error rate and p90 setup latency stay within their targets, the limit grows by `increase_step`, up to
+    `max_limit`; when either is exceeded, it's multiplied by `decrease_factor`, down to `min_limit`. Lowering the
+    limit doesn't stop tasks in flight, it only holds new ones back until enough have finished.
+
+    Slots are handed out in FIFO order, like `asyncio.Semaphore`, which it stands in for.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        logger: CallLogger,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        window_size: int = 20,
+        max_error_rate: float = 0.05,
+        max_setup_latency_seconds: float = 5.0,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(f"Limits must satisfy 1 <= min <= max, got {min_limit} and {max_limit}")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"Decrease factor must be between 0 and 1, got {decrease_factor}")
+        self._max_limit = max_limit
+        self._min_limit = min_limit
+        self._logger = logger
+        self._window_size = window_size
+        self._max_error_rate = max_error_rate
+        self._max_setup_latency_seconds = max_setup_latency_seconds
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        limit = min(max(initial_limit if initial_limit is not None else max_limit, min_limit), max_limit)
+        self._stats = AdaptiveConcurrencyStats(limit=limit, lowest_limit=limit)
+        self._waiters: deque[asyncio.Future] = deque()
+        self._failures = 0
+        self._outcomes = 0
+        self._setup_latencies: list[float] = []
+
+    @property
+    def limit(self) -> int:
+        return self._stats.limit
+
+    @property
+    def max_limit(self) -> int:
+        return self._max_limit
+
+    def stats(self) -> AdaptiveConcurrencyStats:
+        return self._stats.model_copy()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._stats.in_flight < self._stats.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._stats.in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> None:
+        if self._stats.in_flight < self._stats.limit and not self._waiters:
+            self._stats.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # cancelled after being handed a slot: pass it on
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._stats.in_flight -= 1
+        self._wake_waiters()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *args) -> None:
+        self.release()
+
+    def record(self, failed: bool, setup_latency_seconds: Optional[float] = None) -> None:
+        self._outcomes += 1
+        if failed:
+            self._failures += 1
+        if setup_latency_seconds is not None:
+            self._setup_latencies.append(setup_latency_seconds)
+        if self._outcomes >= self._window_size:
+            self._decide()
+
+    def _decide(self) -> None:
+        error_rate = self._failures / self._outcomes
+        setup_latency_p90_seconds = sample_percentile(self._setup_latencies, 90)
+        self._failures = 0
+        self._outcomes = 0
+        self._setup_latencies.clear()
+
+        stats = self._stats
+        stats.last_error_rate = error_rate
+        stats.last_setup_latency_p90_seconds = setup_latency_p90_seconds
+        previous_limit = stats.limit
+        logger_extra = {
+            "error_rate": error_rate,
+            "setup_latency_p90_seconds": setup_latency_p90_seconds,
+            "previous_limit": previous_limit,
+        }
+        if error_rate > self._max_error_rate or (
+            setup_latency_p90_seconds is not None and setup_latency_p90_seconds > self._max_setup_latency_seconds
+        ):
+            stats.limit = max(math.floor(previous_limit * self._decrease_factor), self._min_limit)
+            stats.lowest_limit = min(stats.lowest_limit, stats.limit)
+            if stats.limit < previous_limit:
+                stats.decreases += 1
+                self._logger.warning("Decreased concurrency.", extra={**logger_extra, "limit": stats.limit})
+            return
+
+        stats.limit = min(previous_limit + self._increase_step, self._max_limit)
+        if stats.limit > previous_limit:
+            stats.increases += 1
+            self._logger.info("Increased concurrency.", extra={**logger_extra, "limit": stats.limit})
+            self._wake_waiters()
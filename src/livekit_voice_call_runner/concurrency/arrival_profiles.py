@@ -0,0 +1,99 @@
+import random
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Optional
+
+
+class ArrivalProfileType(str, Enum):
+    CONSTANT = "constant"
+    POISSON = "poisson"
+    STEP = "step"
+    RAMP = "ramp"
+
+
+class ArrivalProfile(ABC):
+    """
+    Open-loop arrival schedule, expressed as the gap to the next arrival.
+
+    `offset` is the *scheduled* time of the current arrival relative to the start of the run, so the schedule
+    never drifts when the system under test is slow.
+    """
+
+    @abstractmethod
+    def next_interval(self, offset: float) -> float: ...
+
+
+def _validate_rate(rate: float) -> float:
+    if rate <= 0:
+        raise ValueError(f"Arrival rate must be positive, got {rate}")
+    return rate
+
+
+class ConstantArrivalProfile(ArrivalProfile):
+    def __init__(self, rate: float):
+        self._interval = 1.0 / _validate_rate(rate)
+
+    def next_interval(self, offset: float) -> float:
+        return self._interval
+
+
+class PoissonArrivalProfile(ArrivalProfile):
+    def __init__(self, rate: float, rng: Optional[random.Random] = None):
+        self._rate = _validate_rate(rate)
+        self._rng = rng or random.Random()
+
+    def next_interval(self, offset: float) -> float:
+        return self._rng.expovariate(self._rate)
+
+
+class StepArrivalProfile(ArrivalProfile):
+    def __init__(self, rates: list[float], step_seconds: float):
+        if not rates:
+            raise ValueError("Step arrival profile requires at least one rate")
+        if step_seconds <= 0:
+            raise ValueError(f"Step duration must be positive, got {step_seconds}")
+        self._rates = [_validate_rate(rate) for rate in rates]
+        self._step_seconds = step_seconds
+
+    def next_interval(self, offset: float) -> float:
+        # the last step is held once the schedule runs past it
+        step = min(int(offset // self._step_seconds), len(self._rates) - 1)
+        return 1.0 / self._rates[step]
+
+
+class RampArrivalProfile(ArrivalProfile):
+    def __init__(self, start_rate: float, end_rate: float, ramp_seconds: float):
+        if ramp_seconds <= 0:
+            raise ValueError(f"Ramp duration must be positive, got {ramp_seconds}")
+        self._start_rate = _validate_rate(start_rate)
+        self._end_rate = _validate_rate(end_rate)
+        self._ramp_seconds = ramp_seconds
+
+    def next_interval(self, offset: float) -> float:
+        progress = min(offset / self._ramp_seconds, 1.0)
+        return 1.0 / (self._start_rate + (self._end_rate - self._start_rate) * progress)
+
+
+def create_arrival_profile(
+    profile_type: ArrivalProfileType,
+    rates: list[float],
+    interval_seconds: Optional[float] = None,
+) -> ArrivalProfile:
+    if not rates:
+        raise ValueError("At least one arrival rate is required")
+
+    match profile_type:
+        case ArrivalProfileType.CONSTANT:
+            return ConstantArrivalProfile(rate=rates[0])
+        case ArrivalProfileType.POISSON:
+            return PoissonArrivalProfile(rate=rates[0])
+        case ArrivalProfileType.STEP:
+            if interval_seconds is None:
+                raise ValueError("Step arrival profile requires an interval")
+            return StepArrivalProfile(rates=rates, step_seconds=interval_seconds)
+        case ArrivalProfileType.RAMP:
+            if len(rates) != 2 or interval_seconds is None:
+                raise ValueError("Ramp arrival profile requires a start rate, an end rate and an interval")
+            return RampArrivalProfile(start_rate=rates[0], end_rate=rates[1], ramp_seconds=interval_seconds)
+
+    raise ValueError(f"Unknown arrival profile: {profile_type}")
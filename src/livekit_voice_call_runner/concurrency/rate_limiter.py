@@ -0,0 +1,126 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+from livekit_voice_call_runner.model import BaseModel
+
+
+class TokenBucketStats(BaseModel):
+    acquired: int = 0
+    delayed: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record(self, wait_seconds: float, delayed: bool) -> None:
+        self.acquired += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        if delayed:
+            self.delayed += 1
+
+
+class TokenBucket:
+    """
+    Async token bucket: `burst` tokens refilled at `rate_per_second`.
+
+    Waiters are served in FIFO order, so a burst of callers is spread out evenly instead of racing for tokens.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate_per_second <= 0:
+            raise ValueError(f"Rate must be positive, got {rate_per_second}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst}")
+        self._rate_per_second = rate_per_second
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+        self.stats = TokenBucketStats()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate_per_second)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting for it if needed. Returns the time spent waiting, in seconds.
+        """
+        started_at = self._clock()
+        # waiting behind the lock counts as a delay too, even if a token is available once it is acquired
+        delayed = self._lock.locked()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delayed = True
+                await asyncio.sleep((1 - self._tokens) / self._rate_per_second)
+                self._refill()
+            self._tokens -= 1
+
+        wait_seconds = self._clock() - started_at
+        self.stats.record(wait_seconds=wait_seconds, delayed=delayed)
+        return wait_seconds
+
+
+class LiveKitRateLimiter:
+    """
+    Process-wide pacing of LiveKit API calls, shared by every call runner.
+
+    Room and SIP API calls have separate buckets, and each SIP trunk gets its own calls-per-second bucket on top of
+    the SIP API one. A bucket without a rate is unlimited.
+    """
+
+    def __init__(
+        self,
+        room_api: Optional[TokenBucket] = None,
+        sip_api: Optional[TokenBucket] = None,
+        sip_trunk_cps: Optional[float] = None,
+        sip_trunk_burst: int = 1,
+    ):
+        self._room_api = room_api
+        self._sip_api = sip_api
+        self._sip_trunk_cps = sip_trunk_cps
+        self._sip_trunk_burst = sip_trunk_burst
+        self._sip_trunks: dict[str, TokenBucket] = {}
+
+    async def acquire_room_api(self) -> float:
+        if not self._room_api:
+            return 0.0
+        return await self._room_api.acquire()
+
+    def _get_sip_trunk_bucket(self, sip_trunk_id: str) -> Optional[TokenBucket]:
+        if not self._sip_trunk_cps:
+            return None
+        if sip_trunk_id not in self._sip_trunks:
+            self._sip_trunks[sip_trunk_id] = TokenBucket(
+                rate_per_second=self._sip_trunk_cps,
+                burst=self._sip_trunk_burst,
+            )
+        return self._sip_trunks[sip_trunk_id]
+
+    async def acquire_sip_api(self, sip_trunk_id: str) -> float:
+        wait_seconds = 0.0
+        sip_trunk = self._get_sip_trunk_bucket(sip_trunk_id=sip_trunk_id)
+        if sip_trunk:
+            wait_seconds += await sip_trunk.acquire()
+        if self._sip_api:
+            wait_seconds += await self._sip_api.acquire()
+        return wait_seconds
+
+    def stats(self) -> dict[str, TokenBucketStats]:
+        stats = {}
+        if self._room_api:
+            stats["room_api"] = self._room_api.stats
+        if self._sip_api:
+            stats["sip_api"] = self._sip_api.stats
+        # also read by the metrics server's thread, while calls may add trunks
+        for sip_trunk_id, bucket in list(self._sip_trunks.items()):
+            stats[f"sip_trunk:{sip_trunk_id}"] = bucket.stats
+        return stats
@@ -1,21 +1,56 @@
 import asyncio
-from typing import Awaitable
+from typing import Awaitable, Iterable, Optional, Union
 
+from livekit_voice_call_runner.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from livekit_voice_call_runner.concurrency.arrival_profiles import ArrivalProfile
 from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.model import BaseModel
 
 Task = Awaitable[None]
 
 
+class OpenLoopReport(BaseModel):
+    """
+    How closely an open-loop run kept to its arrival schedule.
+
+    Lag is measured against the *scheduled* launch time, so time spent waiting for an in-flight slot is
+    reported instead of silently stretching the schedule (coordinated omission).
+    """
+
+    launched: int = 0
+    late: int = 0
+    max_lag_seconds: float = 0.0
+    total_lag_seconds: float = 0.0
+
+    @property
+    def mean_lag_seconds(self) -> float:
+        return self.total_lag_seconds / self.launched if self.launched else 0.0
+
+    def record_launch(self, lag_seconds: float, lag_tolerance_seconds: float) -> None:
+        self.launched += 1
+        self.total_lag_seconds += lag_seconds
+        self.max_lag_seconds = max(self.max_lag_seconds, lag_seconds)
+        if lag_seconds > lag_tolerance_seconds:
+            self.late += 1
+
+
 class ConcurrentTasksRunner:
     """
     Async task runner with concurrency control.
+
+    With an adaptive limiter, the concurrency passed to each method is only an upper bound: the limiter decides how
+    many tasks run at once, based on the outcomes recorded into it.
     """
 
-    def __init__(self, logger: CallLogger):
+    def __init__(self, logger: CallLogger, limiter: Optional[AdaptiveConcurrencyLimiter] = None):
         self._logger = logger
+        self._limiter = limiter
+
+    def _create_slots(self, concurrency: int) -> Union[asyncio.Semaphore, AdaptiveConcurrencyLimiter]:
+        return self._limiter if self._limiter else asyncio.Semaphore(concurrency)
 
     async def run(self, tasks: list[Task], concurrency: int) -> None:
-        semaphore = asyncio.Semaphore(concurrency)
+        semaphore = self._create_slots(concurrency)
 
         async def _run_with_semaphore(task: Task) -> None:
             async with semaphore:
@@ -28,3 +63,86 @@ class ConcurrentTasksRunner:
         )
 
         await asyncio.gather(*coroutines, return_exceptions=True)
+
+    async def run_stream(self, tasks: Iterable[Task], concurrency: int) -> None:
+        """
+        Run tasks through a fixed pool of workers, pulling the next task as soon as a worker is free.
+
+        Tasks are consumed lazily, so a generator can create them on demand.
+        """
+        iterator = iter(tasks)
+        # one worker per slot; with the fixed limit every worker always holds one
+        slots = self._create_slots(concurrency)
+
+        async def _worker() -> int:
+            count = 0
+            while True:
+                async with slots:
+                    # the iterator is shared by all workers; next() never awaits, so pulling is race-free
+                    task = next(iterator, None)
+                    if task is None:
+                        return count
+                    try:
+                        await task
+                    except Exception:
+                        self._logger.warning("Task failed.", exc_info=True)
+                count += 1
+
+        self._logger.info("Running streaming tasks.", extra={"concurrency": concurrency})
+
+        counts = await asyncio.gather(*[_worker() for _ in range(concurrency)])
+        self._logger.info("Successfully ran streaming tasks.", extra={"count": sum(counts)})
+
+    async def run_open_loop(
+        self,
+        tasks: Iterable[Task],
+        arrival_profile: ArrivalProfile,
+        max_in_flight: int,
+        lag_tolerance_seconds: float = 0.05,
+    ) -> OpenLoopReport:
+        """
+        Launch tasks at the rate given by the arrival profile, independently of how fast they complete.
+
+        `max_in_flight` is a safety valve: once reached, launches wait for a slot and are reported as late.
+        """
+        loop = asyncio.get_running_loop()
+        slots = self._create_slots(max_in_flight)
+        running: set[asyncio.Task] = set()
+        report = OpenLoopReport()
+
+        async def _run_and_release(task: Task) -> None:
+            try:
+                await task
+            except Exception:
+                self._logger.warning("Task failed.", exc_info=True)
+            finally:
+                slots.release()
+
+        self._logger.info("Running open-loop tasks.", extra={"max_in_flight": max_in_flight})
+
+        start = loop.time()
+        offset = 0.0
+        for task in tasks:
+            scheduled_at = start + offset
+            delay = scheduled_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()
+
+            report.record_launch(
+                lag_seconds=max(loop.time() - scheduled_at, 0.0),
+                lag_tolerance_seconds=lag_tolerance_seconds,
+            )
+            running_task = asyncio.create_task(_run_and_release(task=task))
+            running.add(running_task)
+            running_task.add_done_callback(running.discard)
+
+            offset += arrival_profile.next_interval(offset=offset)
+
+        await asyncio.gather(*running)
+
+        logger_extra = {**report.model_dump(), "mean_lag_seconds": report.mean_lag_seconds}
+        if report.late:
+            self._logger.warning("Open-loop generator fell behind its schedule.", extra=logger_extra)
+        self._logger.info("Successfully ran open-loop tasks.", extra=logger_extra)
+        return report
@@ -1,6 +1,7 @@
 import functools
 import os
-from typing import Any
+from enum import Enum
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -17,6 +18,13 @@ class ConfigCallSessionLLM(BaseModel):
     temperature: float
 
 
+class ConfigCallSessionLLMPrewarm(BaseModel):
+    # realtime websockets kept open ahead of demand, so a session start skips the handshake; 0 disables it
+    connections: int
+    # the server counts an open websocket as a session, so idle ones are replaced after this long
+    max_idle_seconds: float
+
+
 class ConfigCallSessionTurnDetection(BaseModel):
     type: str
     threshold: float
@@ -28,6 +36,7 @@ class ConfigCallSessionTurnDetection(BaseModel):
 
 class ConfigCallSession(BaseModel):
     llm: ConfigCallSessionLLM
+    llm_prewarm: ConfigCallSessionLLMPrewarm
     turn_detection: ConfigCallSessionTurnDetection
     user_away_timeout: float
     use_tts_aligned_transcript: bool
@@ -46,8 +55,75 @@ class ConfigLiveKit(BaseModel):
     room_name_prefix: str
 
 
+class ConfigLiveKitHttp(BaseModel):
+    # connections to the LiveKit API open at once; unset sizes the pool from the run's concurrency
+    pool_size: Optional[int]
+    # idle connections are kept open this long for the next request
+    keepalive_seconds: float
+    timeout_seconds: float
+
+
+class ConfigRateLimit(BaseModel):
+    rate_per_second: Optional[float]
+    burst: int
+
+
+class ConfigRateLimits(BaseModel):
+    room_api: ConfigRateLimit
+    sip_api: ConfigRateLimit
+
+
+class LogMode(str, Enum):
+    # each logger writes on the calling thread
+    SYNC = "sync"
+    # loggers enqueue records; a background thread formats and writes them in batches
+    QUEUE = "queue"
+
+
+class LogOverflowPolicy(str, Enum):
+    DROP_NEWEST = "drop-newest"
+    DROP_OLDEST = "drop-oldest"
+    # wait for room in the queue, up to a timeout, then drop
+    BLOCK = "block"
+
+
+class LogLevel(str, Enum):
+    DEBUG = "DEBUG"
+    INFO = "INFO"
+    WARNING = "WARNING"
+    ERROR = "ERROR"
+
+
+class ConfigTranscript(BaseModel):
+    # level of the transcript lines in the main log, e.g. DEBUG to keep them out of an INFO log
+    level: LogLevel = LogLevel.INFO
+    # share of calls whose transcript lines are logged; the choice is made once per call
+    sample_rate: float = 1.0
+    # longer messages are cut in the main log; unset logs them whole
+    max_chars: Optional[int] = None
+    # when set, full transcripts go to one JSONL file per call in this directory instead of the main log
+    directory: Optional[str] = None
+
+
+class ConfigLogging(BaseModel):
+    level: LogLevel
+    mode: LogMode
+    queue_size: int
+    overflow_policy: LogOverflowPolicy
+    transcript: ConfigTranscript
+
+
+class ConfigEventLoopMonitor(BaseModel):
+    # how often the event loop's scheduling lag is sampled; 0 disables the monitor
+    interval_seconds: float
+    # stalls at least this long are logged, with the task and stack that held the loop
+    slow_callback_seconds: float
+
+
 class Config(BaseModel):
     livekit_api: ConfigLiveKit
+    livekit_http: ConfigLiveKitHttp
+    rate_limits: ConfigRateLimits
     call_session: ConfigCallSession
     room_connector: ConfigRoomConnector
 
@@ -59,6 +135,23 @@ def get_env_or_raise(key: str) -> Any:
     return value
 
 
+def get_env_or_default(key: str, default: Any) -> Any:
+    value = os.environ.get(key)
+    if not value:
+        return default
+    return value
+
+
+def get_optional_float(key: str) -> Optional[float]:
+    value = get_env_or_default(key, None)
+    return float(value) if value is not None else None
+
+
+def get_optional_int(key: str) -> Optional[int]:
+    value = get_env_or_default(key, None)
+    return int(value) if value is not None else None
+
+
 def _get_bool(value: str) -> bool:
     return value.lower() in ["true", "1"]
 
@@ -72,6 +165,21 @@ def get_config() -> Config:
             api_secret=get_env_or_raise("LIVEKIT_API_SECRET"),
             room_name_prefix=get_env_or_raise("LIVEKIT_ROOM_NAME_PREFIX"),
         ),
+        livekit_http=ConfigLiveKitHttp(
+            pool_size=get_optional_int("LIVEKIT_API_HTTP_POOL_SIZE"),
+            keepalive_seconds=float(get_env_or_default("LIVEKIT_API_HTTP_KEEPALIVE_SECONDS", 30.0)),
+            timeout_seconds=float(get_env_or_default("LIVEKIT_API_HTTP_TIMEOUT_SECONDS", 10.0)),
+        ),
+        rate_limits=ConfigRateLimits(
+            room_api=ConfigRateLimit(
+                rate_per_second=get_optional_float("LIVEKIT_ROOM_API_RATE_LIMIT_PER_SECOND"),
+                burst=int(get_env_or_default("LIVEKIT_ROOM_API_RATE_LIMIT_BURST", 1)),
+            ),
+            sip_api=ConfigRateLimit(
+                rate_per_second=get_optional_float("LIVEKIT_SIP_API_RATE_LIMIT_PER_SECOND"),
+                burst=int(get_env_or_default("LIVEKIT_SIP_API_RATE_LIMIT_BURST", 1)),
+            ),
+        ),
         call_session=ConfigCallSession(
             llm=ConfigCallSessionLLM(
                 azure_deployment=get_env_or_raise("CALL_SESSION_LLM_AZURE_DEPLOYMENT"),
@@ -81,6 +189,10 @@ def get_config() -> Config:
                 voice=get_env_or_raise("CALL_SESSION_LLM_VOICE"),
                 temperature=float(get_env_or_raise("CALL_SESSION_LLM_TEMPERATURE")),
             ),
+            llm_prewarm=ConfigCallSessionLLMPrewarm(
+                connections=int(get_env_or_default("CALL_SESSION_LLM_PREWARM_CONNECTIONS", 0)),
+                max_idle_seconds=float(get_env_or_default("CALL_SESSION_LLM_PREWARM_MAX_IDLE_SECONDS", 60.0)),
+            ),
             turn_detection=ConfigCallSessionTurnDetection(
                 type=get_env_or_raise("CALL_SESSION_LLM_TURN_DETECTION_TYPE"),
                 threshold=float(get_env_or_raise("CALL_SESSION_LLM_TURN_DETECTION_THRESHOLD")),
@@ -110,3 +222,29 @@ def get_config() -> Config:
             participant_identity=get_env_or_raise("CALL_ROOM_PARTICIPANT_IDENTITY"),
         ),
     )
+
+
+@functools.lru_cache(maxsize=1)
+def get_logging_config() -> ConfigLogging:
+    return ConfigLogging(
+        level=LogLevel(get_env_or_default("LOG_LEVEL", LogLevel.INFO.value).upper()),
+        mode=LogMode(get_env_or_default("LOG_MODE", LogMode.SYNC.value)),
+        queue_size=int(get_env_or_default("LOG_QUEUE_SIZE", 10_000)),
+        overflow_policy=LogOverflowPolicy(
+            get_env_or_default("LOG_QUEUE_OVERFLOW_POLICY", LogOverflowPolicy.DROP_NEWEST.value)
+        ),
+        transcript=ConfigTranscript(
+            level=LogLevel(get_env_or_default("TRANSCRIPT_LOG_LEVEL", LogLevel.INFO.value).upper()),
+            sample_rate=float(get_env_or_default("TRANSCRIPT_LOG_SAMPLE_RATE", 1.0)),
+            max_chars=get_optional_int("TRANSCRIPT_LOG_MAX_CHARS"),
+            directory=get_env_or_default("TRANSCRIPT_DIR", None),
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_event_loop_monitor_config() -> ConfigEventLoopMonitor:
+    return ConfigEventLoopMonitor(
+        interval_seconds=float(get_env_or_default("EVENT_LOOP_MONITOR_INTERVAL_SECONDS", 0.05)),
+        slow_callback_seconds=float(get_env_or_default("EVENT_LOOP_SLOW_CALLBACK_SECONDS", 0.1)),
+    )
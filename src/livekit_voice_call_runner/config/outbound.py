@@ -1,19 +1,44 @@
 import functools
+from typing import Optional
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
-from livekit_voice_call_runner.config.base import get_env_or_raise
+from livekit_voice_call_runner.config.base import (
+    ConfigRateLimit,
+    get_env_or_default,
+    get_env_or_raise,
+    get_optional_float,
+    get_optional_int,
+)
 
 load_dotenv()
 
 
+class ConfigAdaptiveConcurrency(BaseModel):
+    min_limit: int
+    # None starts at --concurrency
+    initial_limit: Optional[int]
+    window_size: int
+    max_error_rate: float
+    max_setup_latency_seconds: float
+    increase_step: int
+    decrease_factor: float
+
+
 class OutboundConfig(BaseModel):
     sip_trunk_id: str
     phone_number_from: str
     participant_identity: str
     ringing_timeout: int
     max_call_duration: int
+    sip_trunk_rate_limit: ConfigRateLimit
+    adaptive_concurrency: ConfigAdaptiveConcurrency
+    # each step of a call's teardown (session close, room disconnect, dialer), and each room deletion, is given up on
+    # after this long
+    shutdown_step_timeout_seconds: float = 10.0
+    # rooms of ended calls deleted at once
+    room_cleanup_batch_size: int = 50
 
 
 @functools.lru_cache(maxsize=1)
@@ -24,4 +49,21 @@ def get_config() -> OutboundConfig:
         participant_identity=get_env_or_raise("CALL_OUTBOUND_PARTICIPANT_IDENTITY"),
         ringing_timeout=int(get_env_or_raise("CALL_OUTBOUND_RINGING_TIMEOUT")),
         max_call_duration=int(get_env_or_raise("CALL_OUTBOUND_MAX_CALL_DURATION")),
+        sip_trunk_rate_limit=ConfigRateLimit(
+            rate_per_second=get_optional_float("CALL_OUTBOUND_SIP_TRUNK_CPS"),
+            burst=int(get_env_or_default("CALL_OUTBOUND_SIP_TRUNK_CPS_BURST", 1)),
+        ),
+        adaptive_concurrency=ConfigAdaptiveConcurrency(
+            min_limit=int(get_env_or_default("CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_MIN", 1)),
+            initial_limit=get_optional_int("CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_INITIAL"),
+            window_size=int(get_env_or_default("CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_WINDOW", 20)),
+            max_error_rate=float(get_env_or_default("CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_MAX_ERROR_RATE", 0.05)),
+            max_setup_latency_seconds=float(
+                get_env_or_default("CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_MAX_SETUP_LATENCY_SECONDS", 5.0)
+            ),
+            increase_step=int(get_env_or_default("CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_INCREASE_STEP", 1)),
+            decrease_factor=float(get_env_or_default("CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_DECREASE_FACTOR", 0.5)),
+        ),
+        shutdown_step_timeout_seconds=float(get_env_or_default("CALL_OUTBOUND_SHUTDOWN_STEP_TIMEOUT_SECONDS", 10.0)),
+        room_cleanup_batch_size=int(get_env_or_default("CALL_OUTBOUND_ROOM_CLEANUP_BATCH_SIZE", 50)),
     )
@@ -1,19 +1,134 @@
 import asyncio
-from typing import Any
+import logging
+import random
+from typing import Any, Optional
 
 from livekit import rtc
-from livekit.agents import AgentSession, ChatMessage, ConversationItemAddedEvent, ErrorEvent
-
+from livekit.agents import (
+    AgentSession,
+    AgentStateChangedEvent,
+    ChatMessage,
+    ConversationItemAddedEvent,
+    ErrorEvent,
+    MetricsCollectedEvent,
+    UserStateChangedEvent,
+)
+from livekit.agents.metrics import RealtimeModelMetrics
+
+from livekit_voice_call_runner.config.base import ConfigTranscript
 from livekit_voice_call_runner.core.call_agent import CallAgent
+from livekit_voice_call_runner.core.call_transcript_sink import CallTranscriptSink
 from livekit_voice_call_runner.core.ishutdown import ShutdownEvent
 from livekit_voice_call_runner.livekit import disconnect_reason_mapper
 from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.model import BaseModel
+from livekit_voice_call_runner.telemetry.histogram import sample_percentile
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
+
+
+class ConversationStats(BaseModel):
+    turn_latency_p50_seconds: Optional[float] = None
+    turn_latency_p90_seconds: Optional[float] = None
+    ttft_p50_seconds: Optional[float] = None
+    ttft_p90_seconds: Optional[float] = None
+    interruptions: int = 0
+    overlap_seconds: float = 0.0
 
 
 class CallEventListener:
-    def __init__(self, logger: CallLogger):
+    def __init__(
+        self,
+        call_trace: CallTrace,
+        logger: CallLogger,
+        transcript_cfg: Optional[ConfigTranscript] = None,
+        transcript_sink: Optional[CallTranscriptSink] = None,
+    ):
+        self._call_trace = call_trace
         self._logger = logger
+        transcript_cfg = transcript_cfg or ConfigTranscript()
+        self._transcript_level = logging.getLevelName(transcript_cfg.level.value)
+        self._transcript_max_chars = transcript_cfg.max_chars
+        # sampled per call, so a logged call has its whole transcript
+        self._transcript_sampled = random.random() < transcript_cfg.sample_rate
+        self._transcript_sink = transcript_sink
         self._shutdown = ShutdownEvent()
+        self._turn_count = 0
+        self._turn_latencies_seconds: list[float] = []
+        self._user_stopped_speaking_at: Optional[float] = None
+        self._ttft_seconds: list[float] = []
+        self._interruptions = 0
+        self._overlap_seconds = 0.0
+        self._user_state = "listening"
+        self._agent_state = "initializing"
+        self._both_speaking_since: Optional[float] = None
+
+    @property
+    def turn_count(self) -> int:
+        """
+        Number of chat messages added to the conversation so far.
+        """
+        return self._turn_count
+
+    @property
+    def turn_latencies_seconds(self) -> list[float]:
+        """
+        Time from the user stopping speaking to the agent starting to speak, for each agent response.
+        """
+        return self._turn_latencies_seconds
+
+    @property
+    def ttft_seconds(self) -> list[float]:
+        """
+        Time from the realtime model creating a response to its first audio, for each response that had audio.
+        """
+        return self._ttft_seconds
+
+    @property
+    def interruptions(self) -> int:
+        """
+        Number of times the user started speaking while the agent was speaking.
+        """
+        return self._interruptions
+
+    @property
+    def overlap_seconds(self) -> float:
+        """
+        Total time the user and the agent were speaking at once.
+        """
+        return self._overlap_seconds
+
+    def conversation_stats(self) -> ConversationStats:
+        return ConversationStats(
+            turn_latency_p50_seconds=sample_percentile(self._turn_latencies_seconds, 50),
+            turn_latency_p90_seconds=sample_percentile(self._turn_latencies_seconds, 90),
+            ttft_p50_seconds=sample_percentile(self._ttft_seconds, 50),
+            ttft_p90_seconds=sample_percentile(self._ttft_seconds, 90),
+            interruptions=self._interruptions,
+            overlap_seconds=self._overlap_seconds,
+        )
+
+    def _update_overlap(self, at: float) -> None:
+        both_speaking = self._user_state == "speaking" and self._agent_state == "speaking"
+        if both_speaking and self._both_speaking_since is None:
+            self._both_speaking_since = at
+        elif not both_speaking and self._both_speaking_since is not None:
+            self._overlap_seconds += at - self._both_speaking_since
+            self._both_speaking_since = None
+
+    def _record_transcript(self, message: ChatMessage) -> None:
+        text = message.text_content or ""
+        if self._transcript_sink:
+            self._transcript_sink.write(
+                correlation_id=self._call_trace.correlation_id,
+                line={"created_at": message.created_at, "role": message.role, "text": text},
+            )
+            return
+
+        if not self._transcript_sampled or not self._logger.isEnabledFor(self._transcript_level):
+            return
+        if self._transcript_max_chars is not None and len(text) > self._transcript_max_chars:
+            text = f"{text[:self._transcript_max_chars]}... ({len(text) - self._transcript_max_chars} more chars)"
+        self._logger.log(self._transcript_level, "[%s] %s", message.role, text)
 
     async def wait_for_shutdown(self) -> dict[str, Any]:
         return await self._shutdown.do_wait()
@@ -32,6 +147,8 @@ class CallEventListener:
         def _on_participant_disconnected(participant: rtc.RemoteParticipant):
             name = "Participant disconnected"
             context = {"participant_identity": participant.identity}
+            if participant.disconnect_reason is not None:
+                context["reason"] = disconnect_reason_mapper.map_to_name(reason=participant.disconnect_reason)
             reason = {"name": name, "context": context}
             if not self._shutdown.is_set():
                 self._shutdown.do_set(reason=reason)
@@ -64,9 +181,41 @@ class CallEventListener:
         @session.on("conversation_item_added")
         def _on_conversation_item_added(event: ConversationItemAddedEvent):
             if isinstance(event.item, ChatMessage):
-                self._logger.info(f"[{event.item.role}] {event.item.text_content}")
+                self._turn_count += 1
+                self._record_transcript(event.item)
                 asyncio.create_task(agent.on_chat_message_added(event.item))
 
+        @session.on("user_state_changed")
+        def _on_user_state_changed(event: UserStateChangedEvent):
+            if event.old_state == "speaking" and event.new_state == "listening":
+                self._user_stopped_speaking_at = event.created_at
+            if event.new_state == "speaking" and self._agent_state == "speaking":
+                self._interruptions += 1
+            self._user_state = event.new_state
+            self._update_overlap(at=event.created_at)
+
+        @session.on("agent_state_changed")
+        def _on_agent_state_changed(event: AgentStateChangedEvent):
+            if event.new_state == "speaking" and self._user_stopped_speaking_at is not None:
+                self._turn_latencies_seconds.append(event.created_at - self._user_stopped_speaking_at)
+                self._user_stopped_speaking_at = None
+            self._agent_state = event.new_state
+            self._update_overlap(at=event.created_at)
+
+            # only the first utterance once the call has been answered counts; inbound calls are answered on join
+            if (
+                event.new_state == "speaking"
+                and self._call_trace.has("answered")
+                and not self._call_trace.has("first_agent_utterance")
+            ):
+                self._call_trace.mark("first_agent_utterance")
+
+        @session.on("metrics_collected")
+        def _on_metrics_collected(event: MetricsCollectedEvent):
+            # -1 when the response was cancelled before any audio
+            if isinstance(event.metrics, RealtimeModelMetrics) and event.metrics.ttft >= 0:
+                self._ttft_seconds.append(event.metrics.ttft)
+
         @session.on("error")
         def _on_error(event: ErrorEvent):
             name = "Unexpected error in session"
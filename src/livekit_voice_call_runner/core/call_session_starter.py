@@ -3,12 +3,13 @@ import time
 from typing import Optional
 
 from livekit import rtc
-from livekit.agents import NOT_GIVEN, AgentSession, NotGivenOr
+from livekit.agents import NOT_GIVEN, AgentSession, AgentStateChangedEvent, NotGivenOr
 from livekit.agents.voice import room_io
 
 from livekit_voice_call_runner.core.call_agent import CallAgent
 from livekit_voice_call_runner.logger import CallLogger
 from livekit_voice_call_runner.model import CallSessionStarterConfigRealtime
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
 
 _READY_AGENT_STATES = ["idle", "listening", "thinking", "speaking"]
 
@@ -18,12 +19,15 @@ class CallSessionStarter:
         self,
         config: CallSessionStarterConfigRealtime,
         agent_ready_timeout_seconds: float,
+        call_trace: CallTrace,
         logger: CallLogger,
     ):
         self._config = config
         self._agent_ready_timeout_seconds = agent_ready_timeout_seconds
+        self._call_trace = call_trace
         self._logger = logger
         self._session: Optional[AgentSession] = None
+        self._time_to_ready_seconds: Optional[float] = None
 
     @property
     def session(self) -> AgentSession:
@@ -31,31 +35,32 @@ class CallSessionStarter:
             raise RuntimeError("Session not started")
         return self._session
 
+    @property
+    def time_to_ready_seconds(self) -> Optional[float]:
+        """
+        Seconds from starting the session until the agent was ready, once it is.
+        """
+        return self._time_to_ready_seconds
+
     def _create_session(self) -> AgentSession:
         return AgentSession(
-            llm=self._config.llm,
+            llm=self._config.llm if self._config.llm is not None else NOT_GIVEN,
             user_away_timeout=self._config.user_away_timeout,
             use_tts_aligned_transcript=self._config.use_tts_aligned_transcript,
             preemptive_generation=self._config.preemptive_generation,
         )
 
-    async def _wait_for_agent_ready(self, session: AgentSession, timeout_seconds: float) -> None:
+    async def _wait_for_agent_ready(self, session: AgentSession, ready: asyncio.Event, timeout_seconds: float) -> None:
         logger_extra = {"timeout_seconds": timeout_seconds}
 
-        timed_out = False
-        start_time = time.time()
-        while session.agent_state not in _READY_AGENT_STATES and not timed_out:
-            self._logger.info(
-                "Agent not ready yet.",
-                extra={**logger_extra, "agent_state": session.agent_state},
-            )
-            elapsed_time = time.time() - start_time
-            timed_out = elapsed_time > timeout_seconds
-            await asyncio.sleep(1.0)
-
-        if timed_out:
+        if session.agent_state in _READY_AGENT_STATES:
+            ready.set()
+
+        try:
+            await asyncio.wait_for(ready.wait(), timeout=timeout_seconds)
+        except TimeoutError:
             error_message = "Agent failed to start within timeout."
-            self._logger.error(error_message, extra=logger_extra)
+            self._logger.error(error_message, extra={**logger_extra, "agent_state": session.agent_state})
             raise RuntimeError(error_message)
 
     async def start_session(
@@ -68,18 +73,38 @@ class CallSessionStarter:
         logger_extra = {"room_name": call_room.name}
         self._logger.info("Starting call session.", extra=logger_extra)
         self._session = self._create_session()
-        await self._session.start(
-            room=call_room,
-            agent=call_agent,
-            room_input_options=room_input_options,
-            room_output_options=room_output_options,
-        )
 
-        await self._wait_for_agent_ready(
-            session=self._session,
-            timeout_seconds=self._agent_ready_timeout_seconds,
+        # subscribe before starting, so a transition during start is not missed
+        ready = asyncio.Event()
+
+        def _on_agent_state_changed(event: AgentStateChangedEvent) -> None:
+            if event.new_state in _READY_AGENT_STATES:
+                ready.set()
+
+        self._session.on("agent_state_changed", _on_agent_state_changed)
+        started_at = time.monotonic()
+        try:
+            with self._call_trace.span("start_session"):
+                await self._session.start(
+                    room=call_room,
+                    agent=call_agent,
+                    room_input_options=room_input_options,
+                    room_output_options=room_output_options,
+                )
+            with self._call_trace.span("wait_for_agent_ready"):
+                await self._wait_for_agent_ready(
+                    session=self._session,
+                    ready=ready,
+                    timeout_seconds=self._agent_ready_timeout_seconds,
+                )
+        finally:
+            self._session.off("agent_state_changed", _on_agent_state_changed)
+
+        self._time_to_ready_seconds = time.monotonic() - started_at
+        self._logger.info(
+            "Successfully started call session.",
+            extra={**logger_extra, "time_to_ready_seconds": self._time_to_ready_seconds},
         )
-        self._logger.info("Successfully started call session.", extra=logger_extra)
 
     async def shutdown(self) -> None:
         self._logger.info("Shutting down.")
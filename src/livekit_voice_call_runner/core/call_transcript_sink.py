@@ -0,0 +1,94 @@
+import asyncio
+import json
+import os
+from collections import defaultdict
+from typing import Any, Optional
+
+from livekit_voice_call_runner.core.ishutdown import IShutdown
+from livekit_voice_call_runner.logger import CallLogger
+
+
+class CallTranscriptSink(IShutdown):
+    """
+    Appends full transcripts to one JSONL file per call, `<directory>/<correlation id>.jsonl`, one line per message.
+
+    `write` is called from session callbacks, so it only enqueues. Lines are grouped by call and appended in batches
+    from a worker thread. The queue is bounded: when it is full, lines are dropped and counted rather than stalling the
+    event loop.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        logger: CallLogger,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 1.0,
+        max_queue_size: int = 100_000,
+    ):
+        self._directory = directory
+        self._logger = logger
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._queue: asyncio.Queue[Optional[tuple[str, dict[str, Any]]]] = asyncio.Queue(maxsize=max_queue_size)
+        self._worker: Optional[asyncio.Task] = None
+        self._written = 0
+        self._dropped = 0
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def start(self) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+        self._worker = asyncio.create_task(self._write_forever())
+
+    def write(self, correlation_id: str, line: dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait((correlation_id, line))
+        except asyncio.QueueFull:
+            self._dropped += 1
+
+    async def _next_batch(self) -> tuple[list[tuple[str, dict[str, Any]]], bool]:
+        batch: list[tuple[str, dict[str, Any]]] = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval_seconds
+        while len(batch) < self._batch_size:
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=max(deadline - loop.time(), 0))
+            except TimeoutError:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _append(self, batch: list[tuple[str, dict[str, Any]]]) -> None:
+        lines_by_call: dict[str, list[str]] = defaultdict(list)
+        for correlation_id, line in batch:
+            lines_by_call[correlation_id].append(json.dumps(line, default=str))
+        for correlation_id, lines in lines_by_call.items():
+            with open(os.path.join(self._directory, f"{correlation_id}.jsonl"), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+    async def _write_forever(self) -> None:
+        stopped = False
+        while not stopped:
+            batch, stopped = await self._next_batch()
+            if not batch:
+                continue
+            try:
+                await asyncio.to_thread(self._append, batch)
+                self._written += len(batch)
+            except Exception as e:
+                self._logger.error("Failed to write transcripts.", extra={"count": len(batch), "error": str(e)})
+
+    async def shutdown(self) -> None:
+        self._logger.info("Shutting down.")
+        if self._worker:
+            await self._queue.put(None)
+            await self._worker
+        self._logger.info("Successfully shut down.", extra={"written": self._written, "dropped": self._dropped})
@@ -1,79 +1,226 @@
+from typing import Callable, Optional
+
 from livekit import api
-from livekit.plugins import openai
-from openai.types.beta.realtime.session import TurnDetection
 
-from livekit_voice_call_runner.config.base import Config
+from livekit_voice_call_runner.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter, TokenBucket
+from livekit_voice_call_runner.config.base import Config, ConfigRateLimit, get_logging_config
 from livekit_voice_call_runner.config.outbound import OutboundConfig
 from livekit_voice_call_runner.core.call_agent import CallAgent
 from livekit_voice_call_runner.core.call_event_listener import CallEventListener
 from livekit_voice_call_runner.core.call_session_starter import CallSessionStarter
+from livekit_voice_call_runner.core.call_transcript_sink import CallTranscriptSink
+from livekit_voice_call_runner.livekit.pooled_api import PooledLiveKitAPI
+from livekit_voice_call_runner.livekit.realtime_model_provider import get_realtime_model_provider
+from livekit_voice_call_runner.log_pipeline import get_log_pipeline
 from livekit_voice_call_runner.logger import CallLogger, create_logger
 from livekit_voice_call_runner.model import CallSessionStarterConfigRealtime
 from livekit_voice_call_runner.outbound.call_dialer import OutboundCallDialer
+from livekit_voice_call_runner.outbound.call_record_sink import (
+    CallRecordFormat,
+    CallRecordSink,
+    create_call_record_writer,
+)
 from livekit_voice_call_runner.outbound.call_room_connector import OutboundCallRoomConnector
 from livekit_voice_call_runner.outbound.call_runner import (
     OutboundCallRunner,
     OutboundCallRunnerConfig,
     OutboundCallRunnerProps,
 )
+from livekit_voice_call_runner.outbound.campaign_queue import CampaignCallQueue, CampaignStore
+from livekit_voice_call_runner.outbound.room_cleanup_queue import RoomCleanupQueue
+from livekit_voice_call_runner.telemetry.loop_monitor import EventLoopMonitor
+from livekit_voice_call_runner.telemetry.metrics import MetricsServer, RunStatsCollector
+from livekit_voice_call_runner.telemetry.profiler import ProfileMode, RunProfiler, get_profile_path
+from livekit_voice_call_runner.telemetry.tracing import (
+    CallTrace,
+    CallTracer,
+    JsonlSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporter,
+)
 
 
-def _create_call_session_starter(logger: CallLogger, cfg: Config) -> CallSessionStarter:
+def _create_call_session_starter(logger: CallLogger, cfg: Config, call_trace: CallTrace) -> CallSessionStarter:
     return CallSessionStarter(
         config=CallSessionStarterConfigRealtime(
-            llm=openai.realtime.RealtimeModel.with_azure(
-                azure_deployment=cfg.call_session.llm.azure_deployment,
-                api_version=cfg.call_session.llm.api_version,
-                api_key=cfg.call_session.llm.api_key,
-                azure_endpoint=cfg.call_session.llm.azure_endpoint,
-                voice=cfg.call_session.llm.voice,
-                temperature=cfg.call_session.llm.temperature,
-                turn_detection=TurnDetection(
-                    type=cfg.call_session.turn_detection.type,  # type: ignore
-                    threshold=cfg.call_session.turn_detection.threshold,
-                    prefix_padding_ms=cfg.call_session.turn_detection.prefix_padding_ms,
-                    silence_duration_ms=cfg.call_session.turn_detection.silence_duration_ms,
-                    create_response=cfg.call_session.turn_detection.create_response,
-                    interrupt_response=cfg.call_session.turn_detection.interrupt_response,
-                ),
-            ),
+            # shared by every call of the process, each session opens its own connection from it
+            llm=get_realtime_model_provider().get_model(cfg=cfg.call_session),
             user_away_timeout=cfg.call_session.user_away_timeout,
             use_tts_aligned_transcript=cfg.call_session.use_tts_aligned_transcript,
             preemptive_generation=cfg.call_session.preemptive_generation,
         ),
         agent_ready_timeout_seconds=cfg.call_session.agent_ready_timeout_seconds,
+        call_trace=call_trace,
         logger=logger,
     )
 
 
-def create_call_agent(instructions: str, correlation_id: str) -> CallAgent:
+def create_call_agent(instructions: str) -> CallAgent:
     return CallAgent(
         instructions=instructions,
-        logger=create_logger(name=CallAgent.__name__, correlation_id=correlation_id),
+        logger=create_logger(name=CallAgent.__name__),
     )
 
 
-def create_call_session_starter(correlation_id: str, cfg: Config) -> CallSessionStarter:
+def create_call_session_starter(cfg: Config, call_trace: CallTrace) -> CallSessionStarter:
     return _create_call_session_starter(
-        logger=create_logger(name=CallSessionStarter.__name__, correlation_id=correlation_id),
+        logger=create_logger(name=CallSessionStarter.__name__),
         cfg=cfg,
+        call_trace=call_trace,
     )
 
 
-def create_call_event_listener(correlation_id: str) -> CallEventListener:
+def create_call_event_listener(
+    call_trace: CallTrace, transcript_sink: Optional[CallTranscriptSink] = None
+) -> CallEventListener:
     return CallEventListener(
-        logger=create_logger(name=CallEventListener.__name__, correlation_id=correlation_id)
+        call_trace=call_trace,
+        logger=create_logger(name=CallEventListener.__name__),
+        transcript_cfg=get_logging_config().transcript,
+        transcript_sink=transcript_sink,
     )
 
 
-def create_livekit_api(cfg: Config) -> api.LiveKitAPI:
-    return api.LiveKitAPI(
+def create_livekit_api(cfg: Config, max_concurrent_calls: int) -> api.LiveKitAPI:
+    # a call has at most one API request in flight, e.g. the dial while it rings, so by default every call gets a
+    # connection and none waits for another call's request to finish
+    return PooledLiveKitAPI(
         url=cfg.livekit_api.url,
         api_key=cfg.livekit_api.api_key,
         api_secret=cfg.livekit_api.api_secret,
+        pool_size=cfg.livekit_http.pool_size or max_concurrent_calls,
+        keepalive_seconds=cfg.livekit_http.keepalive_seconds,
+        timeout_seconds=cfg.livekit_http.timeout_seconds,
+    )
+
+
+def _share_rate_limit(cfg: ConfigRateLimit, share: float) -> ConfigRateLimit:
+    if not cfg.rate_per_second:
+        return cfg
+    return ConfigRateLimit(rate_per_second=cfg.rate_per_second * share, burst=max(round(cfg.burst * share), 1))
+
+
+def _create_token_bucket(cfg: ConfigRateLimit) -> Optional[TokenBucket]:
+    if not cfg.rate_per_second:
+        return None
+    return TokenBucket(rate_per_second=cfg.rate_per_second, burst=cfg.burst)
+
+
+def create_livekit_rate_limiter(cfg: Config, outbound_cfg: OutboundConfig, share: float = 1.0) -> LiveKitRateLimiter:
+    """
+    `share` scales the configured limits down for one of several processes that split them.
+    """
+    sip_trunk_rate_limit = _share_rate_limit(cfg=outbound_cfg.sip_trunk_rate_limit, share=share)
+    return LiveKitRateLimiter(
+        room_api=_create_token_bucket(cfg=_share_rate_limit(cfg=cfg.rate_limits.room_api, share=share)),
+        sip_api=_create_token_bucket(cfg=_share_rate_limit(cfg=cfg.rate_limits.sip_api, share=share)),
+        sip_trunk_cps=sip_trunk_rate_limit.rate_per_second,
+        sip_trunk_burst=sip_trunk_rate_limit.burst,
+    )
+
+
+def create_adaptive_concurrency_limiter(
+    outbound_cfg: OutboundConfig, max_limit: int, share: float = 1.0
+) -> AdaptiveConcurrencyLimiter:
+    cfg = outbound_cfg.adaptive_concurrency
+    # `max_limit` is already the process's share of --concurrency; the configured limits are scaled to match
+    return AdaptiveConcurrencyLimiter(
+        max_limit=max_limit,
+        logger=create_logger(name=AdaptiveConcurrencyLimiter.__name__),
+        min_limit=min(max(round(cfg.min_limit * share), 1), max_limit),
+        initial_limit=round(cfg.initial_limit * share) if cfg.initial_limit is not None else None,
+        window_size=cfg.window_size,
+        max_error_rate=cfg.max_error_rate,
+        max_setup_latency_seconds=cfg.max_setup_latency_seconds,
+        increase_step=cfg.increase_step,
+        decrease_factor=cfg.decrease_factor,
+    )
+
+
+def create_call_tracer(trace_path: Optional[str], otlp_endpoint: Optional[str]) -> CallTracer:
+    logger = create_logger(name=CallTracer.__name__)
+    exporters: list[SpanExporter] = []
+    if trace_path:
+        exporters.append(JsonlSpanExporter(path=trace_path))
+    if otlp_endpoint:
+        exporters.append(
+            OtlpHttpSpanExporter(
+                endpoint=otlp_endpoint,
+                on_error=lambda e: logger.warning("Failed to export traces.", extra={"error": str(e)}),
+            )
+        )
+    return CallTracer(exporters=exporters)
+
+
+def create_metrics_server(
+    port: int,
+    rate_limiter: LiveKitRateLimiter,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    event_loop_monitor: Optional[EventLoopMonitor] = None,
+) -> MetricsServer:
+    return MetricsServer(
+        port=port,
+        collectors=[
+            RunStatsCollector(
+                rate_limiter=rate_limiter,
+                concurrency_limiter=concurrency_limiter,
+                log_pipeline=get_log_pipeline(),
+                event_loop_monitor=event_loop_monitor,
+            )
+        ],
     )
 
 
+def create_run_profiler(mode: Optional[ProfileMode], path: str) -> Optional[RunProfiler]:
+    if mode is None:
+        return None
+    return RunProfiler(
+        mode=mode,
+        path=get_profile_path(path=path, mode=mode),
+        logger=create_logger(name=RunProfiler.__name__),
+    )
+
+
+def create_call_record_sink(path: Optional[str], record_format: CallRecordFormat) -> Optional[CallRecordSink]:
+    if not path:
+        return None
+    return CallRecordSink(
+        writer=create_call_record_writer(path=path, record_format=record_format),
+        logger=create_logger(name=CallRecordSink.__name__),
+    )
+
+
+def create_call_transcript_sink(directory: Optional[str]) -> Optional[CallTranscriptSink]:
+    if not directory:
+        return None
+    return CallTranscriptSink(directory=directory, logger=create_logger(name=CallTranscriptSink.__name__))
+
+
+def create_campaign_call_queue(store: CampaignStore, node_id: str, batch_size: int) -> CampaignCallQueue:
+    return CampaignCallQueue(
+        store=store,
+        node_id=node_id,
+        batch_size=batch_size,
+        logger=create_logger(name=CampaignCallQueue.__name__),
+    )
+
+
+def create_room_cleanup_queue(
+    livekit_api: api.LiveKitAPI, rate_limiter: LiveKitRateLimiter, outbound_cfg: OutboundConfig
+) -> RoomCleanupQueue:
+    return RoomCleanupQueue(
+        livekit_api=livekit_api,
+        rate_limiter=rate_limiter,
+        logger=create_logger(name=RoomCleanupQueue.__name__),
+        batch_size=outbound_cfg.room_cleanup_batch_size,
+        timeout_seconds=outbound_cfg.shutdown_step_timeout_seconds,
+    )
+
+
+CallRunnerPropsFactory = Callable[..., OutboundCallRunnerProps]
+
+
 def create_call_runner_props(
     instructions: str,
     phone_number_to: str,
@@ -81,26 +228,35 @@ def create_call_runner_props(
     cfg: Config,
     outbound_cfg: OutboundConfig,
     livekit_api: api.LiveKitAPI,
+    rate_limiter: LiveKitRateLimiter,
+    tracer: CallTracer,
+    transcript_sink: Optional[CallTranscriptSink] = None,
+    room_cleanup_queue: Optional[RoomCleanupQueue] = None,
 ) -> OutboundCallRunnerProps:
+    call_trace = tracer.start_trace(correlation_id=correlation_id)
     return OutboundCallRunnerProps(
-        call_agent=create_call_agent(instructions=instructions, correlation_id=correlation_id),
+        call_agent=create_call_agent(instructions=instructions),
         call_room_connector=OutboundCallRoomConnector(
             participant_identity=cfg.room_connector.participant_identity,
             room_name_prefix=cfg.livekit_api.room_name_prefix,
             livekit_url=cfg.livekit_api.url,
             livekit_api=livekit_api,
-            logger=create_logger(name=OutboundCallRoomConnector.__name__, correlation_id=correlation_id),
+            rate_limiter=rate_limiter,
+            call_trace=call_trace,
+            logger=create_logger(name=OutboundCallRoomConnector.__name__),
+            room_cleanup_queue=room_cleanup_queue,
         ),
         call_session_starter=_create_call_session_starter(
-            logger=create_logger(name=CallSessionStarter.__name__, correlation_id=correlation_id),
+            logger=create_logger(name=CallSessionStarter.__name__),
             cfg=cfg,
+            call_trace=call_trace,
         ),
-        call_event_listener=CallEventListener(
-            logger=create_logger(name=CallEventListener.__name__, correlation_id=correlation_id)
-        ),
+        call_event_listener=create_call_event_listener(call_trace=call_trace, transcript_sink=transcript_sink),
         call_dialer=OutboundCallDialer(
             livekit_api=livekit_api,
-            logger=create_logger(name=OutboundCallDialer.__name__, correlation_id=correlation_id),
+            rate_limiter=rate_limiter,
+            call_trace=call_trace,
+            logger=create_logger(name=OutboundCallDialer.__name__),
         ),
         outbound_config=OutboundCallRunnerConfig(
             phone_number_from=outbound_cfg.phone_number_from,
@@ -109,6 +265,8 @@ def create_call_runner_props(
             participant_identity=outbound_cfg.participant_identity,
             ringing_timeout=outbound_cfg.ringing_timeout,
             max_call_duration=outbound_cfg.max_call_duration,
+            shutdown_step_timeout_seconds=outbound_cfg.shutdown_step_timeout_seconds,
         ),
-        logger=create_logger(name=OutboundCallRunner.__name__, correlation_id=correlation_id),
+        call_trace=call_trace,
+        logger=create_logger(name=OutboundCallRunner.__name__),
     )
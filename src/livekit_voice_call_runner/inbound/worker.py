@@ -1,34 +1,131 @@
+import contextlib
 import uuid
+from typing import Any, Callable, Optional
 
 from livekit.agents import JobContext
 
 from livekit_voice_call_runner import config, factory
-from livekit_voice_call_runner.logger import create_logger
+from livekit_voice_call_runner.config.base import Config
+from livekit_voice_call_runner.core.call_session_starter import CallSessionStarter
+from livekit_voice_call_runner.livekit.realtime_model_provider import shutdown_realtime_model_provider
+from livekit_voice_call_runner.logger import bind_log_context, create_logger, set_log_phase
+from livekit_voice_call_runner.outbound.call_record import CallOutcome
+from livekit_voice_call_runner.telemetry.loop_monitor import LagWindow, get_event_loop_monitor
+from livekit_voice_call_runner.telemetry.metrics import CallMetrics, get_call_metrics
+from livekit_voice_call_runner.telemetry.profiler import ProfileMode, get_run_profiler
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
 
 logger = create_logger(name=__name__)
 
 
-async def handle(ctx: JobContext, instructions: str) -> None:
+CallSessionStarterFactory = Callable[..., CallSessionStarter]
+
+
+async def handle(
+    ctx: JobContext,
+    instructions: str,
+    cfg: Optional[Config] = None,
+    call_session_starter_factory: CallSessionStarterFactory = factory.create_call_session_starter,
+    call_metrics: Optional[CallMetrics] = None,
+    profile_mode: Optional[ProfileMode] = None,
+    profile_path: str = "profile",
+) -> None:
     correlation_id = str(uuid.uuid4())
-    log = create_logger(name="inbound.entrypoint", correlation_id=correlation_id)
+    # jobs sharing a process share its loop, and its monitor and profiler
+    event_loop_monitor = get_event_loop_monitor()
+    profiler = get_run_profiler(mode=profile_mode, path=profile_path)
+    lag_window = event_loop_monitor.watch() if event_loop_monitor else contextlib.nullcontext()
+    try:
+        with bind_log_context(correlation_id=correlation_id), lag_window as window:
+            await _handle(
+                ctx=ctx,
+                instructions=instructions,
+                correlation_id=correlation_id,
+                cfg=cfg,
+                call_session_starter_factory=call_session_starter_factory,
+                call_metrics=call_metrics or get_call_metrics(),
+                lag_window=window,
+            )
+    finally:
+        # the job's realtime model and its HTTP session go with it, rather than waiting on a process that may be reused
+        await shutdown_realtime_model_provider()
+        # the process may be reused or killed without notice, so the profile is kept current after every call
+        if profiler:
+            profiler.write()
+
 
+def _without_llm_prewarm(cfg: Config) -> Config:
+    # a job runs a single call, so websockets opened ahead would only sit idle, each holding a server session
+    llm_prewarm = cfg.call_session.llm_prewarm.model_copy(update={"connections": 0})
+    return cfg.model_copy(update={"call_session": cfg.call_session.model_copy(update={"llm_prewarm": llm_prewarm})})
+
+
+async def _handle(
+    ctx: JobContext,
+    instructions: str,
+    correlation_id: str,
+    cfg: Optional[Config],
+    call_session_starter_factory: CallSessionStarterFactory,
+    call_metrics: CallMetrics,
+    lag_window: Optional[LagWindow],
+) -> None:
+    log = create_logger(name="inbound.entrypoint")
+
+    set_log_phase("prepare")
     await ctx.connect()
 
     log.info("Inbound call received.", extra={"room": ctx.room.name})
 
-    cfg = config.base.get_config()
-    call_agent = factory.create_call_agent(instructions=instructions, correlation_id=correlation_id)
-    call_session_starter = factory.create_call_session_starter(correlation_id=correlation_id, cfg=cfg)
-    call_event_listener = factory.create_call_event_listener(correlation_id=correlation_id)
+    cfg = _without_llm_prewarm(cfg or config.base.get_config())
+    call_trace = CallTrace(correlation_id=correlation_id)
+    call_agent = factory.create_call_agent(instructions=instructions)
+    call_session_starter = call_session_starter_factory(cfg=cfg, call_trace=call_trace)
+    # an inbound job runs on its own, so it owns its transcript sink
+    transcript_sink = factory.create_call_transcript_sink(
+        directory=config.base.get_logging_config().transcript.directory
+    )
+    if transcript_sink:
+        transcript_sink.start()
+    call_event_listener = factory.create_call_event_listener(call_trace=call_trace, transcript_sink=transcript_sink)
 
     await call_event_listener.listen_to_room(room=ctx.room)
     await call_session_starter.start_session(call_agent=call_agent, call_room=ctx.room)
+    # the caller is already in the room, so the call counts as answered once the agent is up
+    call_trace.mark("answered")
+    set_log_phase("in_call")
     await call_event_listener.listen_to_session(
         session=call_session_starter.session, agent=call_agent
     )
 
+    call_metrics.call_started(direction="inbound")
+    shutdown_event: dict[str, Any] = {}
+    outcome = CallOutcome.FAILED
     try:
-        await call_event_listener.wait_for_shutdown()
+        shutdown_event = await call_event_listener.wait_for_shutdown()
+        call_trace.mark("hangup")
+        outcome = CallOutcome.COMPLETED
     finally:
-        await call_session_starter.shutdown()
-        log.info("Inbound call ended.")
+        set_log_phase("shutdown")
+        with call_trace.span("shutdown"):
+            await call_session_starter.shutdown()
+            if transcript_sink:
+                await transcript_sink.shutdown()
+        call_trace.finish()
+        call_metrics.call_ended(
+            direction="inbound",
+            outcome=outcome.value,
+            reason=shutdown_event.get("context", {}).get("reason") or shutdown_event.get("name"),
+            phase_durations=call_trace.durations(),
+            turn_latencies_seconds=call_event_listener.turn_latencies_seconds,
+            ttft_seconds=call_event_listener.ttft_seconds,
+            interruptions=call_event_listener.interruptions,
+            max_event_loop_lag_seconds=lag_window.max_lag_seconds if lag_window else None,
+        )
+        log.info(
+            "Inbound call ended.",
+            extra={
+                "phase_durations": call_trace.durations(),
+                "conversation": call_event_listener.conversation_stats().model_dump(),
+                "max_event_loop_lag_seconds": lag_window.max_lag_seconds if lag_window else None,
+            },
+        )
@@ -23,3 +23,10 @@ _REASON_TO_NAME_MAP = {
 
 def map_to_name(reason: rtc.DisconnectReason) -> str:
     return _REASON_TO_NAME_MAP.get(str(reason), "INVALID_REASON")
+
+
+def map_from_name(name: str) -> rtc.DisconnectReason:
+    for reason, reason_name in _REASON_TO_NAME_MAP.items():
+        if reason_name == name:
+            return int(reason)  # type: ignore
+    raise ValueError(f"Unknown disconnect reason: {name}")
@@ -0,0 +1,37 @@
+import aiohttp
+from livekit import api
+
+
+class PooledLiveKitAPI(api.LiveKitAPI):
+    """
+    `api.LiveKitAPI` over an HTTP session it owns, with an explicitly sized pool of keep-alive connections.
+
+    One instance is shared by every call of a run, so API requests reuse warm connections instead of opening new ones.
+    It must be created on the event loop that uses it, and closed once, when no call uses it anymore.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        api_secret: str,
+        pool_size: int,
+        keepalive_seconds: float,
+        timeout_seconds: float,
+    ):
+        # every request goes to the same host, so the pool size is also the per-host limit
+        self._owned_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=pool_size,
+                limit_per_host=pool_size,
+                keepalive_timeout=keepalive_seconds,
+            ),
+            timeout=aiohttp.ClientTimeout(total=timeout_seconds),
+        )
+        super().__init__(url=url, api_key=api_key, api_secret=api_secret, session=self._owned_session)
+
+    async def aclose(self) -> None:
+        # `api.LiveKitAPI.aclose` leaves sessions passed in alone
+        await super().aclose()
+        if not self._owned_session.closed:
+            await self._owned_session.close()
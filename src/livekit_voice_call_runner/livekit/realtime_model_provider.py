@@ -0,0 +1,214 @@
+import asyncio
+import contextlib
+import time
+from collections import deque
+from typing import Any, Callable, Optional, cast
+
+import aiohttp
+from livekit.plugins import openai
+from openai.types.beta.realtime.session import TurnDetection
+
+from livekit_voice_call_runner.config.base import ConfigCallSession
+from livekit_voice_call_runner.core.ishutdown import IShutdown
+from livekit_voice_call_runner.logger import CallLogger, create_logger
+
+
+class PrewarmedRealtimeModel(openai.realtime.RealtimeModel):
+    """
+    `openai.realtime.RealtimeModel` that can keep websockets to the Realtime API open ahead of demand.
+
+    A session takes the most recently opened websocket, when one is ready, instead of connecting itself, and a
+    background task opens a replacement. The server starts a realtime session per websocket and ends idle ones, so
+    websockets idle longer than `max_idle_seconds` are closed and replaced rather than handed out.
+    """
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._prewarm_size = 0
+        self._prewarm_max_idle_seconds = 0.0
+        # (opened at, websocket), oldest first
+        self._prewarmed: deque[tuple[float, aiohttp.ClientWebSocketResponse]] = deque()
+        self._prewarm_wanted = asyncio.Event()
+        self._prewarm_task: Optional[asyncio.Task] = None
+
+    def session(self, *, turn_detection_disabled: bool = False) -> openai.realtime.RealtimeSession:
+        session = _PrewarmedRealtimeSession(self, turn_detection_disabled=turn_detection_disabled)
+        self._sessions.add(session)
+        return session
+
+    def prewarm(self, size: int, max_idle_seconds: float, on_error: Callable[[Exception], None]) -> None:
+        self._prewarm_size = size
+        self._prewarm_max_idle_seconds = max_idle_seconds
+        self._prewarm_task = asyncio.create_task(self._prewarm_forever(on_error=on_error))
+
+    @property
+    def prewarmed(self) -> int:
+        return len(self._prewarmed)
+
+    def _take_prewarmed(self) -> Optional[aiohttp.ClientWebSocketResponse]:
+        if not self._prewarm_task:
+            return None
+        self._prewarm_wanted.set()
+        while self._prewarmed:
+            opened_at, ws = self._prewarmed.pop()
+            if ws.closed:
+                continue
+            if time.monotonic() - opened_at < self._prewarm_max_idle_seconds:
+                return ws
+            # the newest one is stale, so all are; the background task closes them
+            self._prewarmed.append((opened_at, ws))
+            break
+        return None
+
+    async def _close_expired(self) -> None:
+        now = time.monotonic()
+        while self._prewarmed and (
+            self._prewarmed[0][1].closed or now - self._prewarmed[0][0] >= self._prewarm_max_idle_seconds
+        ):
+            _, ws = self._prewarmed.popleft()
+            await ws.close()
+
+    async def _open(self) -> aiohttp.ClientWebSocketResponse:
+        # the URL and headers only depend on options every session copies from the model
+        url, headers = openai.realtime.RealtimeSession._create_ws_url_and_headers(self)  # type: ignore[arg-type]
+        return await asyncio.wait_for(
+            self._ensure_http_session().ws_connect(url=url, headers=headers),
+            self._opts.conn_options.timeout,
+        )
+
+    async def _prewarm_forever(self, on_error: Callable[[Exception], None]) -> None:
+        while True:
+            await self._close_expired()
+            if len(self._prewarmed) < self._prewarm_size:
+                try:
+                    self._prewarmed.append((time.monotonic(), await self._open()))
+                except (aiohttp.ClientError, TimeoutError) as e:
+                    on_error(e)
+                    await asyncio.sleep(self._opts.conn_options.retry_interval)
+                continue
+
+            # wake up when one is taken, or when the oldest one expires
+            self._prewarm_wanted.clear()
+            timeout = self._prewarmed[0][0] + self._prewarm_max_idle_seconds - time.monotonic()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._prewarm_wanted.wait(), timeout=max(timeout, 0))
+
+    async def aclose(self) -> None:
+        if self._prewarm_task:
+            self._prewarm_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._prewarm_task
+            self._prewarm_task = None
+        while self._prewarmed:
+            _, ws = self._prewarmed.popleft()
+            await ws.close()
+        await super().aclose()
+
+
+class _PrewarmedRealtimeSession(openai.realtime.RealtimeSession):
+    async def _create_ws_conn(self) -> aiohttp.ClientWebSocketResponse:
+        ws = cast(PrewarmedRealtimeModel, self._realtime_model)._take_prewarmed()
+        if ws is None:
+            return await super()._create_ws_conn()
+        self._report_connection_acquired(0.0)
+        return ws
+
+
+class RealtimeModelProvider(IShutdown):
+    """
+    Builds the realtime model once per session configuration and hands the same instance to every call.
+
+    A model only holds options: each `AgentSession` opens its own realtime session, over its own websocket, from it.
+    Sharing it saves building clients and validating options per call, and lets every websocket come from one HTTP
+    session, pre-opened ahead of demand when `llm_prewarm.connections` is set. The models and their connections belong
+    to the event loop the provider was created on.
+    """
+
+    def __init__(self, logger: CallLogger):
+        self._logger = logger
+        self._loop = asyncio.get_running_loop()
+        self._models: dict[tuple[str, str], PrewarmedRealtimeModel] = {}
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        if self._http_session is None:
+            # a websocket holds its connection for the whole call, so the usual cap of 100 would stall larger runs
+            self._http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+        return self._http_session
+
+    def _create_model(self, cfg: ConfigCallSession) -> PrewarmedRealtimeModel:
+        model = PrewarmedRealtimeModel.with_azure(
+            azure_deployment=cfg.llm.azure_deployment,
+            api_version=cfg.llm.api_version,
+            api_key=cfg.llm.api_key,
+            azure_endpoint=cfg.llm.azure_endpoint,
+            voice=cfg.llm.voice,
+            temperature=cfg.llm.temperature,
+            turn_detection=TurnDetection(
+                type=cfg.turn_detection.type,  # type: ignore
+                threshold=cfg.turn_detection.threshold,
+                prefix_padding_ms=cfg.turn_detection.prefix_padding_ms,
+                silence_duration_ms=cfg.turn_detection.silence_duration_ms,
+                create_response=cfg.turn_detection.create_response,
+                interrupt_response=cfg.turn_detection.interrupt_response,
+            ),
+            http_session=self._get_http_session(),
+        )
+        if cfg.llm_prewarm.connections:
+            model.prewarm(
+                size=cfg.llm_prewarm.connections,
+                max_idle_seconds=cfg.llm_prewarm.max_idle_seconds,
+                on_error=lambda e: self._logger.warning(
+                    "Failed to pre-open a realtime connection.", extra={"error": str(e)}
+                ),
+            )
+        self._logger.info(
+            "Created realtime model.",
+            extra={"azure_deployment": cfg.llm.azure_deployment, "prewarm_connections": cfg.llm_prewarm.connections},
+        )
+        return model
+
+    def get_model(self, cfg: ConfigCallSession) -> openai.realtime.RealtimeModel:
+        key = (cfg.llm.model_dump_json(), cfg.turn_detection.model_dump_json())
+        model = self._models.get(key)
+        if model is None:
+            model = self._models[key] = self._create_model(cfg=cfg)
+        return model
+
+    async def shutdown(self) -> None:
+        self._logger.info("Shutting down.", extra={"models": len(self._models)})
+        for model in self._models.values():
+            await model.aclose()
+        self._models.clear()
+        if self._http_session:
+            await self._http_session.close()
+        self._logger.info("Successfully shut down.")
+
+
+_provider: Optional[RealtimeModelProvider] = None
+
+
+def get_realtime_model_provider() -> RealtimeModelProvider:
+    """
+    The process-wide provider, created on first use. A run on another event loop gets a new one, so each run shuts
+    down its own with `shutdown_realtime_model_provider` before its loop ends: the old provider's HTTP session can't be
+    closed from the new loop.
+    """
+    global _provider
+    if _provider is None or _provider.loop is not asyncio.get_running_loop():
+        _provider = RealtimeModelProvider(logger=create_logger(name=RealtimeModelProvider.__name__))
+    return _provider
+
+
+async def shutdown_realtime_model_provider() -> None:
+    """
+    Close the process-wide provider's models and connections, if any.
+    """
+    global _provider
+    provider, _provider = _provider, None
+    if provider:
+        await provider.shutdown()
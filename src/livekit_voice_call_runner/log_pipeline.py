@@ -0,0 +1,216 @@
+import atexit
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+from livekit_voice_call_runner.config.base import LogMode, LogOverflowPolicy, get_logging_config
+from livekit_voice_call_runner.model import BaseModel
+
+_STOP = object()
+
+
+class LogPipelineStats(BaseModel):
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    # records that waited for room in the queue under the block policy
+    blocked: int = 0
+    format_errors: int = 0
+
+
+class LogPipeline:
+    """
+    Keeps log formatting and I/O off the event loop.
+
+    Handlers only enqueue the record with its formatter; a background thread formats records and writes them in
+    batches. The queue is bounded: when it is full, records are dropped according to `overflow_policy`, counted in
+    `stats`, and reported in-band once the writer catches up.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10_000,
+        overflow_policy: LogOverflowPolicy = LogOverflowPolicy.DROP_NEWEST,
+        block_timeout_seconds: float = 1.0,
+        batch_size: int = 256,
+        stream: Optional[TextIO] = None,
+    ):
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._overflow_policy = overflow_policy
+        self._block_timeout_seconds = block_timeout_seconds
+        self._batch_size = batch_size
+        self._stream = stream or sys.stderr
+        self._stats = LogPipelineStats()
+        self._reported_dropped = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def stats(self) -> LogPipelineStats:
+        return self._stats.model_copy()
+
+    @property
+    def depth(self) -> int:
+        # records waiting for the writer
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._write_forever, name="LogPipeline", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, formatter: logging.Formatter, record: logging.LogRecord) -> None:
+        if not self._thread:
+            # not started or already shut down, e.g. a late log line at exit: write it on the caller's thread
+            self._write([self._format(formatter, record)])
+            return
+
+        item = (formatter, record)
+        try:
+            self._queue.put_nowait(item)
+            self._stats.enqueued += 1
+            return
+        except queue.Full:
+            pass
+
+        if self._overflow_policy == LogOverflowPolicy.DROP_OLDEST:
+            try:
+                self._queue.get_nowait()
+                self._stats.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(item)
+                self._stats.enqueued += 1
+            except queue.Full:
+                self._stats.dropped += 1
+        elif self._overflow_policy == LogOverflowPolicy.BLOCK:
+            self._stats.blocked += 1
+            try:
+                self._queue.put(item, timeout=self._block_timeout_seconds)
+                self._stats.enqueued += 1
+            except queue.Full:
+                self._stats.dropped += 1
+        else:
+            self._stats.dropped += 1
+
+    def _format(self, formatter: logging.Formatter, record: logging.LogRecord) -> Optional[str]:
+        try:
+            return formatter.format(record)
+        except Exception:
+            self._stats.format_errors += 1
+            return None
+
+    def _format_dropped_report(self) -> Optional[str]:
+        dropped = self._stats.dropped - self._reported_dropped
+        if not dropped:
+            return None
+        self._reported_dropped += dropped
+        return json.dumps(
+            {
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "level": "WARNING",
+                "logger": LogPipeline.__name__,
+                "message": "Dropped log records, the log queue was full.",
+                "dropped": dropped,
+                "dropped_total": self._stats.dropped,
+            }
+        )
+
+    def _write(self, lines: list[Optional[str]]) -> None:
+        lines = [line for line in lines if line is not None]
+        if not lines:
+            return
+        try:
+            self._stream.write("\n".join(lines) + "\n")
+            self._stream.flush()
+            self._stats.written += len(lines)
+        except Exception:
+            self._stats.format_errors += len(lines)
+
+    def _write_forever(self) -> None:
+        stopped = False
+        while not stopped:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            for item in batch:
+                if item is _STOP:
+                    stopped = True
+                    continue
+                lines.append(self._format(*item))
+            lines.append(self._format_dropped_report())
+            self._write(lines)
+
+    def shutdown(self) -> None:
+        """
+        Write every queued record, then stop the writer thread.
+        """
+        if not self._thread:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+
+class QueueLogHandler(logging.Handler):
+    def __init__(self, pipeline: LogPipeline):
+        super().__init__()
+        self._pipeline = pipeline
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # the pipeline's queue is thread safe, so unlike `Handler.handle` no lock is taken on the caller's thread
+        if not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            # render the message now, so the background thread never touches the caller's arguments
+            record.msg = record.getMessage()
+            record.args = None
+            self._pipeline.enqueue(formatter=self.formatter or logging.Formatter(), record=record)
+        except Exception:
+            # e.g. arguments that don't match the message; reported like any handler would, not raised to the caller
+            self.handleError(record)
+
+
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_log_pipeline() -> Optional[LogPipeline]:
+    """
+    The process-wide pipeline, started on first use, or None when logging is synchronous (`LOG_MODE=sync`).
+    """
+    global _pipeline
+    cfg = get_logging_config()
+    if cfg.mode != LogMode.QUEUE:
+        return None
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = LogPipeline(max_queue_size=cfg.queue_size, overflow_policy=cfg.overflow_policy)
+            _pipeline.start()
+            atexit.register(_pipeline.shutdown)
+        return _pipeline
+
+
+def shutdown_log_pipeline() -> Optional[LogPipelineStats]:
+    """
+    Flush and stop the process-wide pipeline, if any, and return its final counters.
+    """
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            return None
+        _pipeline.shutdown()
+        stats = _pipeline.stats()
+        _pipeline = None
+        return stats
@@ -1,80 +1,250 @@
+import asyncio
+import contextvars
 import json
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from logging import Logger
-from typing import Any, Optional
-
-from pydantic import Field
+from typing import Any, Iterator, Optional
 
+from livekit_voice_call_runner.config.base import LogLevel, get_logging_config
+from livekit_voice_call_runner.log_pipeline import QueueLogHandler, get_log_pipeline
 from livekit_voice_call_runner.model import BaseModel
 
-_DENY_LIST_EXTRA_KEYS = [
-    "name",
-    "msg",
-    "args",
-    "levelname",
-    "levelno",
-    "pathname",
-    "filename",
-    "module",
-    "lineno",
-    "funcName",
-    "created",
-    "msecs",
-    "relativeCreated",
-    "thread",
-    "threadName",
-    "processName",
-    "process",
-    "getMessage",
-    "stack_info",
-    "correlation_id",
-]
-
-
-class JsonLogRecord(BaseModel):
-    timestamp: str
-    level: str
-    logger: str
-    message: str
+# every logger of the package is a child of this one, which alone holds a handler
+_ROOT_LOGGER_NAME = "livekit_voice_call_runner"
+
+# LogRecord attributes that are not extra fields
+_RESERVED_ATTRS = frozenset(
+    [
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+        "stack_info",
+        "correlation_id",
+        "exc_info",
+        "exc_text",
+        "message",
+        "log_context",
+        "log_phase",
+    ]
+)
+
+
+class LogContext(BaseModel):
+    """
+    Fields of the call being handled, added to every log line emitted while it is bound.
+
+    The phase is updated in place, so tasks started earlier in the call, which hold the same context, log the current
+    phase too.
+    """
+
     correlation_id: Optional[str] = None
-    extra: dict[str, Any] = Field(default_factory=dict)
-
-    def model_dump(self, **kwargs) -> dict[str, Any]:
-        return {
-            "timestamp": self.timestamp,
-            "level": self.level,
-            "logger": self.logger,
-            "message": self.message,
-            "correlation_id": self.correlation_id,
-            **self.extra,
-        }
+    # index of the process running the call, in a multi-process run
+    shard: Optional[int] = None
+    round: Optional[int] = None
+    phone_number: Optional[str] = None
+    phase: Optional[str] = None
+
+
+_log_context: contextvars.ContextVar[Optional[LogContext]] = contextvars.ContextVar("log_context", default=None)
+
+
+def get_log_context() -> Optional[LogContext]:
+    return _log_context.get()
+
+
+def get_task_log_context(task: asyncio.Task) -> Optional[LogContext]:
+    """
+    The log context `task` runs in, which can be read from another thread while the task runs.
+    """
+    return task.get_context().get(_log_context)
+
+
+@contextmanager
+def bind_log_context(**fields: Any) -> Iterator[LogContext]:
+    """
+    Merge `fields` into the current log context until the block exits.
+
+    The context is a context variable, so it follows the task that bound it and every task created from there, e.g. the
+    room and session callbacks of a call, without touching the calls running next to it.
+    """
+    current = _log_context.get()
+    context = current.model_copy(update=fields) if current else LogContext(**fields)
+    token = _log_context.set(context)
+    try:
+        yield context
+    finally:
+        _log_context.reset(token)
+
+
+@contextmanager
+def use_log_context(context: LogContext) -> Iterator[LogContext]:
+    """
+    Make `context` current again until the block exits, e.g. to run a call in another task than the one it was prepared
+    in. Fields it lacks are filled in from the current context.
+    """
+    current = _log_context.get()
+    if current:
+        for name, value in current:
+            if value is not None and getattr(context, name) is None:
+                setattr(context, name, value)
+    token = _log_context.set(context)
+    try:
+        yield context
+    finally:
+        _log_context.reset(token)
+
+
+def set_log_phase(phase: str) -> None:
+    """
+    Set the phase of the current log context, for every task that shares it.
+    """
+    current = _log_context.get()
+    if current:
+        current.phase = phase
+    else:
+        _log_context.set(LogContext(phase=phase))
+
+
+class LogContextFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        # runs on the caller's thread, so the context is captured before a background writer formats the record; the
+        # phase changes in place, so it is captured on its own
+        context = _log_context.get()
+        record.log_context = context
+        record.log_phase = context.phase if context else None
+        return True
+
+
+_encode_string = json.encoder.encode_basestring_ascii  # type: ignore
+# extra values that are not JSON serializable are logged as their string form rather than failing the line
+_encode = json.JSONEncoder(default=str).encode
 
 
 class JsonFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line: timestamp, level, logger, message, correlation id, then extras.
+
+    The line is assembled from fragments that are encoded once per formatter (level, logger name, correlation id), so
+    per record only the message, the log context and the extras are encoded. The correlation id of the log context, if
+    any, takes precedence over the formatter's.
+    """
+
     def __init__(self, correlation_id: Optional[str] = None, pretty_print: Optional[bool] = None):
         super().__init__()
         self.correlation_id = correlation_id
         self.pretty_print = pretty_print
+        self._correlation_id_part = ', "correlation_id": ' + _encode(correlation_id) + ", "
+        self._level_parts: dict[str, str] = {}
+        self._logger_parts: dict[str, str] = {}
+        self._time_cache: tuple[int, str] = (-1, "")
 
-    def format(self, record: logging.LogRecord) -> str:
-        # map record to log data
-        json_record = JsonLogRecord(
-            timestamp=self.formatTime(record),
-            level=record.levelname,
-            logger=record.name,
-            message=record.getMessage(),
-            correlation_id=self.correlation_id,
-        )
+    def _render_level(self, levelname: str) -> str:
+        return _encode_string(levelname)
+
+    def _get_level_part(self, levelname: str) -> str:
+        part = self._level_parts.get(levelname)
+        if part is None:
+            part = self._level_parts[levelname] = '", "level": ' + self._render_level(levelname)
+        return part
+
+    def _get_logger_part(self, name: str) -> str:
+        part = self._logger_parts.get(name)
+        if part is None:
+            part = self._logger_parts[name] = ', "logger": ' + _encode_string(name) + ', "message": '
+        return part
+
+    def _get_context_part(self, context: Optional[LogContext], phase: Optional[str]) -> str:
+        if context is None:
+            return self._correlation_id_part
+        correlation_id = context.correlation_id if context.correlation_id is not None else self.correlation_id
+        parts = [', "correlation_id": ', _encode(correlation_id)]
+        if context.shard is not None:
+            parts += [', "shard": ', _encode(context.shard)]
+        if context.round is not None:
+            parts += [', "round": ', _encode(context.round)]
+        if context.phone_number is not None:
+            parts += [', "phone_number": ', _encode_string(context.phone_number)]
+        if phase is not None:
+            parts += [', "phase": ', _encode_string(phase)]
+        parts.append(", ")
+        return "".join(parts)
+
+    def _format_time(self, record: logging.LogRecord) -> str:
+        # same output as `formatTime`, with the seconds part rendered once per second
+        seconds = int(record.created)
+        cached_seconds, cached = self._time_cache
+        if cached_seconds != seconds:
+            cached = time.strftime(self.default_time_format, self.converter(seconds))
+            self._time_cache = (seconds, cached)
+        return self.default_msec_format % (cached, record.msecs)
+
+    def _get_extra(self, record: logging.LogRecord) -> dict[str, Any]:
+        extra = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in _RESERVED_ATTRS and value is not None and value != ""
+        }
+        if record.exc_info:
+            extra["exc_info"] = self.formatException(record.exc_info)
+        return extra
 
-        # add extra fields
-        for key, value in record.__dict__.items():
-            if key not in _DENY_LIST_EXTRA_KEYS and value not in [None, ""]:
-                json_record.extra[key] = value
+    def _format_pretty(self, record: logging.LogRecord) -> str:
+        context: Optional[LogContext] = getattr(record, "log_context", None)
+        context_fields = context.model_dump(exclude_none=True, exclude={"phase"}) if context else {}
+        phase = getattr(record, "log_phase", None)
+        if phase is not None:
+            context_fields["phase"] = phase
+        return json.dumps(
+            {
+                "timestamp": self._format_time(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                "correlation_id": self.correlation_id,
+                **context_fields,
+                **self._get_extra(record),
+            },
+            indent=2,
+            default=str,
+        )
 
-        json_record_dict = json_record.model_dump()
+    def format(self, record: logging.LogRecord) -> str:
         if self.pretty_print:
-            return json.dumps(json_record_dict, indent=2)
-        return json.dumps(json_record_dict)
+            return self._format_pretty(record)
+
+        line = "".join(
+            [
+                '{"timestamp": "',
+                self._format_time(record),
+                self._get_level_part(record.levelname),
+                self._get_logger_part(record.name),
+                _encode_string(record.getMessage()),
+                self._get_context_part(getattr(record, "log_context", None), getattr(record, "log_phase", None)),
+            ]
+        )
+        extra = self._get_extra(record)
+        if not extra:
+            return line[:-2] + "}"
+        # extras follow the fixed fields, so on a key clash the extra value wins when parsed, as with a dict merge
+        return line + _encode(extra)[1:]
 
 
 class ColoredJsonFormatter(JsonFormatter):
@@ -89,36 +259,58 @@ class ColoredJsonFormatter(JsonFormatter):
         }
         self._reset = "\033[0m"
 
-    def format(self, record: logging.LogRecord) -> str:
-        json_record = JsonFormatter.format(self, record)
+    def _render_level(self, levelname: str) -> str:
+        # the escape codes go in raw, as JSON encoding would escape them and the terminal would not color the level
+        if levelname in self._colors:
+            return f'"{self._colors[levelname]}{levelname}{self._reset}"'
+        return super()._render_level(levelname)
 
+    def _format_pretty(self, record: logging.LogRecord) -> str:
+        json_record = super()._format_pretty(record)
         if record.levelname in self._colors:
-            color = self._colors[record.levelname]
             json_record = json_record.replace(
-                f'"level": "{record.levelname}"', f'"level": "{color}{record.levelname}{self._reset}"'
+                f'"level": "{record.levelname}"', f'"level": {self._render_level(record.levelname)}', 1
             )
         return json_record
 
 
-class CallLogger(Logger):
-    def __init__(self, name: str, correlation_id: Optional[str] = None):
-        super().__init__(name=name)
-        self._correlation_id = correlation_id
+# loggers are plain stdlib loggers of one tree; the call they log for comes from the bound `LogContext`
+CallLogger = Logger
+
+_root_logger_lock = threading.Lock()
+
+
+def _get_root_logger(pretty_print: Optional[bool] = False) -> Logger:
+    root = logging.getLogger(_ROOT_LOGGER_NAME)
+    with _root_logger_lock:
+        if not root.handlers:
+            root.setLevel(get_logging_config().level.value)
+            # the package's JSON lines are not handed on to whatever the application configured on the root logger
+            root.propagate = False
+
+            pipeline = get_log_pipeline()
+            handler = QueueLogHandler(pipeline=pipeline) if pipeline else logging.StreamHandler()
+            handler.addFilter(LogContextFilter())
+            handler.setFormatter(ColoredJsonFormatter(pretty_print=pretty_print))
+            root.addHandler(handler)
+    return root
+
 
-    @property
-    def correlation_id(self) -> Optional[str]:
-        return self._correlation_id
+def set_log_level(level: LogLevel) -> None:
+    """
+    Level of the whole logger tree, e.g. from the command line; `LOG_LEVEL` sets it otherwise.
+    """
+    _get_root_logger().setLevel(level.value)
 
 
-def create_logger(
-    name: str,
-    correlation_id: Optional[str] = None,
-    pretty_print: Optional[bool] = False,
-) -> CallLogger:
-    logger = CallLogger(name=name, correlation_id=correlation_id)
-    logger.setLevel(logging.INFO)
+def create_logger(name: str, pretty_print: Optional[bool] = False) -> CallLogger:
+    """
+    The logger `name` of the package's logger tree, e.g. "OutboundCallDialer" or a module's `__name__`.
 
-    handler = logging.StreamHandler()
-    handler.setFormatter(ColoredJsonFormatter(correlation_id=correlation_id, pretty_print=pretty_print))
-    logger.addHandler(handler)
-    return logger
+    Loggers are created once per name and share a single handler, so creating one per call costs nothing. `pretty_print`
+    applies to the whole tree and only takes effect on the first call.
+    """
+    _get_root_logger(pretty_print=pretty_print)
+    if name != _ROOT_LOGGER_NAME and not name.startswith(f"{_ROOT_LOGGER_NAME}."):
+        name = f"{_ROOT_LOGGER_NAME}.{name}"
+    return logging.getLogger(name)
@@ -23,7 +23,8 @@ class CallRoom(rtc.Room):
 class CallSessionStarterConfigRealtime(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
-    llm: Union[llm.LLM, llm.RealtimeModel]
+    # None when the session doesn't run a model of its own, e.g. a simulated one
+    llm: Optional[Union[llm.LLM, llm.RealtimeModel]]
     user_away_timeout: float
     use_tts_aligned_transcript: bool
     preemptive_generation: bool
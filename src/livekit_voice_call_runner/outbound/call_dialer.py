@@ -1,13 +1,23 @@
 from livekit import api
 from livekit.protocol import sip
 
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
 from livekit_voice_call_runner.core.ishutdown import IShutdown
 from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
 
 
 class OutboundCallDialer(IShutdown):
-    def __init__(self, livekit_api: api.LiveKitAPI, logger: CallLogger):
+    def __init__(
+        self,
+        livekit_api: api.LiveKitAPI,
+        rate_limiter: LiveKitRateLimiter,
+        call_trace: CallTrace,
+        logger: CallLogger,
+    ):
         self._livekit_api = livekit_api
+        self._rate_limiter = rate_limiter
+        self._call_trace = call_trace
         self._logger = logger
 
     async def dial(self, request: sip.CreateSIPParticipantRequest) -> api.SIPParticipantInfo:
@@ -19,14 +29,21 @@ class OutboundCallDialer(IShutdown):
             "dtmf": request.dtmf,
         }
         self._logger.info("Dialing call.", extra=logger_extra)
+        # within the caller's "dial" span, so the time spent queued for the trunk can be told from the time to answer
+        with self._call_trace.span("dial_rate_limit_wait"):
+            rate_limit_wait_seconds = await self._rate_limiter.acquire_sip_api(sip_trunk_id=request.sip_trunk_id)
         response = await self._livekit_api.sip.create_sip_participant(create=request)
         self._logger.info(
             "Successfully dialed call.",
-            extra={**logger_extra, "sip_call_id": response.sip_call_id},
+            extra={
+                **logger_extra,
+                "sip_call_id": response.sip_call_id,
+                "rate_limit_wait_seconds": rate_limit_wait_seconds,
+            },
         )
         return response
 
     async def shutdown(self) -> None:
+        # the LiveKit API client is shared by every call, and closed by whoever created it once the run is over
         self._logger.info("Shutting down.")
-        await self._livekit_api.aclose()
         self._logger.info("Successfully shut down.")
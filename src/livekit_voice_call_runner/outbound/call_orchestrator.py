@@ -1,14 +1,53 @@
+import contextlib
+import functools
 import itertools
 import uuid
+from enum import Enum
+from typing import Iterator, Optional
 
 from livekit import api
 
 from livekit_voice_call_runner import factory
-from livekit_voice_call_runner.concurrency.tasks_runner import ConcurrentTasksRunner
+from livekit_voice_call_runner.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from livekit_voice_call_runner.concurrency.arrival_profiles import ArrivalProfile
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
+from livekit_voice_call_runner.concurrency.tasks_runner import ConcurrentTasksRunner, Task
 from livekit_voice_call_runner.config.base import Config
 from livekit_voice_call_runner.config.outbound import OutboundConfig
-from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.core.call_transcript_sink import CallTranscriptSink
+from livekit_voice_call_runner.logger import CallLogger, bind_log_context, create_logger
+from livekit_voice_call_runner.outbound.call_record import CallRecord
+from livekit_voice_call_runner.outbound.call_record_sink import CallRecordSink
 from livekit_voice_call_runner.outbound.call_runner import OutboundCallRunner, OutboundCallRunnerProps
+from livekit_voice_call_runner.outbound.call_runner_pool import OutboundCallRunnerFactory, OutboundCallRunnerPool
+from livekit_voice_call_runner.outbound.campaign_queue import CampaignCallQueue
+from livekit_voice_call_runner.outbound.room_cleanup_queue import RoomCleanupQueue
+from livekit_voice_call_runner.outbound.run_summary import RunSummary
+from livekit_voice_call_runner.telemetry.loop_monitor import EventLoopMonitor
+from livekit_voice_call_runner.telemetry.metrics import CallMetrics
+from livekit_voice_call_runner.telemetry.tracing import CallTracer
+
+
+class OutboundCallScheduler(str, Enum):
+    ROUNDS = "rounds"
+    STREAMING = "streaming"
+    OPEN_LOOP = "open-loop"
+
+
+# disconnect reasons that point at the trunk or LiveKit rather than at the callee
+_BACKEND_FAILURE_REASONS = {"SIP_TRUNK_FAILURE", "CONNECTION_TIMEOUT", "MEDIA_FAILURE", "JOIN_FAILURE"}
+# everything before the dial, which depends on LiveKit and the model backend alone
+_SETUP_PHASE_NAMES = ["create_room", "connect_room", "start_session", "wait_for_agent_ready"]
+
+
+def _is_backend_failure(record: CallRecord) -> bool:
+    # a callee who is busy or doesn't answer fails the call too, but says nothing about the load the run puts on LiveKit
+    return record.backend_failure or record.disconnect_reason in _BACKEND_FAILURE_REASONS
+
+
+def _get_setup_seconds(record: CallRecord) -> Optional[float]:
+    durations = [record.phase_durations[name] for name in _SETUP_PHASE_NAMES if name in record.phase_durations]
+    return sum(durations) if durations else None
 
 
 class OutboundCallOrchestrator:
@@ -23,7 +62,28 @@ class OutboundCallOrchestrator:
         cfg: Config,
         outbound_cfg: OutboundConfig,
         livekit_api: api.LiveKitAPI,
+        rate_limiter: LiveKitRateLimiter,
+        tracer: CallTracer,
+        scheduler: OutboundCallScheduler = OutboundCallScheduler.ROUNDS,
+        arrival_profile: Optional[ArrivalProfile] = None,
+        prewarm_pool_size: int = 0,
+        prewarm_max_idle_seconds: float = 60.0,
+        calls_per_round: Optional[int] = None,
+        call_record_sink: Optional[CallRecordSink] = None,
+        transcript_sink: Optional[CallTranscriptSink] = None,
+        call_runner_props_factory: Optional[factory.CallRunnerPropsFactory] = None,
+        summary: Optional[RunSummary] = None,
+        call_queue: Optional[CampaignCallQueue] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        call_metrics: Optional[CallMetrics] = None,
+        event_loop_monitor: Optional[EventLoopMonitor] = None,
+        room_cleanup_queue: Optional[RoomCleanupQueue] = None,
     ):
+        if scheduler == OutboundCallScheduler.OPEN_LOOP and arrival_profile is None:
+            raise ValueError("An arrival profile is required for the open-loop scheduler")
+        if call_queue and prewarm_pool_size:
+            raise ValueError("Calls leased from a campaign can't be prepared ahead")
+
         self._instructions = instructions
         self._phone_numbers = phone_numbers
         self._concurrency = concurrency
@@ -33,42 +93,244 @@ class OutboundCallOrchestrator:
         self._cfg = cfg
         self._outbound_cfg = outbound_cfg
         self._livekit_api = livekit_api
+        self._rate_limiter = rate_limiter
+        self._tracer = tracer
+        self._scheduler = scheduler
+        self._arrival_profile = arrival_profile
+        self._prewarm_pool_size = prewarm_pool_size
+        self._prewarm_max_idle_seconds = prewarm_max_idle_seconds
+        self._pool: Optional[OutboundCallRunnerPool] = None
+        # set by a multi-process run, whose processes split the calls one process would place each round
+        self._fixed_calls_per_round = calls_per_round
+        self._call_record_sink = call_record_sink
+        self._transcript_sink = transcript_sink
+        self._call_runner_props_factory = call_runner_props_factory
+        # passed in, e.g. to keep the calls that finished when the run is cancelled
+        self._summary = summary if summary is not None else RunSummary()
+        # when set, calls are leased from a campaign rather than built from the instructions, numbers and rounds
+        self._call_queue = call_queue
+        self._call_queue_drained = False
+        # the limiter the tasks runner gates calls with, fed every call's outcome
+        self._concurrency_limiter = concurrency_limiter
+        self._call_metrics = call_metrics
+        # started and shut down by the owner of the loop; its lag is added to the summary once the run ends
+        self._event_loop_monitor = event_loop_monitor
+        # deletes the room of every call once it's left; drained before the LiveKit API is closed
+        self._room_cleanup_queue = room_cleanup_queue or factory.create_room_cleanup_queue(
+            livekit_api=livekit_api, rate_limiter=rate_limiter, outbound_cfg=outbound_cfg
+        )
 
-    def _build_call_runner_props(self) -> list[OutboundCallRunnerProps]:
-        props = [
-            factory.create_call_runner_props(
-                instructions=instructions,
-                phone_number_to=to_phone_number,
-                correlation_id=str(uuid.uuid4()),
-                cfg=self._cfg,
-                outbound_cfg=self._outbound_cfg,
-                livekit_api=self._livekit_api,
+    @property
+    def summary(self) -> RunSummary:
+        return self._summary
+
+    def _create_call_runner_props(self, instructions: str, phone_number_to: str) -> OutboundCallRunnerProps:
+        # e.g. simulated runs swap in fake transport components
+        create_call_runner_props = self._call_runner_props_factory or factory.create_call_runner_props
+        return create_call_runner_props(
+            instructions=instructions,
+            phone_number_to=phone_number_to,
+            correlation_id=str(uuid.uuid4()),
+            cfg=self._cfg,
+            outbound_cfg=self._outbound_cfg,
+            livekit_api=self._livekit_api,
+            rate_limiter=self._rate_limiter,
+            tracer=self._tracer,
+            transcript_sink=self._transcript_sink,
+            room_cleanup_queue=self._room_cleanup_queue,
+        )
+
+    def _calls_per_round(self) -> int:
+        if self._fixed_calls_per_round is not None:
+            return self._fixed_calls_per_round
+        return max(len(self._instructions) * len(self._phone_numbers), self._concurrency)
+
+    def _iter_round_scenarios(self) -> Iterator[tuple[str, str]]:
+        # repeat the inputs to reach max concurrency; only the inputs repeat, every call gets its own components
+        scenarios = itertools.cycle(itertools.product(self._instructions, self._phone_numbers))
+        return itertools.islice(scenarios, self._calls_per_round())
+
+    def _create_call_runner(self, instructions: str, phone_number_to: str) -> OutboundCallRunner:
+        return OutboundCallRunner(
+            props=self._create_call_runner_props(instructions=instructions, phone_number_to=phone_number_to)
+        )
+
+    def _iter_call_runner_factories(self) -> Iterator[OutboundCallRunnerFactory]:
+        for _ in range(self._rounds):
+            for instructions, phone_number_to in self._iter_round_scenarios():
+                yield functools.partial(
+                    self._create_call_runner,
+                    instructions=instructions,
+                    phone_number_to=phone_number_to,
+                )
+
+    async def _run_call(self, runner: OutboundCallRunner, round: int) -> CallRecord:
+        if self._call_metrics:
+            self._call_metrics.call_started(direction="outbound")
+        lag_window = self._event_loop_monitor.watch() if self._event_loop_monitor else contextlib.nullcontext()
+        with lag_window as window, bind_log_context(round=round):
+            record = await runner.run()
+        if window:
+            record.max_event_loop_lag_seconds = window.max_lag_seconds
+        self._summary.record(record)
+        if self._call_metrics:
+            self._call_metrics.call_ended(
+                direction="outbound",
+                outcome=record.outcome.value,
+                reason=record.disconnect_reason or record.shutdown_reason,
+                phase_durations=record.phase_durations,
+                turn_latencies_seconds=record.turn_latencies_seconds,
+                ttft_seconds=record.ttft_seconds,
+                interruptions=record.interruptions,
+                max_event_loop_lag_seconds=record.max_event_loop_lag_seconds,
+            )
+        if self._concurrency_limiter:
+            self._concurrency_limiter.record(
+                failed=_is_backend_failure(record), setup_latency_seconds=_get_setup_seconds(record)
             )
-            for instructions in self._instructions
-            for to_phone_number in self._phone_numbers
-        ]
+        if self._call_record_sink:
+            await self._call_record_sink.write(record)
+        return record
 
-        # repeat the inputs to reach max concurrency
-        min_size = max(len(props), self._concurrency)
-        return list(itertools.islice(itertools.cycle(props), min_size))
+    async def _run_pooled_call(self, pool: OutboundCallRunnerPool, round: int) -> None:
+        runner = await pool.acquire()
+        if runner:
+            await self._run_call(runner=runner, round=round)
+
+    async def _run_new_call(self, instructions: str, phone_number_to: str, round: int) -> None:
+        # built once the call has a slot, so only calls in flight hold components
+        runner = self._create_call_runner(instructions=instructions, phone_number_to=phone_number_to)
+        await self._run_call(runner=runner, round=round)
+
+    def _iter_round_tasks(self, round: int) -> Iterator[Task]:
+        if self._pool:
+            for _ in range(self._calls_per_round()):
+                yield self._run_pooled_call(pool=self._pool, round=round)
+            return
+        for instructions, phone_number_to in self._iter_round_scenarios():
+            yield self._run_new_call(instructions=instructions, phone_number_to=phone_number_to, round=round)
 
     async def _run_round(self, round: int) -> None:
         logger_extra = {"round": round, "concurrency": self._concurrency}
         self._logger.info("Running round.", extra=logger_extra)
 
-        props = self._build_call_runner_props()
-        tasks = [OutboundCallRunner(props=prop).run() for prop in props]
-        await self._concurrent_tasks_runner.run(tasks=tasks, concurrency=self._concurrency)
+        # tasks are pulled as slots free up, so a large round never holds more than `concurrency` calls
+        await self._concurrent_tasks_runner.run_stream(
+            tasks=self._iter_round_tasks(round=round),
+            concurrency=self._concurrency,
+        )
 
         self._logger.info("Successfully ran round.", extra=logger_extra)
 
+    def _iter_call_runner_tasks(self) -> Iterator[Task]:
+        for round in range(self._rounds):
+            self._logger.info("Scheduling round.", extra={"round": round, "concurrency": self._concurrency})
+            yield from self._iter_round_tasks(round=round)
+
+    async def _run_streaming(self) -> None:
+        # a single worker pool spans all rounds, so a slot is refilled as soon as any call ends
+        await self._concurrent_tasks_runner.run_stream(
+            tasks=self._iter_call_runner_tasks(),
+            concurrency=self._concurrency,
+        )
+
+    async def _run_open_loop(self) -> None:
+        # calls are launched on the arrival schedule; concurrency only caps how many can be in flight
+        assert self._arrival_profile is not None
+        await self._concurrent_tasks_runner.run_open_loop(
+            tasks=self._iter_call_runner_tasks(),
+            arrival_profile=self._arrival_profile,
+            max_in_flight=self._concurrency,
+        )
+
+    async def _run_queued_call(self, call_queue: CampaignCallQueue) -> None:
+        call = await call_queue.lease()
+        if call is None:
+            self._call_queue_drained = True
+            return
+        try:
+            # built inside, so a call whose runner can't be built releases its lease rather than keeping it renewed
+            runner = self._create_call_runner(instructions=call.instructions, phone_number_to=call.phone_number_to)
+            record = await self._run_call(runner=runner, round=call.round)
+        except Exception as e:
+            self._logger.error("Failed to run leased call.", extra={"call_id": call.call_id, "error": str(e)})
+            await call_queue.fail(call)
+            return
+        await call_queue.complete(call=call, record=record)
+
+    def _iter_queued_call_tasks(self, call_queue: CampaignCallQueue) -> Iterator[Task]:
+        # one task per leased call, until a lease finds the campaign done; tasks already pulled by then find it too
+        while not self._call_queue_drained:
+            yield self._run_queued_call(call_queue=call_queue)
+
+    async def _run_campaign(self) -> None:
+        # a slot leases its next call as soon as its last one ends
+        assert self._call_queue is not None
+        await self._concurrent_tasks_runner.run_stream(
+            tasks=self._iter_queued_call_tasks(call_queue=self._call_queue),
+            concurrency=self._concurrency,
+        )
+
     async def run(self) -> None:
         self._logger.info(
             "Running rounds.",
-            extra={"count": self._rounds, "concurrency": self._concurrency},
+            extra={"count": self._rounds, "concurrency": self._concurrency, "scheduler": self._scheduler.value},
         )
 
-        for round in range(self._rounds):
-            await self._run_round(round=round)
+        if self._call_record_sink:
+            self._call_record_sink.start()
+        if self._transcript_sink:
+            self._transcript_sink.start()
+        if self._call_queue:
+            self._call_queue.start()
+        self._room_cleanup_queue.start()
 
-        self._logger.info("Successfully ran rounds.")
+        if self._prewarm_pool_size:
+            self._pool = OutboundCallRunnerPool(
+                runner_factories=self._iter_call_runner_factories(),
+                size=self._prewarm_pool_size,
+                max_idle_seconds=self._prewarm_max_idle_seconds,
+                logger=create_logger(name=OutboundCallRunnerPool.__name__),
+            )
+            self._pool.start()
+
+        try:
+            if self._call_queue:
+                await self._run_campaign()
+            elif self._scheduler == OutboundCallScheduler.STREAMING:
+                await self._run_streaming()
+            elif self._scheduler == OutboundCallScheduler.OPEN_LOOP:
+                await self._run_open_loop()
+            else:
+                for round in range(self._rounds):
+                    await self._run_round(round=round)
+        finally:
+            if self._pool:
+                await self._pool.shutdown()
+            if self._call_queue:
+                await self._call_queue.shutdown()
+            if self._call_record_sink:
+                await self._call_record_sink.shutdown()
+            if self._transcript_sink:
+                await self._transcript_sink.shutdown()
+            # after the pool, whose prepared calls leave their rooms as it shuts down
+            await self._room_cleanup_queue.shutdown()
+            # closed once here rather than by the calls, which all share it
+            await self._livekit_api.aclose()
+            if self._event_loop_monitor:
+                self._summary.record_event_loop_lag(
+                    histogram=self._event_loop_monitor.histogram,
+                    slow_callbacks=self._event_loop_monitor.slow_callbacks,
+                )
+
+        self._logger.info(
+            "Successfully ran rounds.",
+            extra={
+                "rate_limits": {name: stats.model_dump() for name, stats in self._rate_limiter.stats().items()},
+                "adaptive_concurrency": (
+                    self._concurrency_limiter.stats().model_dump() if self._concurrency_limiter else None
+                ),
+                "room_cleanup": self._room_cleanup_queue.stats().model_dump(),
+                "summary": self._summary.to_dict(),
+            },
+        )
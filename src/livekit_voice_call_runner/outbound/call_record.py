@@ -0,0 +1,80 @@
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import Field
+
+from livekit_voice_call_runner.model import BaseModel
+from livekit_voice_call_runner.telemetry.histogram import sample_percentile
+
+# phases with a duration, and instant events with an offset from the start of the call, as recorded by the runner
+PHASE_DURATION_NAMES = [
+    "create_room",
+    "connect_room",
+    "start_session",
+    "wait_for_agent_ready",
+    # the part of the dial spent waiting for the trunk's calls per second limit
+    "dial_rate_limit_wait",
+    "dial",
+    "shutdown",
+]
+PHASE_OFFSET_NAMES = ["answered", "first_agent_utterance", "hangup"]
+_NESTED_FIELDS = {"phase_durations", "phase_offsets", "turn_latencies_seconds", "ttft_seconds"}
+# per-turn values a flat row carries as the call's percentiles instead
+_PERCENTILE_FIELDS = {"turn_latency": "turn_latencies_seconds", "ttft": "ttft_seconds"}
+_PERCENTILES = [50, 90]
+
+
+class CallOutcome(str, Enum):
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class CallRecord(BaseModel):
+    correlation_id: str
+    phone_number_from: str
+    phone_number_to: str
+    sip_trunk_id: str
+    outcome: CallOutcome
+    error: Optional[str] = None
+    shutdown_reason: Optional[str] = None
+    disconnect_reason: Optional[str] = None
+    # failed on LiveKit, the trunk or the model backend rather than on the callee, e.g. not a busy or unanswered dial
+    backend_failure: bool = False
+    turn_count: int = 0
+    started_at_unix: float
+    duration_seconds: Optional[float] = None
+    time_to_ready_seconds: Optional[float] = None
+    phase_durations: dict[str, float] = Field(default_factory=dict)
+    phase_offsets: dict[str, float] = Field(default_factory=dict)
+    turn_latencies_seconds: list[float] = Field(default_factory=list)
+    # realtime model time to first audio, per response
+    ttft_seconds: list[float] = Field(default_factory=list)
+    interruptions: int = 0
+    overlap_seconds: float = 0.0
+    # worst event loop scheduling lag while the call ran, shared with every other call of the process
+    max_event_loop_lag_seconds: Optional[float] = None
+
+    @classmethod
+    def columns(cls) -> list[str]:
+        """
+        Flat column names of `to_row`, stable across records so they can be written to a columnar file.
+        Per-turn latencies don't flatten, so only JSONL records carry them; rows get their percentiles.
+        """
+        scalar_columns = [name for name in cls.model_fields if name not in _NESTED_FIELDS]
+        return [
+            *scalar_columns,
+            *[f"{name}_seconds" for name in PHASE_DURATION_NAMES],
+            *[f"{name}_offset_seconds" for name in PHASE_OFFSET_NAMES],
+            *[f"{name}_p{percentile}_seconds" for name in _PERCENTILE_FIELDS for percentile in _PERCENTILES],
+        ]
+
+    def to_row(self) -> dict[str, Any]:
+        row = self.model_dump(exclude=_NESTED_FIELDS, mode="json")
+        for name in PHASE_DURATION_NAMES:
+            row[f"{name}_seconds"] = self.phase_durations.get(name)
+        for name in PHASE_OFFSET_NAMES:
+            row[f"{name}_offset_seconds"] = self.phase_offsets.get(name)
+        for name, field in _PERCENTILE_FIELDS.items():
+            for percentile in _PERCENTILES:
+                row[f"{name}_p{percentile}_seconds"] = sample_percentile(getattr(self, field), percentile)
+        return row
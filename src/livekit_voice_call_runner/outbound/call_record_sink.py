@@ -0,0 +1,168 @@
+import asyncio
+import csv
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Optional
+
+from livekit_voice_call_runner.core.ishutdown import IShutdown
+from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.outbound.call_record import CallRecord
+
+
+class CallRecordFormat(str, Enum):
+    JSONL = "jsonl"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+class CallRecordWriter(ABC):
+    """
+    Writes batches of call records to a file. Called from a worker thread, never from the event loop.
+    """
+
+    @abstractmethod
+    def write_batch(self, records: list[CallRecord]) -> None: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class JsonlCallRecordWriter(CallRecordWriter):
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write_batch(self, records: list[CallRecord]) -> None:
+        self._file.writelines(record.model_dump_json() + "\n" for record in records)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CsvCallRecordWriter(CallRecordWriter):
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=CallRecord.columns())
+        self._writer.writeheader()
+
+    def write_batch(self, records: list[CallRecord]) -> None:
+        self._writer.writerows(record.to_row() for record in records)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetCallRecordWriter(CallRecordWriter):
+    """
+    Writes one Parquet row group per batch. Requires the optional `pyarrow` dependency.
+    """
+
+    def __init__(self, path: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise RuntimeError(
+                f"Writing {CallRecordFormat.PARQUET.value} call records requires pyarrow, "
+                "install the 'parquet' extra or use another format."
+            ) from e
+
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(column, self._get_type(column)) for column in CallRecord.columns()])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def _get_type(self, column: str) -> Any:
+        if column in ("turn_count", "interruptions"):
+            return self._pyarrow.int64()
+        if column.endswith("_seconds") or column.endswith("_unix"):
+            return self._pyarrow.float64()
+        return self._pyarrow.string()
+
+    def write_batch(self, records: list[CallRecord]) -> None:
+        rows = [record.to_row() for record in records]
+        self._writer.write_table(self._pyarrow.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def create_call_record_writer(path: str, record_format: CallRecordFormat) -> CallRecordWriter:
+    match record_format:
+        case CallRecordFormat.JSONL:
+            return JsonlCallRecordWriter(path=path)
+        case CallRecordFormat.CSV:
+            return CsvCallRecordWriter(path=path)
+        case CallRecordFormat.PARQUET:
+            return ParquetCallRecordWriter(path=path)
+
+    raise ValueError(f"Unknown call record format: {record_format}")
+
+
+class CallRecordSink(IShutdown):
+    """
+    Streams call records to a writer as calls finish.
+
+    Records go through a bounded queue and are written in batches from a worker thread, so memory stays bounded
+    however long the campaign is. When the writer falls behind, `write` waits for room in the queue.
+    """
+
+    def __init__(
+        self,
+        writer: CallRecordWriter,
+        logger: CallLogger,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        max_queue_size: int = 10_000,
+    ):
+        self._writer = writer
+        self._logger = logger
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._queue: asyncio.Queue[Optional[CallRecord]] = asyncio.Queue(maxsize=max_queue_size)
+        self._worker: Optional[asyncio.Task] = None
+        self._written = 0
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def start(self) -> None:
+        self._worker = asyncio.create_task(self._write_forever())
+
+    async def write(self, record: CallRecord) -> None:
+        await self._queue.put(record)
+
+    async def _next_batch(self) -> tuple[list[CallRecord], bool]:
+        batch: list[CallRecord] = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval_seconds
+        while len(batch) < self._batch_size:
+            try:
+                record = await asyncio.wait_for(self._queue.get(), timeout=max(deadline - loop.time(), 0))
+            except TimeoutError:
+                break
+            if record is None:
+                return batch, True
+            batch.append(record)
+        return batch, False
+
+    async def _write_forever(self) -> None:
+        stopped = False
+        while not stopped:
+            batch, stopped = await self._next_batch()
+            if not batch:
+                continue
+            try:
+                await asyncio.to_thread(self._writer.write_batch, batch)
+                self._written += len(batch)
+            except Exception as e:
+                self._logger.error("Failed to write call records.", extra={"count": len(batch), "error": str(e)})
+
+    async def shutdown(self) -> None:
+        self._logger.info("Shutting down.")
+        if self._worker:
+            await self._queue.put(None)
+            await self._worker
+        await asyncio.to_thread(self._writer.close)
+        self._logger.info("Successfully shut down.", extra={"written": self._written})
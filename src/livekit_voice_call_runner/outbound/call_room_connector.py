@@ -2,9 +2,12 @@ from typing import Optional
 
 from livekit import api, protocol
 
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
 from livekit_voice_call_runner.core.ishutdown import IShutdown
 from livekit_voice_call_runner.logger import CallLogger
 from livekit_voice_call_runner.model import CallRoom
+from livekit_voice_call_runner.outbound.room_cleanup_queue import RoomCleanupQueue
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
 
 
 class OutboundCallRoomConnector(IShutdown):
@@ -14,13 +17,20 @@ class OutboundCallRoomConnector(IShutdown):
         participant_identity: str,
         livekit_url: str,
         livekit_api: api.LiveKitAPI,
+        rate_limiter: LiveKitRateLimiter,
+        call_trace: CallTrace,
         logger: CallLogger,
+        room_cleanup_queue: Optional[RoomCleanupQueue] = None,
     ):
         self._room_name_prefix = room_name_prefix
         self._participant_identity = participant_identity
         self._livekit_url = livekit_url
         self._livekit_api = livekit_api
+        self._rate_limiter = rate_limiter
+        self._call_trace = call_trace
         self._logger = logger
+        # without one, rooms are left to the server's empty timeout
+        self._room_cleanup_queue = room_cleanup_queue
         self._room: Optional[CallRoom] = None
 
     @property
@@ -41,28 +51,44 @@ class OutboundCallRoomConnector(IShutdown):
         )
         return token.to_jwt()
 
+    def _new_room(self, name: str) -> CallRoom:
+        return CallRoom(name=name)
+
     async def _create_room(self) -> CallRoom:
-        name = f"{self._room_name_prefix}-{self._logger.correlation_id}"
+        name = f"{self._room_name_prefix}-{self._call_trace.correlation_id}"
+        rate_limit_wait_seconds = await self._rate_limiter.acquire_room_api()
+        self._logger.info(
+            "Creating room.",
+            extra={"room_name": name, "rate_limit_wait_seconds": rate_limit_wait_seconds},
+        )
         await self._livekit_api.room.create_room(protocol.room.CreateRoomRequest(name=name))
-        return CallRoom(name=name)
+        return self._new_room(name=name)
 
     async def connect(self) -> None:
         logger_extra = {"room_name": self._room_name_prefix}
         self._logger.info("Connecting to room.", extra=logger_extra)
 
-        self._room = await self._create_room()
-        await self._room.connect(
-            url=self._livekit_url,
-            token=self._get_access_token(room_name=self._room.name),
-        )
+        with self._call_trace.span("create_room"):
+            self._room = await self._create_room()
+        with self._call_trace.span("connect_room"):
+            await self._room.connect(
+                url=self._livekit_url,
+                token=self._get_access_token(room_name=self._room.name),
+            )
 
         self._logger.info("Successfully connected to room.", extra=logger_extra)
 
     async def shutdown(self) -> None:
-        logger_extra = {"room_name": self.room.name}
+        if not self._room:
+            return
+        logger_extra = {"room_name": self._room.name}
         self._logger.info("Shutting down", extra=logger_extra)
 
-        await self.room.disconnect()
-        await self._livekit_api.aclose()
+        try:
+            await self._room.disconnect()
+        finally:
+            # also when the disconnect fails or times out; deleting the room drops whoever is left in it
+            if self._room_cleanup_queue:
+                self._room_cleanup_queue.enqueue(self._room.name)
 
         self._logger.info("Successfully shut down.", extra=logger_extra)
@@ -1,15 +1,37 @@
 import asyncio
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional
 
+from livekit import api
 from livekit.agents.voice import room_io
 from livekit.protocol import sip
 
 from livekit_voice_call_runner.core.call_agent import CallAgent
 from livekit_voice_call_runner.core.call_event_listener import CallEventListener
 from livekit_voice_call_runner.core.call_session_starter import CallSessionStarter
-from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.core.ishutdown import IShutdown
+from livekit_voice_call_runner.logger import CallLogger, LogContext, bind_log_context, set_log_phase, use_log_context
 from livekit_voice_call_runner.model import BaseModel
 from livekit_voice_call_runner.outbound.call_dialer import OutboundCallDialer
+from livekit_voice_call_runner.outbound.call_record import CallOutcome, CallRecord
 from livekit_voice_call_runner.outbound.call_room_connector import OutboundCallRoomConnector
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
+
+
+def _is_backend_error(error: Exception) -> bool:
+    """
+    Whether a dial failed because LiveKit or the trunk is overloaded or down: a timeout, a rate limit or a 5xx.
+    """
+    if isinstance(error, TimeoutError):
+        return True
+    if not isinstance(error, api.TwirpError):
+        return False
+    # the SIP answer decides, whatever the Twirp status it came with: 5xx is the trunk or carrier failing, others are
+    # the callee's, e.g. 486 busy, 480 no answer or 603 declined
+    sip_status_code = error.metadata.get("sip_status_code")
+    if sip_status_code and sip_status_code.isdigit():
+        return 500 <= int(sip_status_code) < 600
+    return error.code == api.TwirpErrorCode.RESOURCE_EXHAUSTED or error.status == 429 or error.status >= 500
 
 
 class OutboundCallRunnerConfig(BaseModel):
@@ -19,6 +41,7 @@ class OutboundCallRunnerConfig(BaseModel):
     participant_identity: str
     ringing_timeout: int
     max_call_duration: int
+    shutdown_step_timeout_seconds: float = 10.0
 
 
 class OutboundCallRunnerProps(BaseModel):
@@ -28,10 +51,11 @@ class OutboundCallRunnerProps(BaseModel):
     call_event_listener: CallEventListener
     call_dialer: OutboundCallDialer
     outbound_config: OutboundCallRunnerConfig
+    call_trace: CallTrace
     logger: CallLogger
 
 
-class OutboundCallRunner:
+class OutboundCallRunner(IShutdown):
     def __init__(self, props: OutboundCallRunnerProps) -> None:
         self._call_agent = props.call_agent
         self._call_room_connector = props.call_room_connector
@@ -39,9 +63,39 @@ class OutboundCallRunner:
         self._call_event_listener = props.call_event_listener
         self._call_dialer = props.call_dialer
         self._outbound_config = props.outbound_config
+        self._call_trace = props.call_trace
         self._logger = props.logger
+        self._prepared = False
+        self._log_context: Optional[LogContext] = None
+
+    @property
+    def prepared(self) -> bool:
+        return self._prepared
+
+    @contextmanager
+    def _bind_log_context(self) -> Iterator[None]:
+        # entered by each entry point, as a prewarmed runner is prepared in another task than the one it runs in; the
+        # first creates the call's context, later ones reuse it so the room and session tasks follow its phase
+        if self._log_context:
+            with use_log_context(self._log_context):
+                yield
+            return
+        with bind_log_context(
+            correlation_id=self._call_trace.correlation_id,
+            phone_number=self._outbound_config.phone_number_to,
+        ) as context:
+            self._log_context = context
+            yield
+
+    async def prepare(self) -> None:
+        """
+        Set up everything but the dial: room connected and agent session started and ready.
+        """
+        with self._bind_log_context():
+            await self._prepare()
 
-    async def _run(self):
+    async def _prepare(self) -> None:
+        set_log_phase("prepare")
         await self._call_room_connector.connect()
         await self._call_event_listener.listen_to_room(room=self._call_room_connector.room)
         await self._call_session_starter.start_session(
@@ -53,41 +107,129 @@ class OutboundCallRunner:
             session=self._call_session_starter.session,
             agent=self._call_agent,
         )
-        await self._call_dialer.dial(
-            request=sip.CreateSIPParticipantRequest(
-                room_name=self._call_room_connector.room.name,
-                sip_call_to=self._outbound_config.phone_number_to,
-                sip_number=self._outbound_config.phone_number_from,
-                sip_trunk_id=self._outbound_config.sip_trunk_id,
-                participant_identity=self._outbound_config.participant_identity,
-                ringing_timeout={"seconds": self._outbound_config.ringing_timeout},
-                max_call_duration={"seconds": self._outbound_config.max_call_duration},
-                wait_until_answered=True,
+        self._prepared = True
+
+    async def _run(self) -> dict[str, Any]:
+        if not self._prepared:
+            await self._prepare()
+        set_log_phase("dial")
+        with self._call_trace.span("dial"):
+            await self._call_dialer.dial(
+                request=sip.CreateSIPParticipantRequest(
+                    room_name=self._call_room_connector.room.name,
+                    sip_call_to=self._outbound_config.phone_number_to,
+                    sip_number=self._outbound_config.phone_number_from,
+                    sip_trunk_id=self._outbound_config.sip_trunk_id,
+                    participant_identity=self._outbound_config.participant_identity,
+                    ringing_timeout={"seconds": self._outbound_config.ringing_timeout},
+                    max_call_duration={"seconds": self._outbound_config.max_call_duration},
+                    wait_until_answered=True,
+                )
             )
-        )
+        # wait_until_answered makes the dial return once the callee picks up
+        self._call_trace.mark("answered")
+        set_log_phase("in_call")
         shutdown_event = await asyncio.wait_for(
             self._call_event_listener.wait_for_shutdown(),
             timeout=self._outbound_config.max_call_duration,
         )
-        self._logger.info("Call ended.", extra=shutdown_event)
+        self._call_trace.mark("hangup")
+        # "name" is a reserved LogRecord attribute, so the event is nested rather than spread into extra
+        self._logger.info("Call ended.", extra={"shutdown_event": shutdown_event})
+        return shutdown_event
+
+    async def _run_shutdown_step(self, name: str, step: Callable[[], Awaitable[None]], failed_steps: list[str]) -> None:
+        # a step that hangs, e.g. on a dead connection, is given up on rather than holding the call's slot
+        try:
+            await asyncio.wait_for(step(), timeout=self._outbound_config.shutdown_step_timeout_seconds)
+        except Exception as e:
+            failed_steps.append(name)
+            self._logger.warning(
+                "Failed to shutdown step.", exc_info=True, extra={"step": name, "error": str(e) or type(e).__name__}
+            )
+
+    async def _close_session_and_room(self, failed_steps: list[str]) -> None:
+        # the session's room IO still uses the room while it closes, so the room is left once it's done
+        await self._run_shutdown_step("close_session", self._call_session_starter.shutdown, failed_steps)
+        await self._run_shutdown_step("disconnect_room", self._call_room_connector.shutdown, failed_steps)
 
     async def _shutdown(self):
         logger_extra = {**self._outbound_config.model_dump()}
-        try:
-            await self._call_session_starter.shutdown()
-            await self._call_room_connector.shutdown()
-            await self._call_dialer.shutdown()
+        set_log_phase("shutdown")
+        failed_steps: list[str] = []
+        # steps that don't depend on each other run at once; the room is deleted in the background once left
+        with self._call_trace.span("shutdown"):
+            await asyncio.gather(
+                self._close_session_and_room(failed_steps),
+                self._run_shutdown_step("shutdown_dialer", self._call_dialer.shutdown, failed_steps),
+            )
+        logger_extra["teardown_seconds"] = self._call_trace.durations().get("shutdown")
+        if failed_steps:
+            self._logger.warning("Failed to shutdown.", extra={**logger_extra, "failed_steps": failed_steps})
+        else:
             self._logger.info("Successfully shutdown.", extra=logger_extra)
-        except Exception:
-            self._logger.warning("Failed to shutdown.", exc_info=True, extra=logger_extra)
 
-    async def run(self):
+    async def shutdown(self) -> None:
+        """
+        Tear down a runner that won't run, e.g. a prepared one evicted from the pool, and finish its trace so the
+        exporters get it like any call's.
+        """
+        with self._bind_log_context():
+            try:
+                await self._shutdown()
+            finally:
+                self._call_trace.finish()
+
+    def _build_record(
+        self, shutdown_event: Optional[dict[str, Any]], error: Optional[str], backend_failure: bool
+    ) -> CallRecord:
+        shutdown_event = shutdown_event or {}
+        finished_at = self._call_trace.finished_at
+        return CallRecord(
+            correlation_id=self._call_trace.correlation_id,
+            phone_number_from=self._outbound_config.phone_number_from,
+            phone_number_to=self._outbound_config.phone_number_to,
+            sip_trunk_id=self._outbound_config.sip_trunk_id,
+            outcome=CallOutcome.FAILED if error else CallOutcome.COMPLETED,
+            error=error,
+            shutdown_reason=shutdown_event.get("name"),
+            disconnect_reason=shutdown_event.get("context", {}).get("reason"),
+            backend_failure=backend_failure,
+            turn_count=self._call_event_listener.turn_count,
+            turn_latencies_seconds=self._call_event_listener.turn_latencies_seconds,
+            ttft_seconds=self._call_event_listener.ttft_seconds,
+            interruptions=self._call_event_listener.interruptions,
+            overlap_seconds=self._call_event_listener.overlap_seconds,
+            started_at_unix=self._call_trace.started_at_unix,
+            duration_seconds=finished_at - self._call_trace.started_at if finished_at is not None else None,
+            time_to_ready_seconds=self._call_session_starter.time_to_ready_seconds,
+            phase_durations=self._call_trace.durations(),
+            phase_offsets=self._call_trace.offsets(),
+        )
+
+    async def run(self) -> CallRecord:
+        with self._bind_log_context():
+            return await self._run_and_record()
+
+    async def _run_and_record(self) -> CallRecord:
         logger_extra = {**self._outbound_config.model_dump()}
+        shutdown_event: Optional[dict[str, Any]] = None
+        error: Optional[str] = None
+        backend_failure = False
         try:
             self._logger.info("Running.", extra=logger_extra)
-            await self._run()
+            shutdown_event = await self._run()
             self._logger.info("Successfully ran.", extra=logger_extra)
         except Exception as e:
-            self._logger.error("Failed to run.", extra={**logger_extra, "error": str(e)})
+            # some errors, e.g. timeouts, have no message
+            error = str(e) or type(e).__name__
+            # setup only depends on LiveKit and the model backend; once answered, the call ran on them already
+            backend_failure = not self._prepared or (not self._call_trace.has("answered") and _is_backend_error(e))
+            self._logger.error(
+                "Failed to run.", extra={**logger_extra, "error": error, "backend_failure": backend_failure}
+            )
         finally:
             await self._shutdown()
+            self._call_trace.finish()
+
+        return self._build_record(shutdown_event=shutdown_event, error=error, backend_failure=backend_failure)
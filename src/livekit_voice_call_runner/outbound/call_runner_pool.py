@@ -0,0 +1,175 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Iterator, Optional
+
+from livekit_voice_call_runner.core.ishutdown import IShutdown
+from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.model import BaseModel
+from livekit_voice_call_runner.outbound.call_runner import OutboundCallRunner
+
+OutboundCallRunnerFactory = Callable[[], OutboundCallRunner]
+
+
+class OutboundCallRunnerPoolStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    prepared: int = 0
+    prepare_failures: int = 0
+    total_prepare_seconds: float = 0.0
+    max_prepare_seconds: float = 0.0
+
+    @property
+    def mean_prepare_seconds(self) -> float:
+        return self.total_prepare_seconds / self.prepared if self.prepared else 0.0
+
+    def record_prepare(self, prepare_seconds: float) -> None:
+        self.prepared += 1
+        self.total_prepare_seconds += prepare_seconds
+        self.max_prepare_seconds = max(self.max_prepare_seconds, prepare_seconds)
+
+
+class _PoolEntry:
+    def __init__(self, create_runner: OutboundCallRunnerFactory, runner: OutboundCallRunner, preparing: asyncio.Task):
+        self.create_runner = create_runner
+        self.runner = runner
+        # resolves to the monotonic time the runner became ready, or None if preparing it failed
+        self.preparing: asyncio.Task[Optional[float]] = preparing
+
+
+class OutboundCallRunnerPool(IShutdown):
+    """
+    Prepares the next `size` calls (room connected, agent session ready) while other calls are in progress, so
+    only the dial is left on the critical path once a slot frees.
+
+    Runners are handed out in the order of `runner_factories`. A prepared runner left idle for longer than
+    `max_idle_seconds` is torn down and prepared again from its factory.
+    """
+
+    def __init__(
+        self,
+        runner_factories: Iterator[OutboundCallRunnerFactory],
+        size: int,
+        max_idle_seconds: float,
+        logger: CallLogger,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self._runner_factories = runner_factories
+        self._size = size
+        self._max_idle_seconds = max_idle_seconds
+        self._logger = logger
+        self._clock = clock
+        self._entries: deque[_PoolEntry] = deque()
+        self._background_tasks: set[asyncio.Task] = set()
+        self._sweeper: Optional[asyncio.Task] = None
+        self.stats = OutboundCallRunnerPoolStats()
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _prepare(self, runner: OutboundCallRunner) -> Optional[float]:
+        started_at = self._clock()
+        try:
+            await runner.prepare()
+        except Exception:
+            self.stats.prepare_failures += 1
+            self._logger.warning("Failed to prepare call.", exc_info=True)
+            await runner.shutdown()
+            return None
+
+        prepared_at = self._clock()
+        self.stats.record_prepare(prepare_seconds=prepared_at - started_at)
+        return prepared_at
+
+    def _start_entry(self, create_runner: OutboundCallRunnerFactory) -> _PoolEntry:
+        runner = create_runner()
+        return _PoolEntry(
+            create_runner=create_runner,
+            runner=runner,
+            preparing=asyncio.create_task(self._prepare(runner=runner)),
+        )
+
+    def _fill(self) -> None:
+        while len(self._entries) < self._size:
+            create_runner = next(self._runner_factories, None)
+            if create_runner is None:
+                return
+            self._entries.append(self._start_entry(create_runner=create_runner))
+
+    def _is_stale(self, entry: _PoolEntry) -> bool:
+        if not entry.preparing.done() or entry.preparing.cancelled():
+            return False
+        prepared_at = entry.preparing.result()
+        return prepared_at is not None and self._clock() - prepared_at > self._max_idle_seconds
+
+    def _evict(self, entry: _PoolEntry) -> None:
+        self.stats.evictions += 1
+        self._spawn(entry.runner.shutdown())
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self._max_idle_seconds / 2)
+            for index, entry in enumerate(self._entries):
+                if self._is_stale(entry):
+                    self._logger.info("Evicting stale prepared call.")
+                    self._evict(entry)
+                    self._entries[index] = self._start_entry(create_runner=entry.create_runner)
+
+    def start(self) -> None:
+        self._logger.info(
+            "Starting pool.",
+            extra={"size": self._size, "max_idle_seconds": self._max_idle_seconds},
+        )
+        self._fill()
+        self._sweeper = asyncio.create_task(self._sweep())
+
+    async def acquire(self) -> Optional[OutboundCallRunner]:
+        """
+        Hand out the next runner, prepared if possible. Returns None once every factory has been consumed.
+        """
+        self._fill()
+        if not self._entries:
+            return None
+        entry = self._entries.popleft()
+        # start preparing the replacement before waiting on this one
+        self._fill()
+
+        if self._is_stale(entry):
+            self._evict(entry)
+            self.stats.misses += 1
+            return entry.create_runner()
+
+        ready = entry.preparing.done()
+        prepared_at = await entry.preparing
+        # a runner that failed to prepare is no better than one still preparing: the call sets up inline either way
+        if ready and prepared_at is not None:
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+
+        if prepared_at is None:
+            # hand out a fresh runner, which prepares itself inline and reports its own failure
+            return entry.create_runner()
+        return entry.runner
+
+    async def shutdown(self) -> None:
+        self._logger.info("Shutting down.", extra=self.stats.model_dump())
+        if self._sweeper:
+            self._sweeper.cancel()
+
+        while self._entries:
+            entry = self._entries.popleft()
+            entry.preparing.cancel()
+            self._spawn(entry.runner.shutdown())
+
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._logger.info(
+            "Successfully shut down.",
+            extra={**self.stats.model_dump(), "mean_prepare_seconds": self.stats.mean_prepare_seconds},
+        )
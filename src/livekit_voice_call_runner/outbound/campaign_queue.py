@@ -0,0 +1,342 @@
+import asyncio
+import contextlib
+import sqlite3
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Iterator, Optional
+
+from livekit_voice_call_runner.core.ishutdown import IShutdown
+from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.model import BaseModel
+from livekit_voice_call_runner.outbound.call_record import CallRecord
+
+
+class CampaignRole(str, Enum):
+    COORDINATOR = "coordinator"
+    WORKER = "worker"
+
+
+class CampaignCallState(str, Enum):
+    PENDING = "pending"
+    LEASED = "leased"
+    DONE = "done"
+    # leased `max_attempts` times without a record, e.g. because every node that took it died
+    ABANDONED = "abandoned"
+
+
+class CampaignCall(BaseModel):
+    call_id: int
+    round: int
+    instructions: str
+    phone_number_to: str
+
+
+class CampaignProgress(BaseModel):
+    pending: int = 0
+    leased: int = 0
+    done: int = 0
+    abandoned: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.pending + self.leased + self.done + self.abandoned
+
+    @property
+    def finished(self) -> bool:
+        return not self.pending and not self.leased
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS instructions (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS calls (
+    id INTEGER PRIMARY KEY,
+    round INTEGER NOT NULL,
+    instructions_id INTEGER NOT NULL REFERENCES instructions (id),
+    phone_number_to TEXT NOT NULL,
+    state TEXT NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    record TEXT
+);
+CREATE INDEX IF NOT EXISTS calls_state ON calls (state, id);
+"""
+
+
+class CampaignStore:
+    """
+    A campaign's calls in a SQLite database, the queue the coordinator fills and the runner nodes lease from.
+
+    A node leases a batch of calls for `lease_seconds` and renews the lease while they wait or run. A lease that isn't
+    renewed, because its node died or lost the database, expires and its calls are leased again, up to `max_attempts`
+    times each. Every method blocks; async callers run them in a thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        # wall-clock time, as leases are compared across hosts
+        self._clock = clock
+        # autocommit, so writes take the database lock with an explicit `BEGIN IMMEDIATE` rather than on first write
+        self._conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            # the rollback journal only relies on file locks, which a shared filesystem can provide across hosts; WAL's
+            # shared-memory index is local to one host, so a database left in WAL mode is switched back
+            self._conn.execute("PRAGMA journal_mode=DELETE")
+            self._conn.executescript(_SCHEMA)
+
+    @property
+    def lease_seconds(self) -> float:
+        return self._lease_seconds
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def create(self, instructions: list[str], phone_numbers: list[str], rounds: int) -> int:
+        """
+        Add every instructions × phone number pair once per round, unless the campaign already has calls, so a
+        restarted coordinator picks up where it left off. Returns the number of calls added.
+        """
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM calls LIMIT 1").fetchone():
+                return 0
+            instructions_ids = [
+                conn.execute("INSERT INTO instructions (text) VALUES (?)", (text,)).lastrowid for text in instructions
+            ]
+            rows = [
+                (round, instructions_id, phone_number_to, CampaignCallState.PENDING.value)
+                for round in range(rounds)
+                for instructions_id in instructions_ids
+                for phone_number_to in phone_numbers
+            ]
+            conn.executemany(
+                "INSERT INTO calls (round, instructions_id, phone_number_to, state) VALUES (?, ?, ?, ?)", rows
+            )
+            return len(rows)
+
+    def _reclaim_expired(self, conn: sqlite3.Connection, now: float) -> int:
+        abandoned = conn.execute(
+            "UPDATE calls SET state = ?, lease_owner = NULL WHERE state = ? AND lease_expires_at < ? AND attempts >= ?",
+            (CampaignCallState.ABANDONED.value, CampaignCallState.LEASED.value, now, self._max_attempts),
+        ).rowcount
+        reclaimed = conn.execute(
+            "UPDATE calls SET state = ?, lease_owner = NULL WHERE state = ? AND lease_expires_at < ?",
+            (CampaignCallState.PENDING.value, CampaignCallState.LEASED.value, now),
+        ).rowcount
+        return abandoned + reclaimed
+
+    def reclaim_expired(self) -> int:
+        """
+        Put calls whose lease expired back in the queue, or abandon them after `max_attempts` leases. Leasing does
+        this too, so a campaign completes even when the coordinator is gone.
+        """
+        with self._transaction() as conn:
+            return self._reclaim_expired(conn, now=self._clock())
+
+    def lease(self, node_id: str, limit: int) -> list[CampaignCall]:
+        now = self._clock()
+        with self._transaction() as conn:
+            self._reclaim_expired(conn, now=now)
+            rows = conn.execute(
+                "SELECT calls.id, calls.round, instructions.text, calls.phone_number_to FROM calls "
+                "JOIN instructions ON instructions.id = calls.instructions_id "
+                "WHERE calls.state = ? ORDER BY calls.id LIMIT ?",
+                (CampaignCallState.PENDING.value, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE calls SET state = ?, lease_owner = ?, lease_expires_at = ?, attempts = attempts + 1 "
+                "WHERE id = ?",
+                [(CampaignCallState.LEASED.value, node_id, now + self._lease_seconds, row[0]) for row in rows],
+            )
+        return [
+            CampaignCall(call_id=call_id, round=round, instructions=instructions, phone_number_to=phone_number_to)
+            for call_id, round, instructions, phone_number_to in rows
+        ]
+
+    def renew(self, node_id: str, call_ids: list[int]) -> int:
+        """
+        Extend the node's leases on these calls. Returns how many it still held.
+        """
+        expires_at = self._clock() + self._lease_seconds
+        with self._transaction() as conn:
+            return conn.executemany(
+                "UPDATE calls SET lease_expires_at = ? WHERE id = ? AND state = ? AND lease_owner = ?",
+                [(expires_at, call_id, CampaignCallState.LEASED.value, node_id) for call_id in call_ids],
+            ).rowcount
+
+    def release(self, node_id: str, call_ids: list[int], attempted: bool = False) -> None:
+        """
+        Hand back calls the node leased. Calls it didn't run don't count as an attempt; ones whose run failed do, and
+        are abandoned after `max_attempts`.
+        """
+        uncounted = 0 if attempted else 1
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE calls SET state = CASE WHEN attempts - ? >= ? THEN ? ELSE ? END, lease_owner = NULL, "
+                "attempts = attempts - ? WHERE id = ? AND state = ? AND lease_owner = ?",
+                [
+                    (
+                        uncounted,
+                        self._max_attempts,
+                        CampaignCallState.ABANDONED.value,
+                        CampaignCallState.PENDING.value,
+                        uncounted,
+                        call_id,
+                        CampaignCallState.LEASED.value,
+                        node_id,
+                    )
+                    for call_id in call_ids
+                ],
+            )
+
+    def complete(self, node_id: str, call_id: int, record: CallRecord) -> None:
+        # a node whose lease expired mid-call may still finish it; the first record in wins
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE calls SET state = ?, lease_owner = ?, record = ? WHERE id = ? AND state != ?",
+                (
+                    CampaignCallState.DONE.value,
+                    node_id,
+                    record.model_dump_json(),
+                    call_id,
+                    CampaignCallState.DONE.value,
+                ),
+            )
+
+    def progress(self) -> CampaignProgress:
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT state, COUNT(*) FROM calls GROUP BY state").fetchall())
+        return CampaignProgress(**counts)
+
+    def has_open_calls(self, node_id: str) -> bool:
+        """
+        Whether calls are left that the node may still get: pending ones, or ones other nodes hold and may lose.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM calls WHERE state = ? OR (state = ? AND lease_owner != ?) LIMIT 1",
+                (CampaignCallState.PENDING.value, CampaignCallState.LEASED.value, node_id),
+            ).fetchone()
+        return row is not None
+
+    def iter_records(self) -> Iterator[CallRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT record FROM calls WHERE state = ? ORDER BY id", (CampaignCallState.DONE.value,)
+            ).fetchall()
+        for (record,) in rows:
+            yield CallRecord.model_validate_json(record)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CampaignCallQueue(IShutdown):
+    """
+    A runner node's side of a campaign: leases calls from the store a batch at a time, hands them out one by one, and
+    reports their records back.
+
+    Leases of the calls waiting in the batch or running are renewed in the background, so a call may run longer than
+    `lease_seconds`. `lease` returns None once no call is left that this node may still get; while other nodes hold the
+    remaining ones it polls, and takes them over if their leases expire.
+    """
+
+    def __init__(
+        self,
+        store: CampaignStore,
+        node_id: str,
+        batch_size: int,
+        logger: CallLogger,
+        poll_interval_seconds: float = 1.0,
+    ):
+        self._store = store
+        self._node_id = node_id
+        self._batch_size = batch_size
+        self._logger = logger
+        self._poll_interval_seconds = poll_interval_seconds
+        self._batch: deque[CampaignCall] = deque()
+        # every call this node holds a lease on: waiting in the batch or running
+        self._leased: set[int] = set()
+        self._lease_lock = asyncio.Lock()
+        self._renew_task: Optional[asyncio.Task] = None
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    def start(self) -> None:
+        self._renew_task = asyncio.create_task(self._renew_forever())
+
+    async def lease(self) -> Optional[CampaignCall]:
+        # one batch at a time, however many of the node's workers run out at once
+        async with self._lease_lock:
+            while not self._batch:
+                calls = await asyncio.to_thread(self._store.lease, self._node_id, self._batch_size)
+                if calls:
+                    self._batch.extend(calls)
+                    self._leased.update(call.call_id for call in calls)
+                    self._logger.debug("Leased calls.", extra={"count": len(calls)})
+                    break
+                if not await asyncio.to_thread(self._store.has_open_calls, self._node_id):
+                    return None
+                await asyncio.sleep(self._poll_interval_seconds)
+            return self._batch.popleft()
+
+    async def complete(self, call: CampaignCall, record: CallRecord) -> None:
+        await asyncio.to_thread(self._store.complete, self._node_id, call.call_id, record)
+        self._leased.discard(call.call_id)
+
+    async def fail(self, call: CampaignCall) -> None:
+        # without a record to report, the call is leased again, on this node or another
+        await asyncio.to_thread(self._store.release, self._node_id, [call.call_id], True)
+        self._leased.discard(call.call_id)
+
+    async def _renew_forever(self) -> None:
+        # well ahead of expiry, so one slow or failed renewal doesn't lose the leases
+        while True:
+            await asyncio.sleep(self._store.lease_seconds / 3)
+            if not self._leased:
+                continue
+            call_ids = list(self._leased)
+            try:
+                renewed = await asyncio.to_thread(self._store.renew, self._node_id, call_ids)
+            except sqlite3.Error as e:
+                self._logger.warning("Failed to renew leases.", extra={"count": len(call_ids), "error": str(e)})
+                continue
+            if renewed < len(call_ids):
+                self._logger.warning("Lost leases.", extra={"count": len(call_ids) - renewed})
+
+    async def shutdown(self) -> None:
+        self._logger.info("Shutting down.", extra={"unstarted": len(self._batch)})
+        if self._renew_task:
+            self._renew_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._renew_task
+        # calls stopped mid-run keep their lease until it expires, then another node runs them again
+        unstarted = [call.call_id for call in self._batch]
+        self._batch.clear()
+        if unstarted:
+            await asyncio.to_thread(self._store.release, self._node_id, unstarted)
+            self._leased.difference_update(unstarted)
+        self._logger.info("Successfully shut down.")
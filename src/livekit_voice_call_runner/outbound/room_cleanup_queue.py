@@ -0,0 +1,104 @@
+import asyncio
+from typing import Optional
+
+from livekit import api, protocol
+
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
+from livekit_voice_call_runner.core.ishutdown import IShutdown
+from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.model import BaseModel
+
+
+class RoomCleanupStats(BaseModel):
+    deleted: int = 0
+    failed: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+
+
+class RoomCleanupQueue(IShutdown):
+    """
+    Deletes the rooms of ended calls in the background, so a call's slot is freed without waiting on the room API, and
+    the server doesn't keep every room of the run until its empty timeout.
+
+    Rooms are deleted in batches: every room queued by the time the previous batch is done, up to `batch_size`, is
+    deleted concurrently, each once the room API rate limit lets it through and within `timeout_seconds`. The API has
+    no bulk delete, but a burst of calls ending at once then goes out as one round of requests over the pooled
+    connections.
+    """
+
+    def __init__(
+        self,
+        livekit_api: api.LiveKitAPI,
+        rate_limiter: LiveKitRateLimiter,
+        logger: CallLogger,
+        batch_size: int = 50,
+        timeout_seconds: float = 10.0,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {batch_size}")
+        self._livekit_api = livekit_api
+        self._rate_limiter = rate_limiter
+        self._logger = logger
+        self._batch_size = batch_size
+        self._timeout_seconds = timeout_seconds
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = RoomCleanupStats()
+
+    def stats(self) -> RoomCleanupStats:
+        return self._stats.model_copy()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._delete_forever(), name=RoomCleanupQueue.__name__)
+
+    def enqueue(self, room_name: str) -> None:
+        self._queue.put_nowait(room_name)
+
+    async def _delete_room(self, room_name: str) -> None:
+        try:
+            await asyncio.wait_for(
+                self._livekit_api.room.delete_room(protocol.room.DeleteRoomRequest(room=room_name)),
+                timeout=self._timeout_seconds,
+            )
+        except api.TwirpError as e:
+            # e.g. closed by the server once the last participant left
+            if e.code != api.TwirpErrorCode.NOT_FOUND:
+                raise
+
+    async def _delete(self, room_name: str) -> None:
+        try:
+            await self._rate_limiter.acquire_room_api()
+            await self._delete_room(room_name)
+            self._stats.deleted += 1
+        except Exception as e:
+            self._stats.failed += 1
+            # some errors, e.g. timeouts, have no message
+            self._logger.warning(
+                "Failed to delete room.", extra={"room_name": room_name, "error": str(e) or type(e).__name__}
+            )
+
+    async def _delete_forever(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._stats.batches += 1
+            self._stats.largest_batch = max(self._stats.largest_batch, len(batch))
+            try:
+                await asyncio.gather(*(self._delete(room_name) for room_name in batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def shutdown(self) -> None:
+        if not self._task:
+            return
+        # the rooms of the last calls are still deleted, each within its timeout
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
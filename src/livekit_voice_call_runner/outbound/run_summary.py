@@ -0,0 +1,145 @@
+from collections import Counter
+from typing import Any
+
+from livekit_voice_call_runner.outbound.call_record import CallRecord
+from livekit_voice_call_runner.telemetry.histogram import LatencyHistogram
+
+TIME_TO_READY = "time_to_ready"
+DIAL_TO_ANSWER = "dial_to_answer"
+TIME_TO_FIRST_AGENT_UTTERANCE = "time_to_first_agent_utterance"
+TURN_LATENCY = "turn_latency"
+REALTIME_TTFT = "realtime_ttft"
+# per answered call, the total time user and agent spoke at once
+CALL_OVERLAP = "call_overlap"
+# the call's shutdown span: session close, room disconnect and dialer shutdown
+TEARDOWN = "teardown"
+# sampled by the process's event loop monitor rather than per call
+EVENT_LOOP_LAG = "event_loop_lag"
+LATENCY_NAMES = [
+    TIME_TO_READY,
+    DIAL_TO_ANSWER,
+    TIME_TO_FIRST_AGENT_UTTERANCE,
+    TURN_LATENCY,
+    REALTIME_TTFT,
+    CALL_OVERLAP,
+    TEARDOWN,
+    EVENT_LOOP_LAG,
+]
+
+
+class RunSummary:
+    """
+    Outcome counts and latency histograms of a run, updated incrementally as calls finish.
+
+    Summaries are mergeable, so shards of a run (processes, nodes) can each keep one and combine them at the end.
+    """
+
+    def __init__(self):
+        self.outcomes: Counter[str] = Counter()
+        self.disconnect_reasons: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.interruptions = 0
+        self.slow_callbacks = 0
+        self.latencies = {name: LatencyHistogram() for name in LATENCY_NAMES}
+
+    @property
+    def calls(self) -> int:
+        return sum(self.outcomes.values())
+
+    def record(self, record: CallRecord) -> None:
+        self.outcomes[record.outcome.value] += 1
+        if record.error:
+            self.errors[record.error] += 1
+        else:
+            self.disconnect_reasons[record.disconnect_reason or record.shutdown_reason or "UNKNOWN"] += 1
+
+        if record.time_to_ready_seconds is not None:
+            self.latencies[TIME_TO_READY].record(record.time_to_ready_seconds)
+        # the dial only returns once the callee has picked up; time queued for the trunk's rate limit isn't ringing
+        if "dial" in record.phase_durations and "answered" in record.phase_offsets:
+            self.latencies[DIAL_TO_ANSWER].record(
+                record.phase_durations["dial"] - record.phase_durations.get("dial_rate_limit_wait", 0.0)
+            )
+        if "answered" in record.phase_offsets and "first_agent_utterance" in record.phase_offsets:
+            self.latencies[TIME_TO_FIRST_AGENT_UTTERANCE].record(
+                record.phase_offsets["first_agent_utterance"] - record.phase_offsets["answered"]
+            )
+        for latency in record.turn_latencies_seconds:
+            self.latencies[TURN_LATENCY].record(latency)
+        for latency in record.ttft_seconds:
+            self.latencies[REALTIME_TTFT].record(latency)
+        if "answered" in record.phase_offsets:
+            self.latencies[CALL_OVERLAP].record(record.overlap_seconds)
+        if "shutdown" in record.phase_durations:
+            self.latencies[TEARDOWN].record(record.phase_durations["shutdown"])
+        self.interruptions += record.interruptions
+
+    def record_event_loop_lag(self, histogram: LatencyHistogram, slow_callbacks: int) -> None:
+        self.latencies[EVENT_LOOP_LAG].merge(histogram)
+        self.slow_callbacks += slow_callbacks
+
+    def merge(self, other: "RunSummary") -> None:
+        self.outcomes.update(other.outcomes)
+        self.disconnect_reasons.update(other.disconnect_reasons)
+        self.errors.update(other.errors)
+        self.interruptions += other.interruptions
+        self.slow_callbacks += other.slow_callbacks
+        for name, histogram in other.latencies.items():
+            self.latencies[name].merge(histogram)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "outcomes": dict(self.outcomes),
+            "disconnect_reasons": dict(self.disconnect_reasons),
+            "errors": dict(self.errors),
+            "interruptions": self.interruptions,
+            "slow_callbacks": self.slow_callbacks,
+            "latencies_seconds": {name: histogram.summary() for name, histogram in self.latencies.items()},
+        }
+
+    def to_mergeable_dict(self) -> dict[str, Any]:
+        """
+        Like `to_dict`, but with the full histograms, so `from_mergeable_dict` can restore a mergeable summary.
+        """
+        return {
+            "outcomes": dict(self.outcomes),
+            "disconnect_reasons": dict(self.disconnect_reasons),
+            "errors": dict(self.errors),
+            "interruptions": self.interruptions,
+            "slow_callbacks": self.slow_callbacks,
+            "latencies": {name: histogram.to_dict() for name, histogram in self.latencies.items()},
+        }
+
+    @classmethod
+    def from_mergeable_dict(cls, data: dict[str, Any]) -> "RunSummary":
+        summary = cls()
+        summary.outcomes.update(data["outcomes"])
+        summary.disconnect_reasons.update(data["disconnect_reasons"])
+        summary.errors.update(data["errors"])
+        summary.interruptions = data["interruptions"]
+        summary.slow_callbacks = data["slow_callbacks"]
+        for name, histogram in data["latencies"].items():
+            summary.latencies[name] = LatencyHistogram.from_dict(histogram)
+        return summary
+
+    def format(self) -> str:
+        lines = [f"Calls: {self.calls} ({', '.join(f'{k}: {v}' for k, v in sorted(self.outcomes.items())) or '-'})"]
+        if self.disconnect_reasons:
+            lines.append("Disconnect reasons:")
+            lines.extend(f"  {reason}: {count}" for reason, count in self.disconnect_reasons.most_common())
+        if self.errors:
+            lines.append("Errors:")
+            lines.extend(f"  {error}: {count}" for error, count in self.errors.most_common())
+        lines.append(f"Interruptions: {self.interruptions}")
+        lines.append(f"Event loop stalls: {self.slow_callbacks}")
+
+        lines.append(f"{'Latency (s)':<32}{'count':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+        for name, histogram in self.latencies.items():
+            stats = histogram.summary()
+            values = "".join(
+                f"{stats[key]:>10.3f}" if stats[key] is not None else f"{'-':>10}"
+                for key in ["p50", "p90", "p99", "max"]
+            )
+            lines.append(f"{name:<32}{histogram.count:>8}{values}")
+        return "\n".join(lines)
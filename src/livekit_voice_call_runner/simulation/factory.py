@@ -0,0 +1,166 @@
+from typing import Optional
+
+from livekit import api
+
+from livekit_voice_call_runner import factory
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
+from livekit_voice_call_runner.config.base import (
+    Config,
+    ConfigCallSession,
+    ConfigCallSessionLLM,
+    ConfigCallSessionLLMPrewarm,
+    ConfigCallSessionTurnDetection,
+    ConfigLiveKit,
+    ConfigLiveKitHttp,
+    ConfigRateLimit,
+    ConfigRateLimits,
+    ConfigRoomConnector,
+)
+from livekit_voice_call_runner.config.outbound import ConfigAdaptiveConcurrency, OutboundConfig
+from livekit_voice_call_runner.core.call_session_starter import CallSessionStarter
+from livekit_voice_call_runner.core.call_transcript_sink import CallTranscriptSink
+from livekit_voice_call_runner.logger import create_logger
+from livekit_voice_call_runner.model import CallSessionStarterConfigRealtime
+from livekit_voice_call_runner.outbound.call_dialer import OutboundCallDialer
+from livekit_voice_call_runner.outbound.call_room_connector import OutboundCallRoomConnector
+from livekit_voice_call_runner.outbound.call_runner import (
+    OutboundCallRunner,
+    OutboundCallRunnerConfig,
+    OutboundCallRunnerProps,
+)
+from livekit_voice_call_runner.outbound.room_cleanup_queue import RoomCleanupQueue
+from livekit_voice_call_runner.simulation.fake_livekit import FakeLiveKitServer, SimulatedCallRoomConnector
+from livekit_voice_call_runner.simulation.fake_session import ScriptedConversation, SimulatedCallSessionStarter
+from livekit_voice_call_runner.telemetry.tracing import CallTrace, CallTracer
+
+
+def create_simulation_config() -> Config:
+    """
+    Config with placeholder credentials; nothing in a simulation connects anywhere.
+    """
+    return Config(
+        livekit_api=ConfigLiveKit(
+            url="ws://simulated",
+            api_key="simulated-api-key",
+            api_secret="simulated-api-secret",
+            room_name_prefix="simulated",
+        ),
+        livekit_http=ConfigLiveKitHttp(pool_size=None, keepalive_seconds=30.0, timeout_seconds=10.0),
+        rate_limits=ConfigRateLimits(
+            room_api=ConfigRateLimit(rate_per_second=None, burst=1),
+            sip_api=ConfigRateLimit(rate_per_second=None, burst=1),
+        ),
+        call_session=ConfigCallSession(
+            llm=ConfigCallSessionLLM(
+                azure_deployment="simulated",
+                api_version="simulated",
+                api_key="simulated",
+                azure_endpoint="http://simulated",
+                voice="alloy",
+                temperature=0.8,
+            ),
+            llm_prewarm=ConfigCallSessionLLMPrewarm(connections=0, max_idle_seconds=60.0),
+            turn_detection=ConfigCallSessionTurnDetection(
+                type="server_vad",
+                threshold=0.5,
+                prefix_padding_ms=300,
+                silence_duration_ms=500,
+                create_response=True,
+                interrupt_response=True,
+            ),
+            user_away_timeout=15.0,
+            use_tts_aligned_transcript=False,
+            preemptive_generation=False,
+            agent_ready_timeout_seconds=30.0,
+        ),
+        room_connector=ConfigRoomConnector(participant_identity="agent"),
+    )
+
+
+def create_simulation_outbound_config() -> OutboundConfig:
+    return OutboundConfig(
+        sip_trunk_id="ST_simulated",
+        phone_number_from="+10000000000",
+        participant_identity="callee",
+        ringing_timeout=30,
+        max_call_duration=3600,
+        sip_trunk_rate_limit=ConfigRateLimit(rate_per_second=None, burst=1),
+        adaptive_concurrency=ConfigAdaptiveConcurrency(
+            min_limit=1,
+            initial_limit=None,
+            window_size=20,
+            max_error_rate=0.05,
+            max_setup_latency_seconds=5.0,
+            increase_step=1,
+            decrease_factor=0.5,
+        ),
+    )
+
+
+def create_simulated_call_session_starter(
+    server: FakeLiveKitServer, cfg: Config, call_trace: CallTrace
+) -> CallSessionStarter:
+    return SimulatedCallSessionStarter(
+        conversation=ScriptedConversation(server=server),
+        config=CallSessionStarterConfigRealtime(
+            llm=None,
+            user_away_timeout=cfg.call_session.user_away_timeout,
+            use_tts_aligned_transcript=cfg.call_session.use_tts_aligned_transcript,
+            preemptive_generation=cfg.call_session.preemptive_generation,
+        ),
+        agent_ready_timeout_seconds=cfg.call_session.agent_ready_timeout_seconds,
+        call_trace=call_trace,
+        logger=create_logger(name=CallSessionStarter.__name__),
+    )
+
+
+def create_simulated_call_runner_props(
+    server: FakeLiveKitServer,
+    instructions: str,
+    phone_number_to: str,
+    correlation_id: str,
+    cfg: Config,
+    outbound_cfg: OutboundConfig,
+    livekit_api: api.LiveKitAPI,
+    rate_limiter: LiveKitRateLimiter,
+    tracer: CallTracer,
+    transcript_sink: Optional[CallTranscriptSink] = None,
+    room_cleanup_queue: Optional[RoomCleanupQueue] = None,
+) -> OutboundCallRunnerProps:
+    """
+    Same components as `factory.create_call_runner_props`, with the room and the session played by `server`.
+    """
+    call_trace = tracer.start_trace(correlation_id=correlation_id)
+    return OutboundCallRunnerProps(
+        call_agent=factory.create_call_agent(instructions=instructions),
+        call_room_connector=SimulatedCallRoomConnector(
+            server=server,
+            participant_identity=cfg.room_connector.participant_identity,
+            room_name_prefix=cfg.livekit_api.room_name_prefix,
+            livekit_url=cfg.livekit_api.url,
+            livekit_api=livekit_api,
+            rate_limiter=rate_limiter,
+            call_trace=call_trace,
+            logger=create_logger(name=OutboundCallRoomConnector.__name__),
+            room_cleanup_queue=room_cleanup_queue,
+        ),
+        call_session_starter=create_simulated_call_session_starter(server=server, cfg=cfg, call_trace=call_trace),
+        call_event_listener=factory.create_call_event_listener(call_trace=call_trace, transcript_sink=transcript_sink),
+        call_dialer=OutboundCallDialer(
+            livekit_api=livekit_api,
+            rate_limiter=rate_limiter,
+            call_trace=call_trace,
+            logger=create_logger(name=OutboundCallDialer.__name__),
+        ),
+        outbound_config=OutboundCallRunnerConfig(
+            phone_number_from=outbound_cfg.phone_number_from,
+            phone_number_to=phone_number_to,
+            sip_trunk_id=outbound_cfg.sip_trunk_id,
+            participant_identity=outbound_cfg.participant_identity,
+            ringing_timeout=outbound_cfg.ringing_timeout,
+            max_call_duration=outbound_cfg.max_call_duration,
+            shutdown_step_timeout_seconds=outbound_cfg.shutdown_step_timeout_seconds,
+        ),
+        call_trace=call_trace,
+        logger=create_logger(name=OutboundCallRunner.__name__),
+    )
@@ -0,0 +1,210 @@
+import asyncio
+import random
+from typing import Optional
+
+from livekit import api, protocol, rtc
+from livekit.protocol import sip
+from pydantic import Field
+
+from livekit_voice_call_runner.livekit import disconnect_reason_mapper
+from livekit_voice_call_runner.model import BaseModel, CallRoom
+from livekit_voice_call_runner.outbound.call_room_connector import OutboundCallRoomConnector
+
+
+class SimulationProfile(BaseModel):
+    """
+    Latencies (mean seconds, spread by +/- `jitter_ratio`), failure rates and disconnect reasons of simulated calls.
+
+    `time_scale` multiplies every latency, e.g. 0.01 plays a 10s call in 100ms.
+    """
+
+    create_room_seconds: float = 0.05
+    connect_room_seconds: float = 0.1
+    agent_start_seconds: float = 0.3
+    # ringing until the callee picks up
+    dial_seconds: float = 3.0
+    call_seconds: float = 20.0
+    user_turn_seconds: float = 2.0
+    agent_response_seconds: float = 0.8
+    agent_turn_seconds: float = 3.0
+    jitter_ratio: float = 0.2
+    time_scale: float = 1.0
+    # probability of each failure reason when dialing, e.g. {"USER_UNAVAILABLE": 0.05}
+    dial_failure_rates: dict[str, float] = Field(default_factory=dict)
+    # relative weights of the reason the callee hangs up with
+    hangup_reasons: dict[str, float] = Field(default_factory=lambda: {"CLIENT_INITIATED": 1.0})
+    seed: Optional[int] = None
+
+
+class FakeRemoteParticipant:
+    def __init__(self, identity: str):
+        self.identity = identity
+        self.disconnect_reason: Optional[rtc.DisconnectReason] = None
+
+
+class FakeLiveKitServer:
+    """
+    In-process stand-in for a LiveKit project: rooms, SIP calls and the callers in them, driven by a profile.
+    """
+
+    def __init__(self, profile: Optional[SimulationProfile] = None):
+        self.profile = profile or SimulationProfile()
+        self.rooms: dict[str, "FakeCallRoom"] = {}
+        self.rooms_created = 0
+        self.rooms_deleted = 0
+        self.calls_dialed = 0
+        self.calls_failed = 0
+        self.calls_answered = 0
+        self.calls_hung_up = 0
+        self._rng = random.Random(self.profile.seed)
+        self._tasks: set[asyncio.Task] = set()
+
+    def sample_seconds(self, mean_seconds: float) -> float:
+        jitter = mean_seconds * self.profile.jitter_ratio
+        return max(self._rng.uniform(mean_seconds - jitter, mean_seconds + jitter), 0.0) * self.profile.time_scale
+
+    async def sleep(self, mean_seconds: float) -> None:
+        await asyncio.sleep(self.sample_seconds(mean_seconds))
+
+    def sample_dial_failure(self) -> Optional[str]:
+        draw = self._rng.random()
+        for reason, rate in self.profile.dial_failure_rates.items():
+            if draw < rate:
+                return reason
+            draw -= rate
+        return None
+
+    def sample_hangup_reason(self) -> str:
+        reasons = self.profile.hangup_reasons
+        return self._rng.choices(list(reasons), weights=list(reasons.values()))[0]
+
+    def admit_caller(self, room: "FakeCallRoom", identity: str) -> None:
+        """
+        Join a caller to the room now and hang up after a sampled call duration.
+        """
+        participant = FakeRemoteParticipant(identity=identity)
+        self.calls_answered += 1
+        room.join(participant)
+        task = asyncio.create_task(self._hang_up_later(room=room, participant=participant))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _hang_up_later(self, room: "FakeCallRoom", participant: FakeRemoteParticipant) -> None:
+        await self.sleep(self.profile.call_seconds)
+        participant.disconnect_reason = disconnect_reason_mapper.map_from_name(self.sample_hangup_reason())
+        self.calls_hung_up += 1
+        room.leave(participant)
+
+    async def aclose(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class FakeCallRoom(CallRoom):
+    """
+    `rtc.Room` without a connection: participants join and leave through the server, events are emitted in-process.
+    """
+
+    def __init__(self, name: str, server: FakeLiveKitServer):
+        super().__init__(name=name)
+        self._server = server
+        self._connected = False
+        self.participant_joined = asyncio.Event()
+
+    def isconnected(self) -> bool:
+        return self._connected
+
+    async def connect(self, url: str, token: str, options: Optional[rtc.RoomOptions] = None) -> None:  # type: ignore
+        await self._server.sleep(self._server.profile.connect_room_seconds)
+        self._connected = True
+        self._server.rooms[self.name] = self
+
+    async def disconnect(self) -> None:
+        self._connected = False
+        self._server.rooms.pop(self.name, None)
+
+    def join(self, participant: FakeRemoteParticipant) -> None:
+        self.participant_joined.set()
+        self.emit("participant_connected", participant)
+
+    def leave(self, participant: FakeRemoteParticipant) -> None:
+        if self._connected:
+            self.emit("participant_disconnected", participant)
+
+
+class SimulatedCallRoomConnector(OutboundCallRoomConnector):
+    def __init__(self, server: FakeLiveKitServer, **kwargs):
+        super().__init__(**kwargs)
+        self._server = server
+
+    def _new_room(self, name: str) -> CallRoom:
+        return FakeCallRoom(name=name, server=self._server)
+
+
+class FakeRoomService:
+    def __init__(self, server: FakeLiveKitServer):
+        self._server = server
+        self.api_key = "simulated-api-key"
+        self.api_secret = "simulated-api-secret"
+
+    async def create_room(self, create: protocol.room.CreateRoomRequest) -> protocol.models.Room:
+        await self._server.sleep(self._server.profile.create_room_seconds)
+        self._server.rooms_created += 1
+        return protocol.models.Room(name=create.name)
+
+    async def delete_room(self, delete: protocol.room.DeleteRoomRequest) -> protocol.room.DeleteRoomResponse:
+        await self._server.sleep(self._server.profile.create_room_seconds)
+        self._server.rooms_deleted += 1
+        return protocol.room.DeleteRoomResponse()
+
+
+class FakeSipService:
+    def __init__(self, server: FakeLiveKitServer):
+        self._server = server
+
+    async def create_sip_participant(self, create: sip.CreateSIPParticipantRequest) -> api.SIPParticipantInfo:
+        self._server.calls_dialed += 1
+        await self._server.sleep(self._server.profile.dial_seconds)
+
+        failure = self._server.sample_dial_failure()
+        if failure:
+            self._server.calls_failed += 1
+            raise api.TwirpError("unavailable", failure, status=503)
+
+        room = self._server.rooms.get(create.room_name)
+        if room is None:
+            raise api.TwirpError("not_found", "requested room does not exist", status=404)
+        self._server.admit_caller(room=room, identity=create.participant_identity)
+        return api.SIPParticipantInfo(
+            participant_identity=create.participant_identity,
+            room_name=create.room_name,
+            sip_call_id=f"SCL_{self._server.calls_dialed}",
+        )
+
+
+class FakeLiveKitAPI:
+    """
+    Implements the parts of `api.LiveKitAPI` the runner uses.
+    """
+
+    def __init__(self, server: FakeLiveKitServer):
+        self.room = FakeRoomService(server=server)
+        self.sip = FakeSipService(server=server)
+
+    async def aclose(self) -> None: ...
+
+
+class FakeJobContext:
+    """
+    Implements the parts of `JobContext` the inbound worker uses; the caller joins once the agent connects.
+    """
+
+    def __init__(self, server: FakeLiveKitServer, room_name: str, caller_identity: str = "caller"):
+        self.room = FakeCallRoom(name=room_name, server=server)
+        self._server = server
+        self._caller_identity = caller_identity
+
+    async def connect(self) -> None:
+        await self.room.connect(url="simulated", token="simulated")
+        self._server.admit_caller(room=self.room, identity=self._caller_identity)
@@ -0,0 +1,130 @@
+import asyncio
+import itertools
+import time
+from typing import Any, Optional
+
+from livekit import rtc
+from livekit.agents import (
+    AgentSession,
+    AgentStateChangedEvent,
+    ChatMessage,
+    ConversationItemAddedEvent,
+    MetricsCollectedEvent,
+    UserStateChangedEvent,
+)
+from livekit.agents.metrics import RealtimeModelMetrics
+
+from livekit_voice_call_runner.core.call_session_starter import CallSessionStarter
+from livekit_voice_call_runner.logger import CallLogger
+from livekit_voice_call_runner.model import CallSessionStarterConfigRealtime
+from livekit_voice_call_runner.simulation.fake_livekit import FakeCallRoom, FakeLiveKitServer
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
+
+_DEFAULT_USER_LINES = ["Hello?", "Yes, speaking.", "Sure, go ahead.", "Thanks, bye."]
+_DEFAULT_AGENT_LINES = ["Hi, this is a test call.", "Great, thanks.", "That's all I needed.", "Goodbye!"]
+
+
+class ScriptedConversation:
+    """
+    Lines user and agent take turns on in a `ScriptedAgentSession`, replayed with the server's latencies.
+    """
+
+    def __init__(
+        self,
+        server: FakeLiveKitServer,
+        user_lines: Optional[list[str]] = None,
+        agent_lines: Optional[list[str]] = None,
+    ):
+        self.server = server
+        self.user_lines = user_lines or _DEFAULT_USER_LINES
+        self.agent_lines = agent_lines or _DEFAULT_AGENT_LINES
+
+
+class ScriptedAgentSession(rtc.EventEmitter):
+    """
+    Implements the parts of `AgentSession` the runner uses. Once a caller joins, user and agent take turns, emitting
+    the same state and conversation events as a live session, until the session is closed.
+    """
+
+    def __init__(self, conversation: ScriptedConversation):
+        super().__init__()
+        self._script = conversation
+        self._server = conversation.server
+        self.agent_state = "initializing"
+        self.user_state = "listening"
+        self._conversation: Optional[asyncio.Task] = None
+
+    def _set_agent_state(self, state: str) -> None:
+        event = AgentStateChangedEvent(old_state=self.agent_state, new_state=state)  # type: ignore
+        self.agent_state = state
+        self.emit("agent_state_changed", event)
+
+    def _set_user_state(self, state: str) -> None:
+        event = UserStateChangedEvent(old_state=self.user_state, new_state=state)  # type: ignore
+        self.user_state = state
+        self.emit("user_state_changed", event)
+
+    def _add_message(self, role: str, text: str) -> None:
+        item = ChatMessage(role=role, content=[text])  # type: ignore
+        self.emit("conversation_item_added", ConversationItemAddedEvent(item=item))
+
+    def _report_response(self, created_at: float) -> None:
+        metrics = RealtimeModelMetrics(
+            request_id=f"response-{id(self)}-{created_at}",
+            timestamp=created_at,
+            ttft=time.time() - created_at,
+            input_token_details=RealtimeModelMetrics.InputTokenDetails(),
+            output_token_details=RealtimeModelMetrics.OutputTokenDetails(),
+        )
+        self.emit("metrics_collected", MetricsCollectedEvent(metrics=metrics))
+
+    async def start(self, room: rtc.Room, **kwargs: Any) -> None:
+        await self._server.sleep(self._server.profile.agent_start_seconds)
+        self._set_agent_state("listening")
+        if isinstance(room, FakeCallRoom):
+            self._conversation = asyncio.create_task(self._converse(room=room))
+
+    async def _converse(self, room: FakeCallRoom) -> None:
+        profile = self._server.profile
+        await room.participant_joined.wait()
+        lines = zip(itertools.cycle(self._script.user_lines), itertools.cycle(self._script.agent_lines))
+        for user_line, agent_line in lines:
+            self._set_user_state("speaking")
+            await self._server.sleep(profile.user_turn_seconds)
+            self._set_user_state("listening")
+            self._add_message(role="user", text=user_line)
+            self._set_agent_state("thinking")
+            response_created_at = time.time()
+            await self._server.sleep(profile.agent_response_seconds)
+            self._set_agent_state("speaking")
+            self._report_response(created_at=response_created_at)
+            self._add_message(role="assistant", text=agent_line)
+            await self._server.sleep(profile.agent_turn_seconds)
+            self._set_agent_state("listening")
+
+    async def aclose(self) -> None:
+        if self._conversation:
+            self._conversation.cancel()
+            await asyncio.gather(self._conversation, return_exceptions=True)
+
+
+class SimulatedCallSessionStarter(CallSessionStarter):
+    """
+    Starts a `ScriptedAgentSession` playing `conversation` instead of an `AgentSession`, so no model is configured.
+    """
+
+    def __init__(
+        self,
+        conversation: ScriptedConversation,
+        config: CallSessionStarterConfigRealtime,
+        agent_ready_timeout_seconds: float,
+        call_trace: CallTrace,
+        logger: CallLogger,
+    ):
+        super().__init__(
+            config=config, agent_ready_timeout_seconds=agent_ready_timeout_seconds, call_trace=call_trace, logger=logger
+        )
+        self._conversation = conversation
+
+    def _create_session(self) -> AgentSession:
+        return ScriptedAgentSession(conversation=self._conversation)  # type: ignore
@@ -0,0 +1,191 @@
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import time
+from typing import Any, Optional
+
+from livekit_voice_call_runner import factory
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
+from livekit_voice_call_runner.concurrency.tasks_runner import ConcurrentTasksRunner
+from livekit_voice_call_runner.config.base import get_logging_config
+from livekit_voice_call_runner.inbound import worker
+from livekit_voice_call_runner.logger import create_logger
+from livekit_voice_call_runner.model import BaseModel
+from livekit_voice_call_runner.outbound.call_orchestrator import OutboundCallOrchestrator, OutboundCallScheduler
+from livekit_voice_call_runner.simulation.factory import (
+    create_simulated_call_runner_props,
+    create_simulated_call_session_starter,
+    create_simulation_config,
+    create_simulation_outbound_config,
+)
+from livekit_voice_call_runner.simulation.fake_livekit import (
+    FakeJobContext,
+    FakeLiveKitAPI,
+    FakeLiveKitServer,
+    SimulationProfile,
+)
+from livekit_voice_call_runner.telemetry.loop_monitor import get_event_loop_monitor, shutdown_event_loop_monitor
+from livekit_voice_call_runner.telemetry.profiler import ProfileMode
+from livekit_voice_call_runner.telemetry.tracing import CallTracer
+
+_INSTRUCTIONS = "You are a simulated agent."
+
+
+class SimulationResult(BaseModel):
+    calls: int
+    concurrency: int
+    wall_seconds: float
+    calls_per_second: float
+    rooms_created: int
+    rooms_deleted: int
+    calls_dialed: int
+    calls_failed: int
+    calls_answered: int
+    calls_hung_up: int
+    summary: Optional[dict[str, Any]] = None
+    profile: Optional[dict[str, Any]] = None
+
+
+def _create_result(server: FakeLiveKitServer, calls: int, concurrency: int, wall_seconds: float) -> SimulationResult:
+    return SimulationResult(
+        calls=calls,
+        concurrency=concurrency,
+        wall_seconds=wall_seconds,
+        calls_per_second=calls / wall_seconds if wall_seconds else 0.0,
+        rooms_created=server.rooms_created,
+        rooms_deleted=server.rooms_deleted,
+        calls_dialed=server.calls_dialed,
+        calls_failed=server.calls_failed,
+        calls_answered=server.calls_answered,
+        calls_hung_up=server.calls_hung_up,
+    )
+
+
+async def simulate_outbound(
+    calls: int,
+    concurrency: int,
+    profile: Optional[SimulationProfile] = None,
+    scheduler: OutboundCallScheduler = OutboundCallScheduler.STREAMING,
+) -> SimulationResult:
+    """
+    Run `calls` outbound calls through `OutboundCallOrchestrator` against a fake LiveKit server.
+    """
+    server = FakeLiveKitServer(profile=profile)
+    tracer = CallTracer()
+    orchestrator = OutboundCallOrchestrator(
+        instructions=[_INSTRUCTIONS],
+        phone_numbers=[f"+1555{i:07d}" for i in range(calls)],
+        concurrency=concurrency,
+        rounds=1,
+        concurrent_tasks_runner=ConcurrentTasksRunner(logger=create_logger(name="ConcurrentTasksRunner")),
+        logger=create_logger(name="OutboundCallOrchestrator"),
+        cfg=create_simulation_config(),
+        outbound_cfg=create_simulation_outbound_config(),
+        livekit_api=FakeLiveKitAPI(server=server),  # type: ignore
+        rate_limiter=LiveKitRateLimiter(),
+        tracer=tracer,
+        scheduler=scheduler,
+        transcript_sink=factory.create_call_transcript_sink(directory=get_logging_config().transcript.directory),
+        call_runner_props_factory=functools.partial(create_simulated_call_runner_props, server=server),
+        event_loop_monitor=get_event_loop_monitor(),
+    )
+
+    started_at = time.perf_counter()
+    try:
+        await orchestrator.run()
+    finally:
+        await server.aclose()
+        tracer.shutdown()
+        await shutdown_event_loop_monitor()
+
+    wall_seconds = time.perf_counter() - started_at
+    result = _create_result(
+        server=server, calls=orchestrator.summary.calls, concurrency=concurrency, wall_seconds=wall_seconds
+    )
+    result.summary = orchestrator.summary.to_dict()
+    return result
+
+
+async def simulate_inbound(
+    calls: int,
+    concurrency: int,
+    profile: Optional[SimulationProfile] = None,
+) -> SimulationResult:
+    """
+    Run `calls` inbound calls through `inbound.worker.handle`, `concurrency` at a time, against a fake LiveKit server.
+    """
+    server = FakeLiveKitServer(profile=profile)
+    cfg = create_simulation_config()
+    call_session_starter_factory = functools.partial(create_simulated_call_session_starter, server=server)
+    tasks = (
+        worker.handle(
+            ctx=FakeJobContext(server=server, room_name=f"simulated-inbound-{i}"),  # type: ignore
+            instructions=_INSTRUCTIONS,
+            cfg=cfg,
+            call_session_starter_factory=call_session_starter_factory,
+        )
+        for i in range(calls)
+    )
+
+    started_at = time.perf_counter()
+    try:
+        await ConcurrentTasksRunner(logger=create_logger(name="ConcurrentTasksRunner")).run_stream(
+            tasks=tasks, concurrency=concurrency
+        )
+    finally:
+        await server.aclose()
+        await shutdown_event_loop_monitor()
+
+    wall_seconds = time.perf_counter() - started_at
+    return _create_result(server=server, calls=calls, concurrency=concurrency, wall_seconds=wall_seconds)
+
+
+async def _simulate(args, profile: SimulationProfile) -> SimulationResult:
+    profiler = factory.create_run_profiler(mode=args.profile, path=args.profile_path)
+    if profiler:
+        profiler.start()
+    try:
+        if args.direction == "outbound":
+            result = await simulate_outbound(calls=args.calls, concurrency=args.concurrency, profile=profile)
+        else:
+            result = await simulate_inbound(calls=args.calls, concurrency=args.concurrency, profile=profile)
+    finally:
+        report = profiler.stop() if profiler else None
+    result.profile = report.model_dump(mode="json") if report else None
+    return result
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(prog="livekit_voice_call_runner.simulation.simulator")
+    parser.add_argument("--direction", choices=["outbound", "inbound"], default="outbound")
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0.01,
+        help="Multiplier applied to every simulated latency (default: 0.01, i.e. 100x faster than real time).",
+    )
+    parser.add_argument("--dial-failure-rate", type=float, default=0.0, help="Probability of a SIP_TRUNK_FAILURE.")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--verbose", action="store_true", help="Keep info logs of every simulated call.")
+    parser.add_argument("--profile", choices=list(ProfileMode), type=ProfileMode, help="Profile the simulation.")
+    parser.add_argument("--profile-path", default="profile", help="Where --profile writes.")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    profile = SimulationProfile(
+        time_scale=args.time_scale,
+        dial_failure_rates={"SIP_TRUNK_FAILURE": args.dial_failure_rate} if args.dial_failure_rate else {},
+        seed=args.seed,
+    )
+    result = asyncio.run(_simulate(args, profile=profile))
+    print(json.dumps(result.model_dump(), indent=2))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,141 @@
+import math
+from typing import Any, Optional, Sequence
+
+
+def sample_percentile(values: Sequence[float], percentile: float) -> Optional[float]:
+    """
+    Exact nearest-rank percentile (0-100) of a small sample, e.g. one call's turns; None when it's empty.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percentile / 100 * len(ordered)), 1) - 1]
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory, mergeable latency histogram with HDR-style log-linear buckets.
+
+    Values are recorded in whole `unit_seconds` (microseconds by default). Values below `2 ** sub_bucket_bits` units
+    get one bucket each; above that, every power of two is split into `2 ** (sub_bucket_bits - 1)` buckets, so the
+    relative error stays below `2 ** (1 - sub_bucket_bits)` (< 1% with the default 8 bits) across the whole range.
+    Values above `max_value_seconds` are clamped into the last bucket, while `max` keeps the exact value.
+
+    Histograms with the same configuration can be merged, e.g. across processes or nodes, without losing accuracy.
+    """
+
+    def __init__(self, max_value_seconds: float = 3600.0, unit_seconds: float = 1e-6, sub_bucket_bits: int = 8):
+        self._max_value_seconds = max_value_seconds
+        self._unit_seconds = unit_seconds
+        self._sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_half_count = 1 << (sub_bucket_bits - 1)
+        self._max_value = max(int(max_value_seconds / unit_seconds), 1)
+        self._counts = [0] * (self._get_index(self._max_value) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._sum / self._count if self._count else None
+
+    def _get_config(self) -> dict[str, Any]:
+        return {
+            "max_value_seconds": self._max_value_seconds,
+            "unit_seconds": self._unit_seconds,
+            "sub_bucket_bits": self._sub_bucket_bits,
+        }
+
+    def _get_index(self, value: int) -> int:
+        shift = max(value.bit_length() - self._sub_bucket_bits, 0)
+        return shift * self._sub_bucket_half_count + (value >> shift)
+
+    def _get_highest_equivalent_value(self, index: int) -> int:
+        shift = max((index >> (self._sub_bucket_bits - 1)) - 1, 0)
+        sub_bucket = index - shift * self._sub_bucket_half_count
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value_seconds: float) -> None:
+        value_seconds = max(value_seconds, 0.0)
+        value = min(int(value_seconds / self._unit_seconds), self._max_value)
+        self._counts[self._get_index(value)] += 1
+        self._count += 1
+        self._sum += value_seconds
+        self._min = value_seconds if self._min is None else min(self._min, value_seconds)
+        self._max = value_seconds if self._max is None else max(self._max, value_seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Highest value, in seconds, of the bucket holding the given percentile (0-100), capped at the observed max.
+        """
+        if not self._count:
+            return None
+        assert self._max is not None
+        target = max(math.ceil(percentile / 100 * self._count), 1)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(self._get_highest_equivalent_value(index) * self._unit_seconds, self._max)
+        return self._max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if self._get_config() != other._get_config():
+            raise ValueError("Cannot merge histograms with different configurations")
+        for index, count in enumerate(other._counts):
+            self._counts[index] += count
+        self._count += other._count
+        self._sum += other._sum
+        if other._min is not None:
+            self._min = other._min if self._min is None else min(self._min, other._min)
+        if other._max is not None:
+            self._max = other._max if self._max is None else max(self._max, other._max)
+
+    def summary(self, percentiles: tuple[float, ...] = (50, 90, 99)) -> dict[str, Optional[float]]:
+        return {
+            "count": self._count,
+            **{f"p{percentile:g}": self.percentile(percentile) for percentile in percentiles},
+            "max": self._max,
+            "mean": self.mean,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serializable form that keeps only non-empty buckets; `from_dict` restores a mergeable histogram.
+        """
+        return {
+            **self._get_config(),
+            "count": self._count,
+            "sum": self._sum,
+            "min": self._min,
+            "max": self._max,
+            "buckets": {str(index): count for index, count in enumerate(self._counts) if count},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(
+            max_value_seconds=data["max_value_seconds"],
+            unit_seconds=data["unit_seconds"],
+            sub_bucket_bits=data["sub_bucket_bits"],
+        )
+        for index, count in data["buckets"].items():
+            histogram._counts[int(index)] = count
+        histogram._count = data["count"]
+        histogram._sum = data["sum"]
+        histogram._min = data["min"]
+        histogram._max = data["max"]
+        return histogram
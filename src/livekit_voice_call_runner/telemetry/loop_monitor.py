@@ -0,0 +1,217 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from livekit_voice_call_runner.config.base import get_event_loop_monitor_config
+from livekit_voice_call_runner.core.ishutdown import IShutdown
+from livekit_voice_call_runner.logger import CallLogger, create_logger
+from livekit_voice_call_runner.model import BaseModel
+from livekit_voice_call_runner.telemetry.histogram import LatencyHistogram
+
+# innermost frames of the loop thread kept with a stall
+_STACK_LIMIT = 8
+
+
+class EventLoopLagStats(BaseModel):
+    samples: int
+    p50_seconds: Optional[float] = None
+    p90_seconds: Optional[float] = None
+    p99_seconds: Optional[float] = None
+    max_seconds: Optional[float] = None
+    slow_callbacks: int = 0
+
+
+class _StallSample(BaseModel):
+    # the heartbeat the stall delayed
+    due_at: float
+    task: Optional[str] = None
+    stack: list[str]
+
+
+class LagWindow:
+    """
+    Highest lag seen while the window is open, e.g. while one call runs.
+    """
+
+    def __init__(self):
+        self.max_lag_seconds = 0.0
+
+
+class EventLoopMonitor(IShutdown):
+    """
+    Measures how late the event loop runs what's scheduled on it, and names the code that held it up.
+
+    A heartbeat on the loop sleeps for `interval_seconds` and records how much it overslept: the scheduling lag that
+    every other callback, audio frames included, saw at that moment. A watchdog thread checks on the heartbeat; once
+    it's overdue by `slow_callback_seconds`, it samples the loop thread's current task and stack, so when the
+    heartbeat finally runs, the stall is logged along with what was blocking the loop.
+
+    Lag goes into `histogram`, and into every open `watch` window.
+    """
+
+    def __init__(
+        self,
+        logger: CallLogger,
+        interval_seconds: float = 0.05,
+        slow_callback_seconds: float = 0.1,
+        histogram: Optional[LatencyHistogram] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError(f"Interval must be positive, got {interval_seconds}")
+        self._logger = logger
+        self._interval_seconds = interval_seconds
+        self._slow_callback_seconds = slow_callback_seconds
+        self._histogram = histogram if histogram is not None else LatencyHistogram()
+        self._clock = clock
+        self._slow_callbacks = 0
+        self._windows: set[LagWindow] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        # when the pending heartbeat is due; read by the watchdog thread
+        self._due_at: Optional[float] = None
+        self._sample: Optional[_StallSample] = None
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self._loop
+
+    @property
+    def histogram(self) -> LatencyHistogram:
+        return self._histogram
+
+    @property
+    def slow_callbacks(self) -> int:
+        return self._slow_callbacks
+
+    def stats(self) -> EventLoopLagStats:
+        summary = self._histogram.summary()
+        return EventLoopLagStats(
+            samples=self._histogram.count,
+            p50_seconds=summary["p50"],
+            p90_seconds=summary["p90"],
+            p99_seconds=summary["p99"],
+            max_seconds=summary["max"],
+            slow_callbacks=self._slow_callbacks,
+        )
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._task = asyncio.create_task(self._beat_forever(), name=EventLoopMonitor.__name__)
+        self._thread = threading.Thread(target=self._watch_forever, name=EventLoopMonitor.__name__, daemon=True)
+        self._thread.start()
+
+    @contextmanager
+    def watch(self) -> Iterator[LagWindow]:
+        window = LagWindow()
+        self._windows.add(window)
+        try:
+            yield window
+        finally:
+            self._windows.discard(window)
+
+    async def _beat_forever(self) -> None:
+        while True:
+            due_at = self._clock() + self._interval_seconds
+            self._due_at = due_at
+            await asyncio.sleep(self._interval_seconds)
+            self._record(lag_seconds=max(self._clock() - due_at, 0.0), due_at=due_at)
+
+    def _record(self, lag_seconds: float, due_at: float) -> None:
+        self._histogram.record(lag_seconds)
+        for window in self._windows:
+            window.max_lag_seconds = max(window.max_lag_seconds, lag_seconds)
+
+        sample, self._sample = self._sample, None
+        if lag_seconds < self._slow_callback_seconds:
+            return
+        self._slow_callbacks += 1
+        # a sample taken for an earlier heartbeat says nothing about this stall
+        if sample and sample.due_at != due_at:
+            sample = None
+        self._logger.warning(
+            "Event loop was blocked.",
+            extra={
+                "lag_seconds": lag_seconds,
+                "blocking_task": sample.task if sample else None,
+                "stack": sample.stack if sample else None,
+            },
+        )
+
+    def _take_sample(self, due_at: float) -> _StallSample:
+        assert self._loop is not None and self._loop_thread_id is not None
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.extract_stack(frame, limit=_STACK_LIMIT) if frame else []
+        task = asyncio.current_task(self._loop)
+        return _StallSample(
+            due_at=due_at,
+            task=f"{task.get_name()} ({task.get_coro().__qualname__})" if task else None,
+            stack=[f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in stack],
+        )
+
+    def _watch_forever(self) -> None:
+        while not self._stopped.wait(self._interval_seconds):
+            assert self._loop is not None
+            if self._loop.is_closed():
+                return
+            due_at = self._due_at
+            if due_at is None or self._sample is not None:
+                continue
+            if self._clock() - due_at >= self._slow_callback_seconds:
+                self._sample = self._take_sample(due_at=due_at)
+
+    async def shutdown(self) -> None:
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+
+_monitor: Optional[EventLoopMonitor] = None
+
+
+def get_event_loop_monitor() -> Optional[EventLoopMonitor]:
+    """
+    The process-wide monitor of the running loop, started on first use, or None when disabled
+    (`EVENT_LOOP_MONITOR_INTERVAL_SECONDS=0`). A monitor left behind by an earlier loop is replaced.
+    """
+    global _monitor
+    cfg = get_event_loop_monitor_config()
+    if cfg.interval_seconds <= 0:
+        return None
+    loop = asyncio.get_running_loop()
+    if _monitor is None or _monitor.loop is not loop:
+        _monitor = EventLoopMonitor(
+            logger=create_logger(name=EventLoopMonitor.__name__),
+            interval_seconds=cfg.interval_seconds,
+            slow_callback_seconds=cfg.slow_callback_seconds,
+        )
+        _monitor.start()
+    return _monitor
+
+
+async def shutdown_event_loop_monitor() -> Optional[EventLoopLagStats]:
+    """
+    Stop the process-wide monitor, if any, and return its final stats.
+    """
+    global _monitor
+    if _monitor is None:
+        return None
+    monitor, _monitor = _monitor, None
+    await monitor.shutdown()
+    return monitor.stats()
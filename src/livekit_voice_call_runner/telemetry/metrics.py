@@ -0,0 +1,248 @@
+import threading
+from typing import Iterable, Iterator, Optional
+from wsgiref.simple_server import WSGIServer
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, start_http_server
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+
+from livekit_voice_call_runner.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
+from livekit_voice_call_runner.log_pipeline import LogPipeline
+from livekit_voice_call_runner.telemetry.loop_monitor import EventLoopMonitor
+
+_PREFIX = "voice_call_runner"
+# setup phases take up to a few seconds, a dial rings for up to a minute
+_PHASE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+_CONVERSATION_BUCKETS = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+# a 20 ms audio frame delayed by more than a few frames is audible
+_LOOP_LAG_BUCKETS = (0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class CallMetrics:
+    """
+    Live call counters and latency histograms, scraped in Prometheus format while calls run.
+
+    They complement `RunSummary`, which reports a run once it's done. In the inbound worker, whose calls run in job
+    processes, values go through prometheus_client's multiprocess mode and are aggregated across them when scraped.
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY):
+        self._calls_in_flight = Gauge(
+            f"{_PREFIX}_calls_in_flight",
+            "Calls in progress.",
+            ["direction"],
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self._calls_started = Counter(f"{_PREFIX}_calls_started", "Calls started.", ["direction"], registry=registry)
+        self._calls_ended = Counter(
+            f"{_PREFIX}_calls_ended",
+            "Calls ended, by outcome and disconnect (or shutdown) reason.",
+            ["direction", "outcome", "reason"],
+            registry=registry,
+        )
+        self._phase_duration = Histogram(
+            f"{_PREFIX}_phase_duration_seconds",
+            "Duration of each phase of a call, e.g. create_room, start_session, dial.",
+            ["direction", "phase"],
+            buckets=_PHASE_BUCKETS,
+            registry=registry,
+        )
+        self._turn_latency = Histogram(
+            f"{_PREFIX}_turn_latency_seconds",
+            "Time from the end of user speech to agent speech, per turn.",
+            ["direction"],
+            buckets=_CONVERSATION_BUCKETS,
+            registry=registry,
+        )
+        self._realtime_ttft = Histogram(
+            f"{_PREFIX}_realtime_ttft_seconds",
+            "Realtime model time to first audio, per response.",
+            ["direction"],
+            buckets=_CONVERSATION_BUCKETS,
+            registry=registry,
+        )
+        self._call_max_event_loop_lag = Histogram(
+            f"{_PREFIX}_call_max_event_loop_lag_seconds",
+            "Worst event loop scheduling lag while a call ran.",
+            ["direction"],
+            buckets=_LOOP_LAG_BUCKETS,
+            registry=registry,
+        )
+        self._interruptions = Counter(
+            f"{_PREFIX}_interruptions",
+            "Times the user started speaking while the agent was speaking.",
+            ["direction"],
+            registry=registry,
+        )
+
+    def call_started(self, direction: str) -> None:
+        self._calls_started.labels(direction=direction).inc()
+        self._calls_in_flight.labels(direction=direction).inc()
+
+    def call_ended(
+        self,
+        direction: str,
+        outcome: str,
+        reason: Optional[str],
+        phase_durations: dict[str, float],
+        turn_latencies_seconds: Iterable[float] = (),
+        ttft_seconds: Iterable[float] = (),
+        interruptions: int = 0,
+        max_event_loop_lag_seconds: Optional[float] = None,
+    ) -> None:
+        self._calls_in_flight.labels(direction=direction).dec()
+        self._calls_ended.labels(direction=direction, outcome=outcome, reason=reason or "UNKNOWN").inc()
+        for phase, duration in phase_durations.items():
+            self._phase_duration.labels(direction=direction, phase=phase).observe(duration)
+        for latency in turn_latencies_seconds:
+            self._turn_latency.labels(direction=direction).observe(latency)
+        for latency in ttft_seconds:
+            self._realtime_ttft.labels(direction=direction).observe(latency)
+        self._interruptions.labels(direction=direction).inc(interruptions)
+        if max_event_loop_lag_seconds is not None:
+            self._call_max_event_loop_lag.labels(direction=direction).observe(max_event_loop_lag_seconds)
+
+
+class RunStatsCollector(Collector):
+    """
+    Exposes the counters the run's components keep anyway: rate limiter waits, the adaptive concurrency limit, event
+    loop lag and the log queue. They're read when scraped, so nothing is updated on the event loop in between.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[LiveKitRateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        log_pipeline: Optional[LogPipeline] = None,
+        event_loop_monitor: Optional[EventLoopMonitor] = None,
+    ):
+        self._rate_limiter = rate_limiter
+        self._concurrency_limiter = concurrency_limiter
+        self._log_pipeline = log_pipeline
+        self._event_loop_monitor = event_loop_monitor
+
+    def _collect_rate_limits(self, rate_limiter: LiveKitRateLimiter) -> Iterator[Metric]:
+        acquired = CounterMetricFamily(
+            f"{_PREFIX}_rate_limiter_acquired", "LiveKit API calls let through, by bucket.", labels=["bucket"]
+        )
+        delayed = CounterMetricFamily(
+            f"{_PREFIX}_rate_limiter_delayed", "LiveKit API calls that had to wait, by bucket.", labels=["bucket"]
+        )
+        wait = CounterMetricFamily(
+            f"{_PREFIX}_rate_limiter_wait_seconds", "Time spent waiting for LiveKit API calls.", labels=["bucket"]
+        )
+        max_wait = GaugeMetricFamily(
+            f"{_PREFIX}_rate_limiter_max_wait_seconds", "Longest wait for a LiveKit API call.", labels=["bucket"]
+        )
+        for bucket, stats in rate_limiter.stats().items():
+            acquired.add_metric([bucket], stats.acquired)
+            delayed.add_metric([bucket], stats.delayed)
+            wait.add_metric([bucket], stats.total_wait_seconds)
+            max_wait.add_metric([bucket], stats.max_wait_seconds)
+        yield from [acquired, delayed, wait, max_wait]
+
+    def _collect_concurrency(self, concurrency_limiter: AdaptiveConcurrencyLimiter) -> Iterator[Metric]:
+        stats = concurrency_limiter.stats()
+        yield GaugeMetricFamily(f"{_PREFIX}_concurrency_limit", "Current adaptive concurrency limit.", stats.limit)
+        yield CounterMetricFamily(
+            f"{_PREFIX}_concurrency_limit_increases", "Times the concurrency limit grew.", stats.increases
+        )
+        yield CounterMetricFamily(
+            f"{_PREFIX}_concurrency_limit_decreases", "Times the concurrency limit shrank.", stats.decreases
+        )
+
+    def _collect_log_pipeline(self, log_pipeline: LogPipeline) -> Iterator[Metric]:
+        stats = log_pipeline.stats()
+        yield GaugeMetricFamily(f"{_PREFIX}_log_queue_depth", "Log records waiting to be written.", log_pipeline.depth)
+        yield CounterMetricFamily(
+            f"{_PREFIX}_log_records_dropped", "Log records dropped because the queue was full.", stats.dropped
+        )
+
+    def _collect_event_loop(self, event_loop_monitor: EventLoopMonitor) -> Iterator[Metric]:
+        histogram = event_loop_monitor.histogram
+        lag = GaugeMetricFamily(
+            f"{_PREFIX}_event_loop_lag_seconds",
+            "Event loop scheduling lag since the start of the run, by quantile.",
+            labels=["quantile"],
+        )
+        for quantile in (0.5, 0.9, 0.99, 1.0):
+            value = histogram.percentile(quantile * 100)
+            if value is not None:
+                lag.add_metric([str(quantile)], value)
+        yield lag
+        yield CounterMetricFamily(
+            f"{_PREFIX}_event_loop_slow_callbacks",
+            "Times the event loop was blocked past the slow callback threshold.",
+            event_loop_monitor.slow_callbacks,
+        )
+
+    def collect(self) -> Iterator[Metric]:
+        if self._rate_limiter:
+            yield from self._collect_rate_limits(self._rate_limiter)
+        if self._concurrency_limiter:
+            yield from self._collect_concurrency(self._concurrency_limiter)
+        if self._log_pipeline:
+            yield from self._collect_log_pipeline(self._log_pipeline)
+        if self._event_loop_monitor:
+            yield from self._collect_event_loop(self._event_loop_monitor)
+
+
+class MetricsServer:
+    """
+    Serves a registry at `/metrics` from a background thread, so scrapes neither wait for nor hold up the event loop.
+
+    Collectors passed in are registered for as long as the server runs.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        address: str = "0.0.0.0",
+        collectors: Optional[list[Collector]] = None,
+        registry: CollectorRegistry = REGISTRY,
+    ):
+        self._port = port
+        self._address = address
+        self._collectors = collectors or []
+        self._registry = registry
+        self._server: Optional[WSGIServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        # the bound one, e.g. when started on port 0
+        return self._server.server_port if self._server else self._port
+
+    def start(self) -> None:
+        self._server, self._thread = start_http_server(port=self._port, addr=self._address, registry=self._registry)
+        for collector in self._collectors:
+            self._registry.register(collector)
+
+    def shutdown(self) -> None:
+        if not self._server:
+            return
+        for collector in self._collectors:
+            self._registry.unregister(collector)
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+
+_call_metrics: Optional[CallMetrics] = None
+_call_metrics_lock = threading.Lock()
+
+
+def get_call_metrics() -> CallMetrics:
+    """
+    The process-wide call metrics, registered with the default registry on first use.
+    """
+    global _call_metrics
+    with _call_metrics_lock:
+        if _call_metrics is None:
+            _call_metrics = CallMetrics()
+        return _call_metrics
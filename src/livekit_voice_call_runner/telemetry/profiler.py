@@ -0,0 +1,218 @@
+import asyncio
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from enum import Enum
+from types import FrameType
+from typing import Callable, Optional
+
+from livekit_voice_call_runner.logger import CallLogger, create_logger, get_task_log_context
+from livekit_voice_call_runner.model import BaseModel
+
+# samples taken outside any call: the scheduler, the monitor, callbacks run outside a task
+_NO_PHASE = "none"
+# frames kept per sampled stack, from the innermost
+_STACK_LIMIT = 128
+
+
+class ProfileMode(str, Enum):
+    # every function call, through cProfile: exact counts, at the cost of slowing the run down
+    CPROFILE = "cprofile"
+    # the event loop thread's stack at a fixed interval: approximate, but cheap enough for a full-load run
+    SAMPLING = "sampling"
+
+
+# pstats for cProfile, folded stacks (flamegraph.pl, speedscope) for sampling
+_EXTENSIONS = {ProfileMode.CPROFILE: ".prof", ProfileMode.SAMPLING: ".folded"}
+
+
+class ProfileReport(BaseModel):
+    mode: ProfileMode
+    path: str
+    duration_seconds: float
+    # of the whole process, LiveKit's native threads included
+    process_cpu_seconds: float
+    loop_cpu_seconds: float
+    samples: int
+    # samples that found the loop waiting for I/O
+    idle_samples: int
+    # the loop thread's CPU time, split across call phases by the share of busy samples taken in each
+    phase_cpu_seconds: dict[str, float]
+
+
+def get_profile_path(path: str, mode: ProfileMode, suffix: Optional[str] = None) -> str:
+    """
+    `path`, with `suffix` inserted before its extension, and the mode's extension if it has none.
+    """
+    root, extension = os.path.splitext(path)
+    if suffix:
+        root = f"{root}.{suffix}"
+    return f"{root}{extension or _EXTENSIONS[mode]}"
+
+
+def _is_idle(frame: FrameType) -> bool:
+    # the loop blocks in its selector when it has nothing to run
+    code = frame.f_code
+    return code.co_name == "select" and code.co_filename.endswith("selectors.py")
+
+
+def _fold(frame: Optional[FrameType]) -> str:
+    names: list[str] = []
+    while frame is not None and len(names) < _STACK_LIMIT:
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class RunProfiler:
+    """
+    Profiles a process for as long as it runs calls, into a file at `path`.
+
+    Either mode runs a sampler thread that, every `sample_interval_seconds`, looks at what the event loop thread is
+    doing: waiting for I/O, or running a task of a call, whose phase (prepare, dial, in_call, shutdown) is read from
+    the task's log context. The loop thread's CPU time is then split across phases by their share of busy samples. In
+    sampling mode the same samples also make up the profile, as folded stacks; in cProfile mode the profile is
+    cProfile's.
+
+    `start`, `write` and `stop` are called on the loop thread.
+    """
+
+    def __init__(
+        self,
+        mode: ProfileMode,
+        path: str,
+        logger: CallLogger,
+        sample_interval_seconds: float = 0.005,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        if sample_interval_seconds <= 0:
+            raise ValueError(f"Sample interval must be positive, got {sample_interval_seconds}")
+        self._mode = mode
+        self._path = path
+        self._logger = logger
+        self._sample_interval_seconds = sample_interval_seconds
+        self._clock = clock
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._samples = 0
+        self._idle_samples = 0
+        self._phase_samples: Counter[str] = Counter()
+        self._stacks: Counter[str] = Counter()
+        self._started_at = 0.0
+        self._process_cpu_started_at = 0.0
+        self._loop_cpu_started_at = 0.0
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self._loop
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._started_at = self._clock()
+        self._process_cpu_started_at = time.process_time()
+        self._loop_cpu_started_at = time.thread_time()
+        if self._mode == ProfileMode.CPROFILE:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._thread = threading.Thread(target=self._sample_forever, name=RunProfiler.__name__, daemon=True)
+        self._thread.start()
+
+    def _sample_forever(self) -> None:
+        while not self._stopped.wait(self._sample_interval_seconds):
+            assert self._loop is not None
+            if self._loop.is_closed():
+                return
+            self._take_sample()
+
+    def _take_sample(self) -> None:
+        assert self._loop is not None and self._loop_thread_id is not None
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        self._samples += 1
+        if _is_idle(frame):
+            self._idle_samples += 1
+            return
+        task = asyncio.current_task(self._loop)
+        context = get_task_log_context(task) if task else None
+        self._phase_samples[context.phase if context and context.phase else _NO_PHASE] += 1
+        if self._mode == ProfileMode.SAMPLING:
+            self._stacks[_fold(frame)] += 1
+
+    def report(self) -> ProfileReport:
+        loop_cpu_seconds = time.thread_time() - self._loop_cpu_started_at
+        # the sampler thread keeps counting while this reads
+        phase_samples = dict(self._phase_samples)
+        busy_samples = sum(phase_samples.values())
+        return ProfileReport(
+            mode=self._mode,
+            path=self._path,
+            duration_seconds=self._clock() - self._started_at,
+            process_cpu_seconds=time.process_time() - self._process_cpu_started_at,
+            loop_cpu_seconds=loop_cpu_seconds,
+            samples=self._samples,
+            idle_samples=self._idle_samples,
+            phase_cpu_seconds={
+                phase: loop_cpu_seconds * samples / busy_samples for phase, samples in phase_samples.items()
+            },
+        )
+
+    def write(self) -> ProfileReport:
+        """
+        Write the profile so far, replacing the previous one, and log its CPU time by phase.
+        """
+        if self._profile:
+            # dumping stops the profiler
+            self._profile.dump_stats(self._path)
+            if not self._stopped.is_set():
+                self._profile.enable()
+        else:
+            stacks = self._stacks.most_common()
+            with open(self._path, "w", encoding="utf-8") as f:
+                f.writelines(f"{stack} {count}\n" for stack, count in stacks)
+        report = self.report()
+        self._logger.info("Wrote profile.", extra=report.model_dump())
+        return report
+
+    def stop(self) -> ProfileReport:
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        report = self.write()
+        self._profile = None
+        return report
+
+
+_profiler: Optional[RunProfiler] = None
+
+
+def get_run_profiler(mode: Optional[ProfileMode], path: str) -> Optional[RunProfiler]:
+    """
+    The process-wide profiler of the running loop, started on first use and writing to `path` suffixed with the
+    process id, or None when `mode` is. Meant for processes that outlive their calls, like the inbound job processes,
+    which `write` after each call.
+    """
+    global _profiler
+    if mode is None:
+        return None
+    loop = asyncio.get_running_loop()
+    if _profiler is None or _profiler.loop is not loop:
+        _profiler = RunProfiler(
+            mode=mode,
+            path=get_profile_path(path=path, mode=mode, suffix=str(os.getpid())),
+            logger=create_logger(name=RunProfiler.__name__),
+        )
+        _profiler.start()
+    return _profiler
@@ -0,0 +1,270 @@
+import json
+import queue
+import threading
+import time
+import urllib.request
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from livekit_voice_call_runner.model import BaseModel
+
+
+class Span(BaseModel):
+    name: str
+    # monotonic seconds
+    start: float
+    end: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        return self.end - self.start if self.end is not None else None
+
+
+class CallTrace:
+    """
+    Monotonic timestamps of each phase of one call, keyed by its correlation id.
+
+    Instant events (e.g. "answered") are recorded as zero-length spans with `mark`.
+    """
+
+    def __init__(
+        self,
+        correlation_id: str,
+        on_finish: Optional[Callable[["CallTrace"], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.correlation_id = correlation_id
+        self.spans: list[Span] = []
+        self._on_finish = on_finish
+        self._clock = clock
+        self.started_at = clock()
+        self.started_at_unix = time.time()
+        self.finished_at: Optional[float] = None
+
+    def to_unix(self, monotonic: float) -> float:
+        return self.started_at_unix + (monotonic - self.started_at)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        span = Span(name=name, start=self._clock())
+        self.spans.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.end = self._clock()
+
+    def mark(self, name: str) -> None:
+        now = self._clock()
+        self.spans.append(Span(name=name, start=now, end=now))
+
+    def has(self, name: str) -> bool:
+        return any(span.name == name for span in self.spans)
+
+    def durations(self) -> dict[str, float]:
+        """
+        Duration of the first completed span of each name, in seconds.
+        """
+        durations: dict[str, float] = {}
+        for span in self.spans:
+            if span.name not in durations and span.duration_seconds is not None:
+                durations[span.name] = span.duration_seconds
+        return durations
+
+    def offsets(self) -> dict[str, float]:
+        """
+        Start of the first span of each name, in seconds since the trace started.
+        """
+        offsets: dict[str, float] = {}
+        for span in self.spans:
+            offsets.setdefault(span.name, span.start - self.started_at)
+        return offsets
+
+    def finish(self) -> None:
+        if self.finished_at is not None:
+            return
+        self.finished_at = self._clock()
+        if self._on_finish:
+            self._on_finish(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "correlation_id": self.correlation_id,
+            "started_at_unix": self.started_at_unix,
+            "duration_seconds": (self.finished_at - self.started_at) if self.finished_at is not None else None,
+            "spans": [
+                {
+                    "name": span.name,
+                    "offset_seconds": span.start - self.started_at,
+                    "duration_seconds": span.duration_seconds,
+                    "error": span.error,
+                }
+                for span in self.spans
+            ],
+        }
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, traces: list[CallTrace]) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class JsonlSpanExporter(SpanExporter):
+    """
+    Appends one JSON line per finished call trace.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, traces: list[CallTrace]) -> None:
+        self._file.writelines(json.dumps(trace.to_dict()) + "\n" for trace in traces)
+        self._file.flush()
+
+    def shutdown(self) -> None:
+        self._file.close()
+
+
+def _to_unix_nanos(seconds: float) -> str:
+    return str(int(seconds * 1e9))
+
+
+def _new_span_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """
+    Posts traces to an OTLP/HTTP collector (`<endpoint>/v1/traces`) using the OTLP JSON encoding.
+
+    Each call becomes one trace: a root "call" span with one child span per phase. Export failures are reported
+    through `on_error` and never raised, so a missing collector cannot fail a run.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "livekit-voice-call-runner",
+        timeout_seconds: float = 5.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        self._url = endpoint.rstrip("/") + "/v1/traces"
+        self._service_name = service_name
+        self._timeout_seconds = timeout_seconds
+        self._on_error = on_error
+
+    def _to_otlp_spans(self, trace: CallTrace) -> list[dict[str, Any]]:
+        trace_id = uuid.uuid5(uuid.NAMESPACE_OID, trace.correlation_id).hex
+        root_span_id = _new_span_id()
+        end = trace.finished_at if trace.finished_at is not None else trace.started_at
+        spans = [
+            {
+                "traceId": trace_id,
+                "spanId": root_span_id,
+                "name": "call",
+                "kind": 1,
+                "startTimeUnixNano": _to_unix_nanos(trace.started_at_unix),
+                "endTimeUnixNano": _to_unix_nanos(trace.to_unix(end)),
+                "attributes": [{"key": "correlation_id", "value": {"stringValue": trace.correlation_id}}],
+            }
+        ]
+        for span in trace.spans:
+            otlp_span: dict[str, Any] = {
+                "traceId": trace_id,
+                "spanId": _new_span_id(),
+                "parentSpanId": root_span_id,
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": _to_unix_nanos(trace.to_unix(span.start)),
+                "endTimeUnixNano": _to_unix_nanos(trace.to_unix(span.end if span.end is not None else span.start)),
+            }
+            if span.error:
+                otlp_span["status"] = {"code": 2, "message": span.error}
+            spans.append(otlp_span)
+        return spans
+
+    def to_payload(self, traces: list[CallTrace]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self._service_name}}]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "livekit_voice_call_runner"},
+                            "spans": [span for trace in traces for span in self._to_otlp_spans(trace)],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, traces: list[CallTrace]) -> None:
+        request = urllib.request.Request(
+            self._url,
+            data=json.dumps(self.to_payload(traces)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout_seconds):
+                pass
+        except Exception as e:
+            if self._on_error:
+                self._on_error(e)
+
+
+_STOP = object()
+
+
+class CallTracer:
+    """
+    Creates a `CallTrace` per call and exports finished traces from a background thread, in batches, so exporter
+    I/O never runs on the event loop.
+    """
+
+    def __init__(self, exporters: Optional[list[SpanExporter]] = None, max_batch_size: int = 100):
+        self._exporters = exporters or []
+        self._max_batch_size = max_batch_size
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        if self._exporters:
+            self._thread = threading.Thread(target=self._export_forever, name="CallTracer", daemon=True)
+            self._thread.start()
+
+    def start_trace(self, correlation_id: str) -> CallTrace:
+        return CallTrace(correlation_id=correlation_id, on_finish=self._on_finish)
+
+    def _on_finish(self, trace: CallTrace) -> None:
+        if self._thread:
+            self._queue.put(trace)
+
+    def _export_forever(self) -> None:
+        stopped = False
+        while not stopped:
+            batch = [self._queue.get()]
+            while len(batch) < self._max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get())
+            if _STOP in batch:
+                stopped = True
+                batch = [trace for trace in batch if trace is not _STOP]
+            if batch:
+                for exporter in self._exporters:
+                    exporter.export(batch)
+
+    def shutdown(self) -> None:
+        """
+        Export every finished trace, then close the exporters.
+        """
+        if self._thread:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        for exporter in self._exporters:
+            exporter.shutdown()
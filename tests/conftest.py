@@ -5,7 +5,7 @@ from livekit_voice_call_runner.logger import create_logger
 
 @pytest.fixture
 def mock_logger(mocker):
-    logger = create_logger(name="test", correlation_id="test-correlation-id")
+    logger = create_logger(name="test")
     mocker.patch.object(logger, "info")
     mocker.patch.object(logger, "error")
     mocker.patch.object(logger, "warning")
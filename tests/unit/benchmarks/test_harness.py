@@ -0,0 +1,40 @@
+import pytest
+
+from benchmarks.cases import CASES
+from benchmarks.harness import compare, measure
+from livekit_voice_call_runner.livekit import realtime_model_provider
+
+
+def test_measure_reports_time_per_operation():
+    calls = []
+
+    result = measure(name="noop", fn=lambda: calls.append(1), number=10, repeat=3)
+
+    # one warm-up run plus the timed repeats
+    assert len(calls) == 4
+    assert result.repeat == 3
+    assert result.seconds_per_op >= result.min_seconds_per_op > 0
+
+
+def test_compare_flags_slowdowns_above_threshold():
+    results = [
+        measure(name="slower", fn=lambda: None, number=1),
+        measure(name="new", fn=lambda: None, number=1),
+    ]
+    baseline = {"benchmarks": {"slower": {"seconds_per_op": results[0].seconds_per_op / 2}}}
+
+    comparisons = compare(results=results, baseline=baseline, threshold=0.2)
+
+    assert comparisons[0].regressed
+    assert comparisons[0].ratio is not None and comparisons[0].ratio > 1.2
+    assert comparisons[1].ratio is None and not comparisons[1].regressed
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_case_runs_in_quick_mode(name):
+    result = CASES[name](True)
+
+    assert result.number > 0
+    assert result.seconds_per_op > 0
+    # shut down on the loop that opened it, rather than leaking its HTTP session to the next case's loop
+    assert realtime_model_provider._provider is None
@@ -62,3 +62,97 @@ def test_run_when_no_phone_number():
     ]
     with pytest.raises(SystemExit):
         run()
+
+
+def test_run_when_open_loop_without_arrival_rate():
+    sys.argv = [
+        "livekit_voice_call_runner",
+        "--direction",
+        "outbound",
+        "--instructions-path",
+        "some/path.md",
+        "--phone-number",
+        "+1234567890",
+        "--scheduler",
+        "open-loop",
+    ]
+    with pytest.raises(SystemExit):
+        run()
+
+
+def test_run_when_transcript_sample_rate_invalid():
+    sys.argv = [
+        "livekit_voice_call_runner",
+        "--direction",
+        "inbound",
+        "--instructions-path",
+        "some/path.md",
+        "--transcript-sample-rate",
+        "1.5",
+    ]
+    with pytest.raises(SystemExit):
+        run()
+
+
+def test_run_when_metrics_port_invalid():
+    sys.argv = [
+        "livekit_voice_call_runner",
+        "--direction",
+        "inbound",
+        "--instructions-path",
+        "some/path.md",
+        "--metrics-port",
+        "70000",
+    ]
+    with pytest.raises(SystemExit):
+        run()
+
+
+def test_run_when_processes_exceed_concurrency():
+    sys.argv = [
+        "livekit_voice_call_runner",
+        "--direction",
+        "outbound",
+        "--instructions-path",
+        "some/path.md",
+        "--phone-number",
+        "+1234567890",
+        "--concurrency",
+        "2",
+        "--processes",
+        "3",
+    ]
+    with pytest.raises(SystemExit):
+        run()
+
+
+def test_run_campaign_worker_without_instructions_or_phone_numbers(mocker):
+    mock_run = mocker.patch("livekit_voice_call_runner.cli.outbound.run")
+    sys.argv = [
+        "livekit_voice_call_runner",
+        "--direction",
+        "outbound",
+        "--campaign-role",
+        "worker",
+        "--campaign-db",
+        "campaign.db",
+    ]
+    run()
+
+    mock_run.assert_called_once()
+
+
+def test_run_when_campaign_role_without_db():
+    sys.argv = [
+        "livekit_voice_call_runner",
+        "--direction",
+        "outbound",
+        "--instructions-path",
+        "some/path.md",
+        "--phone-number",
+        "+1234567890",
+        "--campaign-role",
+        "coordinator",
+    ]
+    with pytest.raises(SystemExit):
+        run()
@@ -1,8 +1,15 @@
 import argparse
+import json
+import queue
 
 import pytest
 
-from livekit_voice_call_runner.cli.outbound import run
+from livekit_voice_call_runner.cli.outbound import _create_shard_args, _run_processes, run
+from livekit_voice_call_runner.outbound.call_orchestrator import OutboundCallScheduler
+from livekit_voice_call_runner.outbound.call_record import CallOutcome, CallRecord
+from livekit_voice_call_runner.outbound.call_record_sink import CallRecordFormat
+from livekit_voice_call_runner.outbound.campaign_queue import CampaignProgress, CampaignRole, CampaignStore
+from livekit_voice_call_runner.outbound.run_summary import RunSummary
 
 
 def test_run(mocker, tmp_path):
@@ -22,6 +29,23 @@ def test_run(mocker, tmp_path):
         phone_number=["+1234567890"],
         concurrency=1,
         rounds=1,
+        scheduler=OutboundCallScheduler.ROUNDS,
+        arrival_profile=None,
+        arrival_rate=None,
+        arrival_interval_seconds=None,
+        prewarm_pool_size=0,
+        prewarm_max_idle_seconds=60.0,
+        trace_path=None,
+        otlp_endpoint=None,
+        results_path=None,
+        results_format=CallRecordFormat.JSONL,
+        summary_path=None,
+        processes=1,
+        campaign_role=None,
+        adaptive_concurrency=False,
+        metrics_port=None,
+        profile=None,
+        profile_path="profile",
     )
 
     with pytest.raises(SystemExit) as exc_info:
@@ -29,3 +53,162 @@ def test_run(mocker, tmp_path):
 
     assert exc_info.value.code == 0
     mock_orchestrator_cls.return_value.run.assert_called_once()
+
+
+def _create_args(**overrides) -> argparse.Namespace:
+    return argparse.Namespace(
+        **{
+            "instructions_path": "instructions.txt",
+            "phone_number": ["+1111111111", "+2222222222", "+3333333333"],
+            "concurrency": 5,
+            "processes": 2,
+            "prewarm_pool_size": 1,
+            "arrival_rate": [10.0],
+            "results_path": "out/results.jsonl",
+            "trace_path": None,
+            "summary_path": "out/summary.json",
+            "metrics_port": 9100,
+            "profile_path": "out/profile",
+            **overrides,
+        }
+    )
+
+
+def test_create_shard_args_splits_the_run():
+    args = _create_args()
+
+    first = _create_shard_args(args, shard=0)
+    second = _create_shard_args(args, shard=1)
+
+    assert (first.concurrency, second.concurrency) == (3, 2)
+    assert (first.calls_per_round, second.calls_per_round) == (3, 2)
+    assert (first.prewarm_pool_size, second.prewarm_pool_size) == (1, 0)
+    assert first.phone_number == ["+1111111111", "+3333333333"]
+    assert second.phone_number == ["+2222222222"]
+    assert first.arrival_rate == [5.0]
+    assert first.results_path == "out/results.shard-0.jsonl"
+    assert second.results_path == "out/results.shard-1.jsonl"
+    assert first.trace_path is None
+    assert first.summary_path is None
+    assert (first.metrics_port, second.metrics_port) == (9100, 9101)
+    assert (first.profile_path, second.profile_path) == ("out/profile.shard-0", "out/profile.shard-1")
+    assert second.shard == 1
+    assert args.concurrency == 5
+
+
+def test_create_shard_args_with_fewer_phone_numbers_than_processes():
+    args = _create_args(phone_number=["+1111111111", "+2222222222"], concurrency=4, processes=4, arrival_rate=None)
+
+    shards = [_create_shard_args(args, shard=shard) for shard in range(4)]
+
+    # together the shards place the 4 calls of a round one process would, alternating between the numbers
+    assert [shard.calls_per_round for shard in shards] == [1, 1, 1, 1]
+    assert [shard.phone_number[0] for shard in shards] == ["+1111111111", "+2222222222"] * 2
+    assert shards[1].phone_number == ["+2222222222", "+1111111111"]
+    assert shards[1].arrival_rate is None
+
+
+def test_create_shard_args_with_more_phone_numbers_than_concurrency():
+    args = _create_args(phone_number=[f"+{n}" * 10 for n in range(1, 6)], concurrency=2)
+
+    shards = [_create_shard_args(args, shard=shard) for shard in range(2)]
+
+    # every number is still called once a round
+    assert [shard.calls_per_round for shard in shards] == [3, 2]
+    assert [len(shard.phone_number) for shard in shards] == [3, 2]
+
+
+class _InlineProcess:
+    def __init__(self, target, kwargs, name):
+        self._target = target
+        self._kwargs = kwargs
+        self.exitcode = None
+
+    def start(self):
+        self._target(**self._kwargs)
+        self.exitcode = 0
+
+    def is_alive(self):
+        return False
+
+    def join(self):
+        pass
+
+
+def _run_fake_shard(args, run_id, results):
+    if args.shard == 1 and args.fail_second_shard:
+        results.put({"shard": args.shard, "error": "boom"})
+        return
+    summary = RunSummary()
+    summary.record(
+        CallRecord(
+            correlation_id=f"call-{args.shard}",
+            phone_number_from="+10000000000",
+            phone_number_to=args.phone_number[0],
+            sip_trunk_id="trunk-123",
+            outcome=CallOutcome.COMPLETED,
+            started_at_unix=0.0,
+        )
+    )
+    results.put({"shard": args.shard, "summary": summary.to_mergeable_dict()})
+
+
+@pytest.mark.parametrize("fail_second_shard, exit_code, calls", [(False, 0, 2), (True, 1, 1)])
+def test_run_processes_merges_shard_summaries(mocker, tmp_path, fail_second_shard, exit_code, calls):
+    context = mocker.patch("livekit_voice_call_runner.cli.outbound.multiprocessing.get_context").return_value
+    context.Process = _InlineProcess
+    context.Queue = queue.Queue
+    mocker.patch("livekit_voice_call_runner.cli.outbound._run_shard", _run_fake_shard)
+    summary_path = tmp_path / "summary.json"
+    args = _create_args(summary_path=str(summary_path), fail_second_shard=fail_second_shard)
+
+    with pytest.raises(SystemExit) as exc_info:
+        _run_processes(args, run_id="run-1")
+
+    assert exc_info.value.code == exit_code
+    summary = json.loads(summary_path.read_text())
+    assert summary["calls"] == calls
+    assert summary["outcomes"] == {"completed": calls}
+
+
+@pytest.mark.parametrize("abandoned, exit_code", [(False, 0), (True, 1)])
+def test_run_coordinator_creates_campaign_and_reports_its_records(mocker, tmp_path, abandoned, exit_code):
+    instructions_file = tmp_path / "instructions.md"
+    instructions_file.write_text("Call instructions")
+    summary_path = tmp_path / "summary.json"
+    args = argparse.Namespace(
+        instructions_path=str(instructions_file),
+        phone_number=["+1111111111", "+2222222222"],
+        rounds=2,
+        summary_path=str(summary_path),
+        processes=1,
+        campaign_role=CampaignRole.COORDINATOR,
+        campaign_db=str(tmp_path / "campaign.db"),
+        campaign_lease_seconds=60.0,
+        campaign_max_attempts=1,
+    )
+
+    # stands in for the workers: runs every call once the campaign is created
+    def wait_for_campaign(store: CampaignStore) -> CampaignProgress:
+        for call in store.lease(node_id="node-1", limit=10):
+            if abandoned and call.call_id == 1:
+                store.release(node_id="node-1", call_ids=[call.call_id], attempted=True)
+                continue
+            record = CallRecord(
+                correlation_id=f"call-{call.call_id}",
+                phone_number_from="+10000000000",
+                phone_number_to=call.phone_number_to,
+                sip_trunk_id="trunk-123",
+                outcome=CallOutcome.COMPLETED,
+                started_at_unix=0.0,
+            )
+            store.complete(node_id="node-1", call_id=call.call_id, record=record)
+        return store.progress()
+
+    mocker.patch("livekit_voice_call_runner.cli.outbound._wait_for_campaign", side_effect=wait_for_campaign)
+
+    with pytest.raises(SystemExit) as exc_info:
+        run(args)
+
+    assert exc_info.value.code == exit_code
+    assert json.loads(summary_path.read_text())["calls"] == (3 if abandoned else 4)
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from livekit_voice_call_runner.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+
+
+def _create_limiter(mock_logger, **kwargs) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(
+        **{"max_limit": 10, "logger": mock_logger, "window_size": 4, "max_setup_latency_seconds": 2.0, **kwargs}
+    )
+
+
+def _record_window(limiter: AdaptiveConcurrencyLimiter, failures: int = 0, setup_latency_seconds: float = 1.0):
+    for index in range(4):
+        limiter.record(failed=index < failures, setup_latency_seconds=setup_latency_seconds)
+
+
+def test_limit_grows_while_within_targets_up_to_max(mock_logger):
+    limiter = _create_limiter(mock_logger, initial_limit=8, increase_step=1)
+
+    _record_window(limiter)
+    limiter.record(failed=False)
+    assert limiter.limit == 9
+
+    for _ in range(3):
+        _record_window(limiter)
+
+    stats = limiter.stats()
+    assert stats.limit == 10
+    assert stats.increases == 2
+    assert stats.last_error_rate == 0.0
+
+
+@pytest.mark.parametrize(
+    "failures, setup_latency_seconds",
+    [
+        (1, 1.0),
+        (0, 3.0),
+    ],
+)
+def test_limit_is_cut_when_a_target_is_missed(mock_logger, failures, setup_latency_seconds):
+    limiter = _create_limiter(mock_logger, min_limit=2)
+
+    _record_window(limiter, failures=failures, setup_latency_seconds=setup_latency_seconds)
+    assert limiter.limit == 5
+    _record_window(limiter, failures=failures, setup_latency_seconds=setup_latency_seconds)
+    _record_window(limiter, failures=failures, setup_latency_seconds=setup_latency_seconds)
+
+    stats = limiter.stats()
+    assert stats.limit == 2
+    assert stats.lowest_limit == 2
+    assert stats.decreases == 2
+
+
+def test_init_when_limits_invalid(mock_logger):
+    with pytest.raises(ValueError, match="Limits"):
+        _create_limiter(mock_logger, min_limit=11)
+
+
+async def test_lowering_the_limit_holds_new_tasks_until_enough_finish(mock_logger):
+    limiter = _create_limiter(mock_logger, initial_limit=2)
+    await limiter.acquire()
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+
+    # a failing window halves the limit to 1, while 2 are still in flight
+    _record_window(limiter, failures=4)
+    limiter.release()
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    limiter.release()
+    await waiting
+    assert limiter.stats().in_flight == 1
+
+
+async def test_raising_the_limit_wakes_waiters(mock_logger):
+    limiter = _create_limiter(mock_logger, initial_limit=1)
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    _record_window(limiter)
+
+    await waiting
+    assert limiter.stats().in_flight == 2
+
+
+async def test_cancelled_waiter_gives_up_its_place(mock_logger):
+    limiter = _create_limiter(mock_logger, initial_limit=1)
+    await limiter.acquire()
+    cancelled = asyncio.create_task(limiter.acquire())
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    limiter.release()
+
+    await waiting
+    assert limiter.stats().in_flight == 1
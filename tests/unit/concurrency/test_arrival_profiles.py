@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from livekit_voice_call_runner.concurrency.arrival_profiles import (
+    ArrivalProfileType,
+    ConstantArrivalProfile,
+    PoissonArrivalProfile,
+    RampArrivalProfile,
+    StepArrivalProfile,
+    create_arrival_profile,
+)
+
+
+def test_constant_profile():
+    profile = ConstantArrivalProfile(rate=4.0)
+    assert profile.next_interval(offset=0.0) == 0.25
+    assert profile.next_interval(offset=100.0) == 0.25
+
+
+def test_poisson_profile_mean_interval_matches_rate():
+    profile = PoissonArrivalProfile(rate=10.0, rng=random.Random(42))
+    intervals = [profile.next_interval(offset=0.0) for _ in range(10_000)]
+    assert sum(intervals) / len(intervals) == pytest.approx(0.1, rel=0.05)
+
+
+def test_step_profile_holds_last_step():
+    profile = StepArrivalProfile(rates=[1.0, 2.0, 4.0], step_seconds=10.0)
+    assert profile.next_interval(offset=5.0) == 1.0
+    assert profile.next_interval(offset=15.0) == 0.5
+    assert profile.next_interval(offset=25.0) == 0.25
+    assert profile.next_interval(offset=500.0) == 0.25
+
+
+def test_ramp_profile_interpolates_rate():
+    profile = RampArrivalProfile(start_rate=1.0, end_rate=3.0, ramp_seconds=10.0)
+    assert profile.next_interval(offset=0.0) == 1.0
+    assert profile.next_interval(offset=5.0) == 0.5
+    assert profile.next_interval(offset=60.0) == pytest.approx(1 / 3)
+
+
+@pytest.mark.parametrize(
+    "profile_type, rates, interval_seconds",
+    [
+        (ArrivalProfileType.CONSTANT, [0.0], None),
+        (ArrivalProfileType.STEP, [1.0, 2.0], None),
+        (ArrivalProfileType.RAMP, [1.0], 10.0),
+        (ArrivalProfileType.POISSON, [], None),
+    ],
+)
+def test_create_arrival_profile_when_invalid(profile_type, rates, interval_seconds):
+    with pytest.raises(ValueError):
+        create_arrival_profile(profile_type=profile_type, rates=rates, interval_seconds=interval_seconds)
+
+
+def test_create_arrival_profile():
+    profile = create_arrival_profile(profile_type=ArrivalProfileType.RAMP, rates=[1.0, 2.0], interval_seconds=5.0)
+    assert isinstance(profile, RampArrivalProfile)
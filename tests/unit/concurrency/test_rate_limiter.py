@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter, TokenBucket
+
+
+async def test_token_bucket_allows_burst_without_waiting():
+    bucket = TokenBucket(rate_per_second=1.0, burst=3)
+
+    waits = [await bucket.acquire() for _ in range(3)]
+
+    assert waits == [pytest.approx(0.0, abs=0.01)] * 3
+    assert bucket.stats.acquired == 3
+
+
+async def test_token_bucket_paces_callers_beyond_burst():
+    bucket = TokenBucket(rate_per_second=50.0, burst=1)
+
+    waits = await asyncio.gather(*[bucket.acquire() for _ in range(3)])
+
+    # one token every 20ms, served in order
+    assert sorted(waits) == [
+        pytest.approx(0.0, abs=0.01),
+        pytest.approx(0.02, abs=0.015),
+        pytest.approx(0.04, abs=0.015),
+    ]
+    assert bucket.stats.delayed == 2
+    assert bucket.stats.max_wait_seconds == max(waits)
+
+
+@pytest.mark.parametrize("rate_per_second, burst", [(0.0, 1), (1.0, 0)])
+def test_token_bucket_when_invalid(rate_per_second, burst):
+    with pytest.raises(ValueError):
+        TokenBucket(rate_per_second=rate_per_second, burst=burst)
+
+
+async def test_rate_limiter_is_unlimited_without_buckets():
+    limiter = LiveKitRateLimiter()
+
+    assert await limiter.acquire_room_api() == 0.0
+    assert await limiter.acquire_sip_api(sip_trunk_id="trunk-1") == 0.0
+    assert limiter.stats() == {}
+
+
+async def test_rate_limiter_keeps_a_bucket_per_sip_trunk():
+    limiter = LiveKitRateLimiter(sip_api=TokenBucket(rate_per_second=100.0, burst=10), sip_trunk_cps=1.0)
+
+    await limiter.acquire_sip_api(sip_trunk_id="trunk-1")
+    await limiter.acquire_sip_api(sip_trunk_id="trunk-2")
+
+    stats = limiter.stats()
+    assert stats["sip_api"].acquired == 2
+    assert stats["sip_trunk:trunk-1"].acquired == 1
+    assert stats["sip_trunk:trunk-2"].acquired == 1
+    assert stats["sip_trunk:trunk-1"].delayed == 0
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from livekit_voice_call_runner.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from livekit_voice_call_runner.concurrency.arrival_profiles import ConstantArrivalProfile
+from livekit_voice_call_runner.concurrency.tasks_runner import ConcurrentTasksRunner
+
+
+@pytest.fixture
+def runner(mock_logger):
+    return ConcurrentTasksRunner(logger=mock_logger)
+
+
+async def test_run_limits_concurrency(runner):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _task():
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    await runner.run(tasks=[_task() for _ in range(10)], concurrency=3)
+
+    assert max_in_flight == 3
+
+
+async def test_run_stream_refills_slot_when_any_task_ends(runner):
+    slow_task_done = asyncio.Event()
+    finished = []
+
+    async def _slow():
+        await slow_task_done.wait()
+        finished.append("slow")
+
+    async def _fast(i: int):
+        await asyncio.sleep(0)
+        finished.append(i)
+        if i == 3:
+            slow_task_done.set()
+
+    tasks = [_slow(), _fast(0), _fast(1), _fast(2), _fast(3)]
+    await runner.run_stream(tasks=iter(tasks), concurrency=2)
+
+    # all fast tasks ran through the second slot while the slow one held the first
+    assert finished == [0, 1, 2, 3, "slow"]
+
+
+async def test_run_stream_pulls_tasks_lazily(runner):
+    created = 0
+
+    async def _task():
+        await asyncio.sleep(0)
+
+    def _tasks():
+        nonlocal created
+        for _ in range(5):
+            created += 1
+            yield _task()
+
+    iterator = _tasks()
+    await runner.run_stream(tasks=iterator, concurrency=2)
+
+    assert created == 5
+
+
+async def test_run_stream_continues_after_task_failure(runner):
+    ran = []
+
+    async def _fail():
+        raise RuntimeError("boom")
+
+    async def _ok():
+        ran.append(True)
+
+    await runner.run_stream(tasks=iter([_fail(), _ok(), _ok()]), concurrency=1)
+
+    assert len(ran) == 2
+    runner._logger.warning.assert_called_once()
+
+
+async def test_run_open_loop_launches_on_schedule_regardless_of_completion(runner):
+    release = asyncio.Event()
+    launched = []
+
+    async def _task(i: int):
+        launched.append(i)
+        await release.wait()
+
+    run = asyncio.create_task(
+        runner.run_open_loop(
+            tasks=(_task(i) for i in range(3)),
+            arrival_profile=ConstantArrivalProfile(rate=1000.0),
+            max_in_flight=10,
+        )
+    )
+    while len(launched) < 3:
+        await asyncio.sleep(0.001)
+    release.set()
+    report = await run
+
+    # none of the calls completed before the next one was launched
+    assert launched == [0, 1, 2]
+    assert report.launched == 3
+
+
+async def test_run_open_loop_reports_lag_when_in_flight_cap_is_reached(runner):
+    async def _task():
+        await asyncio.sleep(0.1)
+
+    report = await runner.run_open_loop(
+        tasks=(_task() for _ in range(3)),
+        arrival_profile=ConstantArrivalProfile(rate=1000.0),
+        max_in_flight=1,
+    )
+
+    assert report.launched == 3
+    assert report.late == 2
+    assert report.max_lag_seconds >= 0.1
+    runner._logger.warning.assert_called_once()
+
+
+async def test_run_stream_with_adaptive_limiter_follows_its_limit(mock_logger):
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, logger=mock_logger, initial_limit=2)
+    runner = ConcurrentTasksRunner(logger=mock_logger, limiter=limiter)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _task():
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    await runner.run_stream(tasks=(_task() for _ in range(10)), concurrency=4)
+
+    assert max_in_flight == 2
+    assert limiter.stats().in_flight == 0
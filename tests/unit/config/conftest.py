@@ -6,10 +6,18 @@ import pytest
 
 @pytest.fixture
 def reload_config():
+    originals = {}
+
     def _reload(module_path: str):
         """Reload a config module and reset its lru_cache so env changes take effect."""
         if module_path in sys.modules:
-            del sys.modules[module_path]
+            originals.setdefault(module_path, sys.modules.pop(module_path))
         return importlib.import_module(module_path)
 
-    return _reload
+    yield _reload
+
+    # later tests use the original module again, not one cached with this test's env
+    for module_path, module in originals.items():
+        sys.modules[module_path] = module
+        parent, _, name = module_path.rpartition(".")
+        setattr(sys.modules[parent], name, module)
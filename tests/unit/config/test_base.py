@@ -7,3 +7,72 @@ def test_get_config(shared_env, reload_config):
     assert cfg.call_session.turn_detection.create_response is True
     assert cfg.call_session.turn_detection.interrupt_response is False
     assert cfg.room_connector.participant_identity == shared_env["CALL_ROOM_PARTICIPANT_IDENTITY"]
+
+
+def test_get_config_rate_limits(shared_env, reload_config, monkeypatch):
+    monkeypatch.setenv("LIVEKIT_SIP_API_RATE_LIMIT_PER_SECOND", "2.5")
+    monkeypatch.setenv("LIVEKIT_SIP_API_RATE_LIMIT_BURST", "5")
+    cfg = reload_config("livekit_voice_call_runner.config.base").get_config()
+    assert cfg.rate_limits.room_api.rate_per_second is None
+    assert cfg.rate_limits.room_api.burst == 1
+    assert cfg.rate_limits.sip_api.rate_per_second == 2.5
+    assert cfg.rate_limits.sip_api.burst == 5
+
+
+def test_get_config_livekit_http(shared_env, reload_config, monkeypatch):
+    monkeypatch.setenv("LIVEKIT_API_HTTP_POOL_SIZE", "200")
+    cfg = reload_config("livekit_voice_call_runner.config.base").get_config()
+    assert cfg.livekit_http.pool_size == 200
+    assert cfg.livekit_http.keepalive_seconds == 30.0
+    assert cfg.livekit_http.timeout_seconds == 10.0
+
+
+def test_get_config_llm_prewarm(shared_env, reload_config, monkeypatch):
+    cfg = reload_config("livekit_voice_call_runner.config.base").get_config()
+    assert cfg.call_session.llm_prewarm.connections == 0
+
+    monkeypatch.setenv("CALL_SESSION_LLM_PREWARM_CONNECTIONS", "4")
+    monkeypatch.setenv("CALL_SESSION_LLM_PREWARM_MAX_IDLE_SECONDS", "30")
+    cfg = reload_config("livekit_voice_call_runner.config.base").get_config()
+    assert cfg.call_session.llm_prewarm.connections == 4
+    assert cfg.call_session.llm_prewarm.max_idle_seconds == 30.0
+
+
+def test_get_logging_config_defaults_to_sync(reload_config, monkeypatch):
+    monkeypatch.delenv("LOG_MODE", raising=False)
+    cfg = reload_config("livekit_voice_call_runner.config.base").get_logging_config()
+    assert cfg.mode == "sync"
+    assert cfg.queue_size == 10_000
+    assert cfg.overflow_policy == "drop-newest"
+
+
+def test_get_logging_config_queue(reload_config, monkeypatch):
+    monkeypatch.setenv("LOG_MODE", "queue")
+    monkeypatch.setenv("LOG_QUEUE_SIZE", "50")
+    monkeypatch.setenv("LOG_QUEUE_OVERFLOW_POLICY", "block")
+    cfg = reload_config("livekit_voice_call_runner.config.base").get_logging_config()
+    assert cfg.mode == "queue"
+    assert cfg.queue_size == 50
+    assert cfg.overflow_policy == "block"
+
+
+def test_get_logging_config_transcript(reload_config, monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "warning")
+    monkeypatch.setenv("TRANSCRIPT_LOG_LEVEL", "DEBUG")
+    monkeypatch.setenv("TRANSCRIPT_LOG_SAMPLE_RATE", "0.1")
+    monkeypatch.setenv("TRANSCRIPT_LOG_MAX_CHARS", "200")
+    monkeypatch.setenv("TRANSCRIPT_DIR", "transcripts")
+    cfg = reload_config("livekit_voice_call_runner.config.base").get_logging_config()
+    assert cfg.level == "WARNING"
+    assert cfg.transcript.level == "DEBUG"
+    assert cfg.transcript.sample_rate == 0.1
+    assert cfg.transcript.max_chars == 200
+    assert cfg.transcript.directory == "transcripts"
+
+
+def test_get_event_loop_monitor_config(reload_config, monkeypatch):
+    monkeypatch.delenv("EVENT_LOOP_MONITOR_INTERVAL_SECONDS", raising=False)
+    monkeypatch.setenv("EVENT_LOOP_SLOW_CALLBACK_SECONDS", "0.25")
+    cfg = reload_config("livekit_voice_call_runner.config.base").get_event_loop_monitor_config()
+    assert cfg.interval_seconds == 0.05
+    assert cfg.slow_callback_seconds == 0.25
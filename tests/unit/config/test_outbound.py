@@ -4,3 +4,18 @@ def test_get_config(outbound_env, reload_config):
     assert cfg.phone_number_from == outbound_env["CALL_OUTBOUND_PHONE_NUMBER_FROM"]
     assert cfg.ringing_timeout == int(outbound_env["CALL_OUTBOUND_RINGING_TIMEOUT"])
     assert cfg.max_call_duration == int(outbound_env["CALL_OUTBOUND_MAX_CALL_DURATION"])
+
+
+def test_get_config_sip_trunk_rate_limit(outbound_env, reload_config, monkeypatch):
+    monkeypatch.setenv("CALL_OUTBOUND_SIP_TRUNK_CPS", "10")
+    cfg = reload_config("livekit_voice_call_runner.config.outbound").get_config()
+    assert cfg.sip_trunk_rate_limit.rate_per_second == 10.0
+    assert cfg.sip_trunk_rate_limit.burst == 1
+
+
+def test_get_config_adaptive_concurrency(outbound_env, reload_config, monkeypatch):
+    monkeypatch.setenv("CALL_OUTBOUND_ADAPTIVE_CONCURRENCY_MAX_ERROR_RATE", "0.1")
+    cfg = reload_config("livekit_voice_call_runner.config.outbound").get_config()
+    assert cfg.adaptive_concurrency.max_error_rate == 0.1
+    assert cfg.adaptive_concurrency.initial_limit is None
+    assert cfg.adaptive_concurrency.window_size == 20
@@ -1,15 +1,26 @@
-from unittest.mock import MagicMock
+import logging
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-
+from livekit.agents import (
+    AgentStateChangedEvent,
+    ChatMessage,
+    ConversationItemAddedEvent,
+    MetricsCollectedEvent,
+    UserStateChangedEvent,
+)
+from livekit.agents.metrics import RealtimeModelMetrics
+
+from livekit_voice_call_runner.config.base import ConfigTranscript, LogLevel
 from livekit_voice_call_runner.core.call_event_listener import CallEventListener
 from livekit_voice_call_runner.logger import create_logger
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
 
 
 @pytest.fixture
 def listener():
-    logger = create_logger(name="test-listener", correlation_id="test-id")
-    return CallEventListener(logger=logger)
+    logger = create_logger(name="test-listener")
+    return CallEventListener(call_trace=CallTrace(correlation_id="test-id"), logger=logger)
 
 
 async def test_shutdown_triggers_on_participant_disconnect(listener, mocker):
@@ -85,3 +96,200 @@ async def test_session_error_triggers_shutdown(listener, mocker):
 
     result = await listener.wait_for_shutdown()
     assert isinstance(result, dict)
+
+
+async def test_first_agent_utterance_is_marked_once_answered(listener):
+    mock_session = MagicMock()
+    handlers = {}
+
+    def capture_on(event):
+        def decorator(fn):
+            handlers[event] = fn
+            return fn
+
+        return decorator
+
+    mock_session.on = capture_on
+
+    await listener.listen_to_session(session=mock_session, agent=MagicMock())
+
+    speaking = AgentStateChangedEvent(old_state="listening", new_state="speaking")
+    handlers["agent_state_changed"](speaking)
+    assert not listener._call_trace.has("first_agent_utterance")
+
+    listener._call_trace.mark("answered")
+    handlers["agent_state_changed"](speaking)
+    handlers["agent_state_changed"](speaking)
+    assert [span.name for span in listener._call_trace.spans] == ["answered", "first_agent_utterance"]
+
+
+async def test_turn_latency_is_measured_from_user_stopping_to_agent_speaking(listener):
+    mock_session = MagicMock()
+    handlers = {}
+
+    def capture_on(event):
+        def decorator(fn):
+            handlers[event] = fn
+            return fn
+
+        return decorator
+
+    mock_session.on = capture_on
+
+    await listener.listen_to_session(session=mock_session, agent=MagicMock())
+
+    handlers["user_state_changed"](UserStateChangedEvent(old_state="speaking", new_state="listening", created_at=10.0))
+    handlers["agent_state_changed"](
+        AgentStateChangedEvent(old_state="thinking", new_state="speaking", created_at=10.75)
+    )
+    # the agent speaking again without a new user turn is not a response
+    handlers["agent_state_changed"](
+        AgentStateChangedEvent(old_state="listening", new_state="speaking", created_at=12.0)
+    )
+
+    assert listener.turn_latencies_seconds == [0.75]
+
+
+async def _listen_to_session(listener: CallEventListener) -> dict:
+    mock_session = MagicMock()
+    handlers = {}
+
+    def capture_on(event):
+        def decorator(fn):
+            handlers[event] = fn
+            return fn
+
+        return decorator
+
+    mock_session.on = capture_on
+    await listener.listen_to_session(session=mock_session, agent=MagicMock())
+    return handlers
+
+
+async def test_interruptions_and_overlap_are_measured_from_state_changes(listener):
+    handlers = await _listen_to_session(listener)
+
+    def user(old_state: str, new_state: str, at: float) -> None:
+        handlers["user_state_changed"](UserStateChangedEvent(old_state=old_state, new_state=new_state, created_at=at))
+
+    def agent(old_state: str, new_state: str, at: float) -> None:
+        handlers["agent_state_changed"](AgentStateChangedEvent(old_state=old_state, new_state=new_state, created_at=at))
+
+    user("listening", "speaking", 1.0)
+    user("speaking", "listening", 2.0)
+    agent("thinking", "speaking", 2.5)
+    # the user barges in, and the agent stops half a second later
+    user("listening", "speaking", 3.0)
+    agent("speaking", "listening", 3.5)
+    user("speaking", "listening", 4.0)
+    agent("thinking", "speaking", 4.5)
+    user("listening", "speaking", 4.75)
+    agent("speaking", "listening", 5.0)
+    # the agent starting while the user still speaks overlaps too, but isn't an interruption
+    agent("listening", "speaking", 5.5)
+    user("speaking", "listening", 6.0)
+
+    assert listener.interruptions == 2
+    assert listener.overlap_seconds == 1.25
+    assert listener.turn_latencies_seconds == [0.5, 0.5]
+
+
+def _create_metrics(ttft: float) -> RealtimeModelMetrics:
+    return RealtimeModelMetrics(
+        request_id="response-1",
+        timestamp=0.0,
+        ttft=ttft,
+        input_token_details=RealtimeModelMetrics.InputTokenDetails(),
+        output_token_details=RealtimeModelMetrics.OutputTokenDetails(),
+    )
+
+
+async def test_ttft_is_collected_from_realtime_metrics(listener):
+    handlers = await _listen_to_session(listener)
+
+    for ttft in [0.3, -1, 0.5, 0.4]:
+        handlers["metrics_collected"](MetricsCollectedEvent(metrics=_create_metrics(ttft=ttft)))
+
+    stats = listener.conversation_stats()
+    assert listener.ttft_seconds == [0.3, 0.5, 0.4]
+    assert stats.ttft_p50_seconds == 0.4
+    assert stats.ttft_p90_seconds == 0.5
+    assert stats.turn_latency_p50_seconds is None
+
+
+async def _add_messages(listener: CallEventListener, texts: list[str]) -> None:
+    mock_session = MagicMock()
+    handlers = {}
+
+    def capture_on(event):
+        def decorator(fn):
+            handlers[event] = fn
+            return fn
+
+        return decorator
+
+    mock_session.on = capture_on
+    mock_agent = MagicMock()
+    mock_agent.on_chat_message_added = AsyncMock()
+
+    await listener.listen_to_session(session=mock_session, agent=mock_agent)
+    for text in texts:
+        handlers["conversation_item_added"](ConversationItemAddedEvent(item=ChatMessage(role="user", content=[text])))
+
+
+def _create_listener(mock_logger, **transcript) -> CallEventListener:
+    return CallEventListener(
+        call_trace=CallTrace(correlation_id="test-id"),
+        logger=mock_logger,
+        transcript_cfg=ConfigTranscript(**transcript),
+    )
+
+
+async def test_transcript_is_logged_and_truncated(mock_logger, mocker):
+    mocker.patch.object(mock_logger, "log")
+    listener = _create_listener(mock_logger, max_chars=5)
+
+    await _add_messages(listener, ["Hi", "Hello there"])
+
+    assert listener.turn_count == 2
+    assert [call.args for call in mock_logger.log.call_args_list] == [
+        (logging.INFO, "[%s] %s", "user", "Hi"),
+        (logging.INFO, "[%s] %s", "user", "Hello... (6 more chars)"),
+    ]
+
+
+async def test_transcript_is_not_logged_when_call_not_sampled(mock_logger, mocker):
+    mocker.patch.object(mock_logger, "log")
+    listener = _create_listener(mock_logger, sample_rate=0.0)
+
+    await _add_messages(listener, ["Hi"])
+
+    assert listener.turn_count == 1
+    mock_logger.log.assert_not_called()
+
+
+async def test_transcript_is_not_logged_below_logger_level(mock_logger, mocker):
+    mocker.patch.object(mock_logger, "log")
+    listener = _create_listener(mock_logger, level=LogLevel.DEBUG)
+
+    await _add_messages(listener, ["Hi"])
+
+    mock_logger.log.assert_not_called()
+
+
+async def test_transcript_goes_to_sink_instead_of_log(mock_logger, mocker):
+    mocker.patch.object(mock_logger, "log")
+    mock_sink = MagicMock()
+    listener = CallEventListener(
+        call_trace=CallTrace(correlation_id="test-id"),
+        logger=mock_logger,
+        transcript_cfg=ConfigTranscript(max_chars=2),
+        transcript_sink=mock_sink,
+    )
+
+    await _add_messages(listener, ["Hello there"])
+
+    mock_logger.log.assert_not_called()
+    mock_sink.write.assert_called_once()
+    assert mock_sink.write.call_args.kwargs["correlation_id"] == "test-id"
+    assert mock_sink.write.call_args.kwargs["line"]["text"] == "Hello there"
@@ -1,10 +1,13 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from livekit.agents import AgentStateChangedEvent
 
 from livekit_voice_call_runner.core.call_session_starter import CallSessionStarter
 from livekit_voice_call_runner.logger import create_logger
 from livekit_voice_call_runner.model import CallSessionStarterConfigRealtime
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
 
 
 @pytest.fixture
@@ -19,10 +22,11 @@ def mock_config(mocker):
 
 @pytest.fixture
 def starter(mock_config):
-    logger = create_logger(name="test-starter", correlation_id="test-id")
+    logger = create_logger(name="test-starter")
     return CallSessionStarter(
         config=mock_config,
         agent_ready_timeout_seconds=5.0,
+        call_trace=CallTrace(correlation_id="test-id"),
         logger=logger,
     )
 
@@ -65,3 +69,33 @@ async def test_shutdown_closes_session(starter, mocker):
     await starter.shutdown()
 
     mock_session.aclose.assert_called_once()
+
+
+async def test_start_session_becomes_ready_on_agent_state_changed(starter, mocker):
+    handlers = {}
+
+    mock_session = MagicMock()
+    mock_session.agent_state = "initializing"
+    mock_session.on = lambda event, callback: handlers.setdefault(event, callback)
+
+    async def _start(**_):
+        # the agent becomes ready shortly after start returns
+        asyncio.get_running_loop().call_later(
+            0.01,
+            handlers["agent_state_changed"],
+            AgentStateChangedEvent(old_state="initializing", new_state="listening"),
+        )
+
+    mock_session.start = AsyncMock(side_effect=_start)
+    mocker.patch.object(starter, "_create_session", return_value=mock_session)
+    mock_room = MagicMock()
+    mock_room.name = "test-room"
+
+    await starter.start_session(call_agent=MagicMock(), call_room=mock_room)
+
+    assert 0.0 < starter.time_to_ready_seconds < 1.0
+    mock_session.off.assert_called_once_with("agent_state_changed", handlers["agent_state_changed"])
+
+
+def test_time_to_ready_seconds_is_none_before_start(starter):
+    assert starter.time_to_ready_seconds is None
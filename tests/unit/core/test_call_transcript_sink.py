@@ -0,0 +1,38 @@
+import json
+
+from livekit_voice_call_runner.core.call_transcript_sink import CallTranscriptSink
+from livekit_voice_call_runner.logger import create_logger
+
+
+def _read_lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+async def test_write_appends_one_file_per_call(tmp_path):
+    sink = CallTranscriptSink(
+        directory=str(tmp_path / "transcripts"), logger=create_logger(name="test-sink"), batch_size=2
+    )
+
+    sink.start()
+    for i in range(3):
+        sink.write(correlation_id="call-1", line={"role": "user", "text": f"line {i}"})
+    sink.write(correlation_id="call-2", line={"role": "assistant", "text": "hello"})
+    await sink.shutdown()
+
+    assert [line["text"] for line in _read_lines(tmp_path / "transcripts" / "call-1.jsonl")] == [
+        "line 0",
+        "line 1",
+        "line 2",
+    ]
+    assert _read_lines(tmp_path / "transcripts" / "call-2.jsonl") == [{"role": "assistant", "text": "hello"}]
+    assert sink.written == 4
+
+
+async def test_write_drops_lines_when_queue_is_full(tmp_path):
+    sink = CallTranscriptSink(directory=str(tmp_path), logger=create_logger(name="test-sink"), max_queue_size=2)
+
+    # not started: nothing drains the queue
+    for i in range(5):
+        sink.write(correlation_id="call-1", line={"text": f"line {i}"})
+
+    assert sink.dropped == 3
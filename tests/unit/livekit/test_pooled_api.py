@@ -0,0 +1,32 @@
+from livekit_voice_call_runner.livekit.pooled_api import PooledLiveKitAPI
+
+
+def _create_api() -> PooledLiveKitAPI:
+    return PooledLiveKitAPI(
+        url="wss://test.livekit.cloud",
+        api_key="test-api-key",
+        api_secret="test-api-secret",
+        pool_size=50,
+        keepalive_seconds=30.0,
+        timeout_seconds=5.0,
+    )
+
+
+async def test_session_pool_is_sized_explicitly():
+    livekit_api = _create_api()
+
+    connector = livekit_api._owned_session.connector
+    assert connector.limit == 50
+    assert connector.limit_per_host == 50
+    assert livekit_api._owned_session.timeout.total == 5.0
+
+    await livekit_api.aclose()
+
+
+async def test_aclose_closes_owned_session_once():
+    livekit_api = _create_api()
+
+    await livekit_api.aclose()
+    await livekit_api.aclose()
+
+    assert livekit_api._owned_session.closed
@@ -0,0 +1,150 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+from livekit.agents import APIConnectOptions
+
+from livekit_voice_call_runner.livekit.realtime_model_provider import (
+    PrewarmedRealtimeModel,
+    RealtimeModelProvider,
+    get_realtime_model_provider,
+    shutdown_realtime_model_provider,
+)
+from livekit_voice_call_runner.simulation.factory import create_simulation_config
+
+
+def _create_provider() -> RealtimeModelProvider:
+    return RealtimeModelProvider(logger=MagicMock())
+
+
+@pytest.fixture
+async def model():
+    provider = _create_provider()
+    yield provider.get_model(cfg=create_simulation_config().call_session)
+    await provider.shutdown()
+
+
+def _create_ws() -> MagicMock:
+    ws = MagicMock(closed=False)
+
+    async def close():
+        ws.closed = True
+
+    ws.close = AsyncMock(side_effect=close)
+    return ws
+
+
+def _mock_ws_connect(mocker, model: PrewarmedRealtimeModel) -> list[MagicMock]:
+    opened = []
+
+    async def ws_connect(url, headers):
+        opened.append(_create_ws())
+        return opened[-1]
+
+    mocker.patch.object(model, "_ensure_http_session", return_value=MagicMock(ws_connect=ws_connect))
+    return opened
+
+
+async def _wait_for(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("Condition not met")
+
+
+async def test_get_model_once_per_configuration():
+    provider = _create_provider()
+    cfg = create_simulation_config().call_session
+    other_cfg = cfg.model_copy(
+        update={"turn_detection": cfg.turn_detection.model_copy(update={"silence_duration_ms": 800})}
+    )
+
+    model = provider.get_model(cfg=cfg)
+
+    assert provider.get_model(cfg=cfg.model_copy(deep=True)) is model
+    assert provider.get_model(cfg=other_cfg) is not model
+    assert model._ensure_http_session() is provider._get_http_session()
+    assert provider._get_http_session().connector.limit == 0
+
+    await provider.shutdown()
+
+    assert provider._get_http_session().closed
+
+
+async def test_get_model_prewarms_connections(mocker):
+    mocker.patch.object(PrewarmedRealtimeModel, "prewarm")
+    provider = _create_provider()
+    cfg = create_simulation_config().call_session
+    cfg.llm_prewarm.connections = 2
+
+    model = provider.get_model(cfg=cfg)
+
+    model.prewarm.assert_called_once()
+    assert model.prewarm.call_args.kwargs["size"] == 2
+    await provider.shutdown()
+
+
+async def test_prewarm_refills_taken_connections(mocker, model):
+    opened = _mock_ws_connect(mocker, model)
+
+    assert model._take_prewarmed() is None
+
+    model.prewarm(size=2, max_idle_seconds=60.0, on_error=MagicMock())
+    await _wait_for(lambda: model.prewarmed == 2)
+
+    assert model._take_prewarmed() is opened[1]
+    await _wait_for(lambda: model.prewarmed == 2)
+    assert len(opened) == 3
+
+    await model.aclose()
+
+    assert model.prewarmed == 0
+    assert opened[0].closed and opened[2].closed
+    assert not opened[1].closed
+
+
+async def test_prewarm_replaces_idle_and_closed_connections(mocker, model):
+    opened = _mock_ws_connect(mocker, model)
+
+    model.prewarm(size=1, max_idle_seconds=0.01, on_error=MagicMock())
+    await _wait_for(lambda: model.prewarmed == 1)
+    await asyncio.sleep(0.02)
+
+    assert model._take_prewarmed() is None
+    await _wait_for(lambda: len(opened) > 1)
+    assert opened[0].closed
+
+    model._prewarm_max_idle_seconds = 60.0
+    opened[-1].closed = True
+    assert model._take_prewarmed() is None
+
+    await model.aclose()
+
+
+async def test_prewarm_reports_failures(mocker, model):
+    mocker.patch.object(
+        model,
+        "_ensure_http_session",
+        return_value=MagicMock(ws_connect=AsyncMock(side_effect=aiohttp.ClientError("refused"))),
+    )
+    model._opts.conn_options = APIConnectOptions(retry_interval=0)
+    on_error = MagicMock()
+
+    model.prewarm(size=1, max_idle_seconds=60.0, on_error=on_error)
+    await _wait_for(lambda: on_error.call_count >= 2)
+    await model.aclose()
+
+    assert isinstance(on_error.call_args.args[0], aiohttp.ClientError)
+
+
+async def test_process_wide_provider():
+    provider = get_realtime_model_provider()
+
+    assert get_realtime_model_provider() is provider
+
+    await shutdown_realtime_model_provider()
+
+    assert get_realtime_model_provider() is not provider
+    await shutdown_realtime_model_provider()
@@ -1,16 +1,33 @@
+from typing import Optional
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from prometheus_client import CollectorRegistry
 
+from livekit_voice_call_runner.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from livekit_voice_call_runner.concurrency.arrival_profiles import ConstantArrivalProfile
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
 from livekit_voice_call_runner.concurrency.tasks_runner import ConcurrentTasksRunner
 from livekit_voice_call_runner.logger import create_logger
-from livekit_voice_call_runner.outbound.call_orchestrator import OutboundCallOrchestrator
+from livekit_voice_call_runner.outbound.call_orchestrator import OutboundCallOrchestrator, OutboundCallScheduler
+from livekit_voice_call_runner.outbound.call_record import CallOutcome, CallRecord
+from livekit_voice_call_runner.outbound.call_record_sink import CallRecordSink
+from livekit_voice_call_runner.outbound.campaign_queue import (
+    CampaignCall,
+    CampaignCallQueue,
+    CampaignProgress,
+    CampaignStore,
+)
+from livekit_voice_call_runner.telemetry.loop_monitor import EventLoopMonitor
+from livekit_voice_call_runner.telemetry.metrics import CallMetrics
+from livekit_voice_call_runner.telemetry.tracing import CallTracer
 
 
 @pytest.fixture
 def mock_concurrent_runner():
     runner = MagicMock(spec=ConcurrentTasksRunner)
     runner.run = AsyncMock()
+    runner.run_stream = AsyncMock()
     return runner
 
 
@@ -21,12 +38,17 @@ def mock_cfg():
 
 @pytest.fixture
 def mock_outbound_cfg():
-    return MagicMock()
+    mock_outbound_cfg = MagicMock()
+    mock_outbound_cfg.room_cleanup_batch_size = 50
+    mock_outbound_cfg.shutdown_step_timeout_seconds = 10.0
+    return mock_outbound_cfg
 
 
 @pytest.fixture
 def mock_livekit_api():
-    return MagicMock()
+    mock_livekit_api = MagicMock()
+    mock_livekit_api.aclose = AsyncMock()
+    return mock_livekit_api
 
 
 @pytest.fixture
@@ -41,20 +63,29 @@ def orchestrator(mock_concurrent_runner, mock_cfg, mock_outbound_cfg, mock_livek
         cfg=mock_cfg,
         outbound_cfg=mock_outbound_cfg,
         livekit_api=mock_livekit_api,
+        rate_limiter=LiveKitRateLimiter(),
+        tracer=CallTracer(),
     )
 
 
-async def test_build_props_creates_cartesian_product(orchestrator, mocker):
-    mock_props = MagicMock()
-    mocker.patch(
-        "livekit_voice_call_runner.factory.create_call_runner_props",
-        return_value=mock_props,
-    )
+def test_iter_round_scenarios_cycles_cartesian_product_to_concurrency(orchestrator):
+    orchestrator._concurrency = 3
+
+    scenarios = list(orchestrator._iter_round_scenarios())
+
+    # 1 instruction × 2 phone numbers, padded to concurrency (3)
+    assert scenarios == [
+        ("Do task A.", "+1111111111"),
+        ("Do task A.", "+2222222222"),
+        ("Do task A.", "+1111111111"),
+    ]
+
 
-    props = orchestrator._build_call_runner_props()
+def test_iter_round_scenarios_places_a_fixed_number_of_calls_per_round(orchestrator):
+    # a shard of a multi-process run places its share of the round, not the whole round
+    orchestrator._fixed_calls_per_round = 1
 
-    # 1 instruction × 2 phone numbers = 2 props; padded to concurrency (2)
-    assert len(props) == 2
+    assert list(orchestrator._iter_round_scenarios()) == [("Do task A.", "+1111111111")]
 
 
 async def test_run_executes_correct_number_of_rounds(orchestrator, mocker):
@@ -66,14 +97,353 @@ async def test_run_executes_correct_number_of_rounds(orchestrator, mocker):
     assert mock_run_round.call_count == 3
 
 
-async def test_run_round_submits_tasks_to_concurrent_runner(orchestrator, mocker):
-    mock_props = MagicMock()
-    mock_props.model_config = {"arbitrary_types_allowed": True}
-    mocker.patch.object(orchestrator, "_build_call_runner_props", return_value=[mock_props])
-    mocker.patch("livekit_voice_call_runner.outbound.call_orchestrator.OutboundCallRunner")
-
+async def test_run_round_streams_tasks_to_concurrent_runner(orchestrator):
     await orchestrator._run_round(round=0)
 
-    orchestrator._concurrent_tasks_runner.run.assert_called_once()
-    call_kwargs = orchestrator._concurrent_tasks_runner.run.call_args.kwargs
+    orchestrator._concurrent_tasks_runner.run_stream.assert_called_once()
+    call_kwargs = orchestrator._concurrent_tasks_runner.run_stream.call_args.kwargs
     assert call_kwargs["concurrency"] == orchestrator._concurrency
+    call_kwargs["tasks"].close()
+
+
+async def test_run_streaming_feeds_all_rounds_through_one_pool(orchestrator, mocker):
+    orchestrator._rounds = 3
+    orchestrator._scheduler = OutboundCallScheduler.STREAMING
+    orchestrator._concurrent_tasks_runner.run_stream = AsyncMock()
+    mock_run_round = mocker.patch.object(orchestrator, "_run_round", new_callable=AsyncMock)
+
+    await orchestrator.run()
+
+    mock_run_round.assert_not_called()
+    orchestrator._concurrent_tasks_runner.run_stream.assert_called_once()
+    assert orchestrator._concurrent_tasks_runner.run_stream.call_args.kwargs["concurrency"] == 2
+
+
+def test_iter_call_runner_tasks_yields_calls_for_every_round(orchestrator, mocker):
+    orchestrator._rounds = 3
+    mock_create_call_runner = mocker.patch.object(orchestrator, "_create_call_runner")
+
+    tasks = list(orchestrator._iter_call_runner_tasks())
+    for task in tasks:
+        task.close()
+
+    assert len(tasks) == 6
+    # components are only built once a task runs
+    mock_create_call_runner.assert_not_called()
+
+
+async def test_run_builds_fresh_components_per_call_as_slots_free(orchestrator, mocker):
+    orchestrator._rounds = 2
+    orchestrator._concurrency = 1
+    orchestrator._concurrent_tasks_runner = ConcurrentTasksRunner(logger=create_logger(name="test-runner"))
+    in_flight = 0
+    max_in_flight = 0
+
+    async def run():
+        nonlocal in_flight, max_in_flight
+        max_in_flight = max(max_in_flight, in_flight)
+        in_flight -= 1
+        return MagicMock()
+
+    def create_call_runner_props(**kwargs):
+        nonlocal in_flight
+        in_flight += 1
+        return MagicMock()
+
+    mock_create_call_runner_props = mocker.patch.object(
+        orchestrator, "_create_call_runner_props", side_effect=create_call_runner_props
+    )
+    mock_runner_cls = mocker.patch("livekit_voice_call_runner.outbound.call_orchestrator.OutboundCallRunner")
+    mock_runner_cls.return_value.run = AsyncMock(side_effect=run)
+    mocker.patch.object(orchestrator._summary, "record")
+
+    await orchestrator.run()
+
+    # 2 rounds × (1 instruction × 2 phone numbers), none sharing props
+    assert mock_create_call_runner_props.call_count == 4
+    props = [call.kwargs["props"] for call in mock_runner_cls.call_args_list]
+    assert len({id(prop) for prop in props}) == 4
+    assert max_in_flight == 1
+
+
+async def test_run_open_loop_uses_concurrency_as_in_flight_cap(orchestrator):
+    orchestrator._scheduler = OutboundCallScheduler.OPEN_LOOP
+    orchestrator._arrival_profile = ConstantArrivalProfile(rate=1.0)
+    orchestrator._concurrent_tasks_runner.run_open_loop = AsyncMock()
+
+    await orchestrator.run()
+
+    call_kwargs = orchestrator._concurrent_tasks_runner.run_open_loop.call_args.kwargs
+    assert call_kwargs["max_in_flight"] == 2
+    assert call_kwargs["arrival_profile"] is orchestrator._arrival_profile
+
+
+def test_init_when_open_loop_without_arrival_profile(mock_concurrent_runner, mock_cfg, mock_outbound_cfg):
+    with pytest.raises(ValueError, match="arrival profile is required"):
+        OutboundCallOrchestrator(
+            instructions=["Do task A."],
+            phone_numbers=["+1111111111"],
+            concurrency=1,
+            rounds=1,
+            concurrent_tasks_runner=mock_concurrent_runner,
+            logger=create_logger(name="test-orchestrator"),
+            cfg=mock_cfg,
+            outbound_cfg=mock_outbound_cfg,
+            livekit_api=MagicMock(),
+            rate_limiter=LiveKitRateLimiter(),
+            tracer=CallTracer(),
+            scheduler=OutboundCallScheduler.OPEN_LOOP,
+        )
+
+
+async def test_run_with_prewarm_pool_runs_every_call_through_pool(orchestrator, mocker):
+    orchestrator._rounds = 2
+    orchestrator._prewarm_pool_size = 2
+    orchestrator._scheduler = OutboundCallScheduler.STREAMING
+    orchestrator._concurrent_tasks_runner = ConcurrentTasksRunner(logger=create_logger(name="test-runner"))
+    mock_runner = MagicMock()
+    mock_runner.prepare = AsyncMock()
+    mock_runner.run = AsyncMock()
+    mock_runner.shutdown = AsyncMock()
+    mock_create_call_runner = mocker.patch.object(orchestrator, "_create_call_runner", return_value=mock_runner)
+
+    await orchestrator.run()
+
+    # 2 rounds × (1 instruction × 2 phone numbers)
+    assert mock_create_call_runner.call_count == 4
+    assert mock_runner.prepare.call_count == 4
+    assert mock_runner.run.call_count == 4
+
+
+async def test_run_writes_call_records_to_sink(orchestrator, mocker):
+    orchestrator._rounds = 2
+    orchestrator._scheduler = OutboundCallScheduler.STREAMING
+    orchestrator._concurrent_tasks_runner = ConcurrentTasksRunner(logger=create_logger(name="test-runner"))
+    orchestrator._call_record_sink = MagicMock(spec=CallRecordSink)
+    mock_runner = MagicMock()
+    record = CallRecord(
+        correlation_id="call-1",
+        phone_number_from="+10000000000",
+        phone_number_to="+1111111111",
+        sip_trunk_id="trunk-123",
+        outcome=CallOutcome.COMPLETED,
+        started_at_unix=0.0,
+    )
+    mock_runner.run = AsyncMock(return_value=record)
+    mocker.patch.object(orchestrator, "_create_call_runner_props")
+    mocker.patch("livekit_voice_call_runner.outbound.call_orchestrator.OutboundCallRunner", return_value=mock_runner)
+
+    await orchestrator.run()
+
+    orchestrator._call_record_sink.start.assert_called_once()
+    assert orchestrator._call_record_sink.write.call_count == 4
+    orchestrator._call_record_sink.write.assert_called_with(record)
+    assert orchestrator.summary.outcomes == {"completed": 4}
+    orchestrator._call_record_sink.shutdown.assert_awaited_once()
+
+
+async def test_run_closes_shared_livekit_api_once(orchestrator, mock_livekit_api, mocker):
+    orchestrator._rounds = 2
+    mock_run_round = mocker.patch.object(orchestrator, "_run_round", new_callable=AsyncMock)
+
+    await orchestrator.run()
+
+    assert mock_run_round.await_count == 2
+    mock_livekit_api.aclose.assert_awaited_once()
+
+
+async def test_run_closes_shared_livekit_api_on_failure(orchestrator, mock_livekit_api, mocker):
+    mocker.patch.object(orchestrator, "_run_round", new_callable=AsyncMock, side_effect=RuntimeError("failed"))
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.run()
+
+    mock_livekit_api.aclose.assert_awaited_once()
+
+
+async def test_run_campaign_runs_leased_calls_and_reports_them(orchestrator, mocker, tmp_path):
+    store = CampaignStore(path=str(tmp_path / "campaign.db"))
+    store.create(instructions=["Do task B."], phone_numbers=["+3333333333", "+4444444444"], rounds=2)
+    orchestrator._concurrent_tasks_runner = ConcurrentTasksRunner(logger=create_logger(name="test-runner"))
+    orchestrator._call_queue = CampaignCallQueue(store=store, node_id="node-1", batch_size=2, logger=MagicMock())
+    failed = False
+
+    def create_call_runner(instructions, phone_number_to):
+        nonlocal failed
+        runner = MagicMock()
+        record = CallRecord(
+            correlation_id="call-1",
+            phone_number_from="+10000000000",
+            phone_number_to=phone_number_to,
+            sip_trunk_id="trunk-123",
+            outcome=CallOutcome.COMPLETED,
+            started_at_unix=0.0,
+        )
+        # the first run fails outright; its call goes back to the campaign and runs again
+        runner.run = AsyncMock(side_effect=RuntimeError("failed") if not failed else None, return_value=record)
+        failed = True
+        return runner
+
+    mock_create_call_runner = mocker.patch.object(orchestrator, "_create_call_runner", side_effect=create_call_runner)
+
+    await orchestrator.run()
+
+    assert mock_create_call_runner.call_count == 5
+    assert {call.kwargs["instructions"] for call in mock_create_call_runner.call_args_list} == {"Do task B."}
+    assert store.progress() == CampaignProgress(done=4)
+    assert orchestrator.summary.outcomes == {"completed": 4}
+    store.close()
+
+
+async def test_run_queued_call_releases_the_lease_when_the_runner_cant_be_built(orchestrator, mocker):
+    call = CampaignCall(call_id=1, round=0, instructions="Do task B.", phone_number_to="+3333333333")
+    call_queue = MagicMock(spec=CampaignCallQueue)
+    call_queue.lease = AsyncMock(return_value=call)
+    mocker.patch.object(orchestrator, "_create_call_runner", side_effect=RuntimeError("failed"))
+
+    await orchestrator._run_queued_call(call_queue=call_queue)
+
+    call_queue.fail.assert_awaited_once_with(call)
+    call_queue.complete.assert_not_called()
+
+
+def test_init_when_campaign_with_prewarm_pool(mock_concurrent_runner, mock_cfg, mock_outbound_cfg):
+    with pytest.raises(ValueError, match="can't be prepared ahead"):
+        OutboundCallOrchestrator(
+            instructions=[],
+            phone_numbers=[],
+            concurrency=1,
+            rounds=1,
+            concurrent_tasks_runner=mock_concurrent_runner,
+            logger=create_logger(name="test-orchestrator"),
+            cfg=mock_cfg,
+            outbound_cfg=mock_outbound_cfg,
+            livekit_api=MagicMock(),
+            rate_limiter=LiveKitRateLimiter(),
+            tracer=CallTracer(),
+            prewarm_pool_size=1,
+            call_queue=MagicMock(),
+        )
+
+
+def _create_record(outcome: CallOutcome, disconnect_reason: Optional[str] = None, backend_failure: bool = False):
+    return CallRecord(
+        correlation_id="call-1",
+        phone_number_from="+10000000000",
+        phone_number_to="+1111111111",
+        sip_trunk_id="trunk-123",
+        outcome=outcome,
+        disconnect_reason=disconnect_reason,
+        backend_failure=backend_failure,
+        started_at_unix=0.0,
+        phase_durations={"create_room": 0.5, "start_session": 1.0, "dial": 5.0},
+    )
+
+
+@pytest.mark.parametrize(
+    "outcome, disconnect_reason, backend_failure, failed",
+    [
+        (CallOutcome.COMPLETED, "CLIENT_INITIATED", False, False),
+        (CallOutcome.COMPLETED, "SIP_TRUNK_FAILURE", False, True),
+        (CallOutcome.FAILED, None, True, True),
+        # e.g. busy or no answer
+        (CallOutcome.FAILED, None, False, False),
+    ],
+)
+async def test_run_call_feeds_the_concurrency_limiter(
+    orchestrator, outcome, disconnect_reason, backend_failure, failed
+):
+    orchestrator._concurrency_limiter = MagicMock(spec=AdaptiveConcurrencyLimiter)
+    runner = MagicMock()
+    runner.run = AsyncMock(
+        return_value=_create_record(
+            outcome=outcome, disconnect_reason=disconnect_reason, backend_failure=backend_failure
+        )
+    )
+
+    await orchestrator._run_call(runner=runner, round=0)
+
+    orchestrator._concurrency_limiter.record.assert_called_once_with(failed=failed, setup_latency_seconds=1.5)
+
+
+async def test_busy_or_unanswered_calls_do_not_cut_the_concurrency_limit(orchestrator):
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, logger=MagicMock(), initial_limit=4, window_size=4)
+    orchestrator._concurrency_limiter = limiter
+    runner = MagicMock()
+    runner.run = AsyncMock(return_value=_create_record(outcome=CallOutcome.FAILED))
+
+    for _ in range(4):
+        await orchestrator._run_call(runner=runner, round=0)
+
+    assert limiter.limit == 5
+    assert limiter.stats().decreases == 0
+
+
+async def test_run_call_updates_call_metrics(orchestrator):
+    registry = CollectorRegistry()
+    orchestrator._call_metrics = CallMetrics(registry=registry)
+    in_flight = []
+
+    async def run():
+        in_flight.append(registry.get_sample_value("voice_call_runner_calls_in_flight", {"direction": "outbound"}))
+        return CallRecord(
+            correlation_id="call-1",
+            phone_number_from="+10000000000",
+            phone_number_to="+1111111111",
+            sip_trunk_id="trunk-123",
+            outcome=CallOutcome.COMPLETED,
+            disconnect_reason="CLIENT_INITIATED",
+            started_at_unix=0.0,
+            phase_durations={"dial": 5.0},
+            turn_latencies_seconds=[0.5, 0.7],
+        )
+
+    runner = MagicMock()
+    runner.run = run
+
+    await orchestrator._run_call(runner=runner, round=0)
+
+    assert in_flight == [1.0]
+    assert registry.get_sample_value("voice_call_runner_calls_in_flight", {"direction": "outbound"}) == 0.0
+    assert (
+        registry.get_sample_value(
+            "voice_call_runner_calls_ended_total",
+            {"direction": "outbound", "outcome": "completed", "reason": "CLIENT_INITIATED"},
+        )
+        == 1.0
+    )
+    assert (
+        registry.get_sample_value(
+            "voice_call_runner_phase_duration_seconds_count", {"direction": "outbound", "phase": "dial"}
+        )
+        == 1.0
+    )
+    assert registry.get_sample_value("voice_call_runner_turn_latency_seconds_count", {"direction": "outbound"}) == 2.0
+
+
+async def test_run_call_records_the_worst_event_loop_lag_and_adds_the_run_lag(orchestrator, mocker):
+    monitor = EventLoopMonitor(logger=MagicMock())
+    orchestrator._event_loop_monitor = monitor
+
+    async def run():
+        monitor._record(lag_seconds=0.3, due_at=0.0)
+        return CallRecord(
+            correlation_id="call-1",
+            phone_number_from="+10000000000",
+            phone_number_to="+1111111111",
+            sip_trunk_id="trunk-123",
+            outcome=CallOutcome.COMPLETED,
+            started_at_unix=0.0,
+        )
+
+    runner = MagicMock()
+    runner.run = run
+    monitor._record(lag_seconds=0.5, due_at=0.0)
+
+    record = await orchestrator._run_call(runner=runner, round=0)
+    mocker.patch.object(orchestrator, "_run_round", AsyncMock())
+    await orchestrator.run()
+
+    assert record.max_event_loop_lag_seconds == 0.3
+    assert orchestrator.summary.slow_callbacks == 2
+    assert orchestrator.summary.latencies["event_loop_lag"].count == 2
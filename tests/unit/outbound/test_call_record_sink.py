@@ -0,0 +1,113 @@
+import csv
+import json
+
+import pytest
+
+from livekit_voice_call_runner.logger import create_logger
+from livekit_voice_call_runner.outbound.call_record import CallOutcome, CallRecord
+from livekit_voice_call_runner.outbound.call_record_sink import (
+    CallRecordFormat,
+    CallRecordSink,
+    CallRecordWriter,
+    create_call_record_writer,
+)
+
+
+def _create_record(index: int) -> CallRecord:
+    return CallRecord(
+        correlation_id=f"call-{index}",
+        phone_number_from="+10000000000",
+        phone_number_to="+19999999999",
+        sip_trunk_id="trunk-123",
+        outcome=CallOutcome.COMPLETED,
+        disconnect_reason="CLIENT_INITIATED",
+        turn_count=3,
+        started_at_unix=1_700_000_000.0,
+        duration_seconds=12.5,
+        phase_durations={"dial": 2.0},
+        phase_offsets={"answered": 4.0},
+        turn_latencies_seconds=[0.9, 0.5, 0.7],
+        interruptions=1,
+    )
+
+
+class _CollectingWriter(CallRecordWriter):
+    def __init__(self):
+        self.batches: list[list[CallRecord]] = []
+        self.closed = False
+
+    def write_batch(self, records):
+        self.batches.append(records)
+
+    def close(self):
+        self.closed = True
+
+
+def test_call_record_to_row_flattens_phases():
+    row = _create_record(0).to_row()
+
+    assert list(row) == CallRecord.columns()
+    assert row["outcome"] == "completed"
+    assert row["dial_seconds"] == 2.0
+    assert row["answered_offset_seconds"] == 4.0
+    assert row["create_room_seconds"] is None
+    assert row["turn_latency_p50_seconds"] == 0.7
+    assert row["turn_latency_p90_seconds"] == 0.9
+    assert row["ttft_p50_seconds"] is None
+    assert row["interruptions"] == 1
+
+
+async def test_sink_writes_every_record_in_batches_and_closes_writer():
+    writer = _CollectingWriter()
+    sink = CallRecordSink(writer=writer, logger=create_logger(name="test-sink"), batch_size=2)
+
+    sink.start()
+    for i in range(5):
+        await sink.write(_create_record(i))
+    await sink.shutdown()
+
+    assert [record.correlation_id for batch in writer.batches for record in batch] == [f"call-{i}" for i in range(5)]
+    assert max(len(batch) for batch in writer.batches) <= 2
+    assert sink.written == 5
+    assert writer.closed
+
+
+async def test_sink_writes_jsonl(tmp_path):
+    path = tmp_path / "calls.jsonl"
+    writer = create_call_record_writer(path=str(path), record_format=CallRecordFormat.JSONL)
+    sink = CallRecordSink(writer=writer, logger=create_logger(name="test-sink"))
+
+    sink.start()
+    await sink.write(_create_record(0))
+    await sink.shutdown()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["phase_durations"] == {"dial": 2.0}
+
+
+def test_csv_writer_writes_header_and_rows(tmp_path):
+    path = tmp_path / "calls.csv"
+    writer = create_call_record_writer(path=str(path), record_format=CallRecordFormat.CSV)
+
+    writer.write_batch([_create_record(0), _create_record(1)])
+    writer.close()
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["correlation_id"] for row in rows] == ["call-0", "call-1"]
+    assert rows[0]["dial_seconds"] == "2.0"
+
+
+def test_parquet_writer_writes_rows(tmp_path):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "calls.parquet"
+    writer = create_call_record_writer(path=str(path), record_format=CallRecordFormat.PARQUET)
+
+    writer.write_batch([_create_record(0)])
+    writer.write_batch([_create_record(1)])
+    writer.close()
+
+    table = pyarrow_parquet.read_table(path)
+    assert table.num_rows == 2
+    assert table.column("turn_count").to_pylist() == [3, 3]
@@ -1,13 +1,17 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from livekit import api
 
 from livekit_voice_call_runner.logger import create_logger
+from livekit_voice_call_runner.outbound.call_record import CallOutcome
 from livekit_voice_call_runner.outbound.call_runner import (
     OutboundCallRunner,
     OutboundCallRunnerConfig,
     OutboundCallRunnerProps,
 )
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
 
 
 @pytest.fixture
@@ -36,8 +40,14 @@ def mock_props(outbound_config):
     mock_session_starter.session = MagicMock()
     mock_session_starter.start_session = AsyncMock()
     mock_session_starter.shutdown = AsyncMock()
+    mock_session_starter.time_to_ready_seconds = 0.1
 
     mock_event_listener = MagicMock()
+    mock_event_listener.turn_count = 2
+    mock_event_listener.turn_latencies_seconds = [0.8, 1.2]
+    mock_event_listener.ttft_seconds = [0.4, 0.6]
+    mock_event_listener.interruptions = 1
+    mock_event_listener.overlap_seconds = 0.3
     mock_event_listener.listen_to_room = AsyncMock()
     mock_event_listener.listen_to_session = AsyncMock()
     mock_event_listener.wait_for_shutdown = AsyncMock(
@@ -48,7 +58,7 @@ def mock_props(outbound_config):
     mock_dialer.dial = AsyncMock()
     mock_dialer.shutdown = AsyncMock()
 
-    logger = create_logger(name="test-runner", correlation_id="test-id")
+    logger = create_logger(name="test-runner")
 
     return OutboundCallRunnerProps.model_construct(
         call_agent=mock_agent,
@@ -57,6 +67,7 @@ def mock_props(outbound_config):
         call_event_listener=mock_event_listener,
         call_dialer=mock_dialer,
         outbound_config=outbound_config,
+        call_trace=CallTrace(correlation_id="test-id"),
         logger=logger,
     )
 
@@ -79,3 +90,155 @@ async def test_shutdown_called_even_on_exception(mock_props):
     mock_props.call_session_starter.shutdown.assert_called_once()
     mock_props.call_room_connector.shutdown.assert_called_once()
     mock_props.call_dialer.shutdown.assert_called_once()
+
+
+async def test_shutdown_runs_independent_steps_at_once(mock_props):
+    order = []
+
+    async def close_session():
+        order.append("close_session")
+        await asyncio.sleep(0.05)
+        order.append("session_closed")
+
+    async def shutdown_dialer():
+        order.append("shutdown_dialer")
+
+    async def disconnect_room():
+        order.append("disconnect_room")
+
+    mock_props.call_session_starter.shutdown = AsyncMock(side_effect=close_session)
+    mock_props.call_dialer.shutdown = AsyncMock(side_effect=shutdown_dialer)
+    mock_props.call_room_connector.shutdown = AsyncMock(side_effect=disconnect_room)
+
+    await OutboundCallRunner(props=mock_props).shutdown()
+
+    # the dialer doesn't wait for the session, the room does
+    assert order == ["close_session", "shutdown_dialer", "session_closed", "disconnect_room"]
+
+
+async def test_shutdown_gives_up_on_a_step_past_its_deadline(mock_props):
+    async def hang():
+        await asyncio.sleep(10)
+
+    mock_props.outbound_config.shutdown_step_timeout_seconds = 0.05
+    mock_props.call_session_starter.shutdown = AsyncMock(side_effect=hang)
+
+    record = await OutboundCallRunner(props=mock_props).run()
+
+    mock_props.call_room_connector.shutdown.assert_called_once()
+    mock_props.call_dialer.shutdown.assert_called_once()
+    assert record.outcome == CallOutcome.COMPLETED
+    assert 0.05 <= record.phase_durations["shutdown"] < 1.0
+
+
+async def test_shutdown_of_an_unrun_runner_finishes_its_trace(mock_props):
+    runner = OutboundCallRunner(props=mock_props)
+    await runner.prepare()
+
+    await runner.shutdown()
+
+    assert mock_props.call_trace.finished_at is not None
+    assert [span.name for span in mock_props.call_trace.spans] == ["shutdown"]
+
+
+async def test_run_skips_setup_when_prepared(mock_props):
+    runner = OutboundCallRunner(props=mock_props)
+    await runner.prepare()
+    await runner.run()
+
+    assert runner.prepared
+    mock_props.call_room_connector.connect.assert_called_once()
+    mock_props.call_session_starter.start_session.assert_called_once()
+    mock_props.call_dialer.dial.assert_called_once()
+
+
+async def test_run_records_call_phases(mock_props):
+    runner = OutboundCallRunner(props=mock_props)
+    await runner.run()
+
+    call_trace = mock_props.call_trace
+    assert [span.name for span in call_trace.spans] == ["dial", "answered", "hangup", "shutdown"]
+    assert call_trace.finished_at is not None
+
+
+async def test_run_returns_call_record(mock_props):
+    mock_props.call_event_listener.wait_for_shutdown = AsyncMock(
+        return_value={"name": "Participant disconnected", "context": {"reason": "CLIENT_INITIATED"}}
+    )
+
+    record = await OutboundCallRunner(props=mock_props).run()
+
+    assert record.outcome == CallOutcome.COMPLETED
+    assert record.correlation_id == "test-id"
+    assert record.phone_number_to == "+19999999999"
+    assert record.shutdown_reason == "Participant disconnected"
+    assert record.disconnect_reason == "CLIENT_INITIATED"
+    assert record.turn_count == 2
+    assert record.turn_latencies_seconds == [0.8, 1.2]
+    assert record.ttft_seconds == [0.4, 0.6]
+    assert record.interruptions == 1
+    assert record.overlap_seconds == 0.3
+    assert record.time_to_ready_seconds == 0.1
+    assert "dial" in record.phase_durations
+    assert "hangup" in record.phase_offsets
+    assert record.duration_seconds is not None
+
+
+async def test_run_returns_failed_call_record(mock_props):
+    mock_props.call_dialer.dial = AsyncMock(side_effect=TimeoutError())
+
+    record = await OutboundCallRunner(props=mock_props).run()
+
+    assert record.outcome == CallOutcome.FAILED
+    assert record.error == "TimeoutError"
+    assert record.shutdown_reason is None
+
+
+def _create_sip_error(sip_status_code: str, sip_status: str) -> api.TwirpError:
+    # LiveKit reports the callee's SIP answer in the error's metadata
+    return api.TwirpError(
+        code=api.TwirpErrorCode.UNAVAILABLE,
+        msg=sip_status,
+        status=503,
+        metadata={"sip_status_code": sip_status_code, "sip_status": sip_status},
+    )
+
+
+@pytest.mark.parametrize(
+    "dial_error, backend_failure",
+    [
+        (TimeoutError(), True),
+        (api.TwirpError(code=api.TwirpErrorCode.UNAVAILABLE, msg="SIP_TRUNK_FAILURE", status=503), True),
+        (api.TwirpError(code=api.TwirpErrorCode.RESOURCE_EXHAUSTED, msg="rate limited", status=429), True),
+        (_create_sip_error("503", "Service Unavailable"), True),
+        (_create_sip_error("486", "Busy Here"), False),
+        (_create_sip_error("480", "Temporarily Unavailable"), False),
+        (_create_sip_error("603", "Decline"), False),
+        (api.TwirpError(code=api.TwirpErrorCode.INVALID_ARGUMENT, msg="invalid number", status=400), False),
+    ],
+)
+async def test_run_records_whether_a_dial_failed_on_the_backend(mock_props, dial_error, backend_failure):
+    mock_props.call_dialer.dial = AsyncMock(side_effect=dial_error)
+
+    record = await OutboundCallRunner(props=mock_props).run()
+
+    assert record.outcome == CallOutcome.FAILED
+    assert record.backend_failure == backend_failure
+
+
+async def test_run_records_setup_failures_as_backend_failures(mock_props):
+    mock_props.call_session_starter.start_session = AsyncMock(side_effect=RuntimeError("session failed"))
+
+    record = await OutboundCallRunner(props=mock_props).run()
+
+    assert record.backend_failure
+    mock_props.call_dialer.dial.assert_not_called()
+
+
+async def test_run_does_not_record_failures_after_the_answer_as_backend_failures(mock_props):
+    mock_props.call_event_listener.wait_for_shutdown = AsyncMock(side_effect=TimeoutError())
+
+    record = await OutboundCallRunner(props=mock_props).run()
+
+    assert record.outcome == CallOutcome.FAILED
+    assert not record.backend_failure
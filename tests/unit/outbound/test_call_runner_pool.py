@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from livekit_voice_call_runner.outbound.call_runner_pool import OutboundCallRunnerPool
+
+
+def _create_runner(prepare_delay: float = 0.0, prepare_error: bool = False):
+    runner = MagicMock()
+
+    async def _prepare():
+        await asyncio.sleep(prepare_delay)
+        if prepare_error:
+            raise RuntimeError("prepare failed")
+
+    runner.prepare = AsyncMock(side_effect=_prepare)
+    runner.shutdown = AsyncMock()
+    return runner
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _create_pool(factories, mock_logger, size=2, max_idle_seconds=60.0, clock=None):
+    return OutboundCallRunnerPool(
+        runner_factories=iter(factories),
+        size=size,
+        max_idle_seconds=max_idle_seconds,
+        logger=mock_logger,
+        **({"clock": clock} if clock else {}),
+    )
+
+
+async def test_acquire_hands_out_prepared_runners_in_order(mock_logger):
+    runners = [_create_runner() for _ in range(3)]
+    pool = _create_pool(factories=[lambda r=r: r for r in runners], mock_logger=mock_logger)
+    pool.start()
+    await asyncio.sleep(0.01)
+
+    acquired = [await pool.acquire() for _ in range(3)]
+
+    assert acquired == runners
+    assert await pool.acquire() is None
+    assert pool.stats.hits >= 2
+    assert pool.stats.prepared == 3
+    for runner in runners:
+        runner.prepare.assert_called_once()
+    await pool.shutdown()
+
+
+async def test_acquire_counts_miss_when_runner_still_preparing(mock_logger):
+    runner = _create_runner(prepare_delay=0.05)
+    pool = _create_pool(factories=[lambda: runner], mock_logger=mock_logger)
+    pool.start()
+
+    assert await pool.acquire() is runner
+    assert pool.stats.misses == 1
+    assert pool.stats.hits == 0
+    await pool.shutdown()
+
+
+async def test_acquire_hands_out_fresh_runner_when_prepare_failed(mock_logger):
+    failed = _create_runner(prepare_error=True)
+    fresh = _create_runner()
+    created = iter([failed, fresh])
+    pool = _create_pool(factories=[lambda: next(created)], mock_logger=mock_logger)
+    pool.start()
+    await asyncio.sleep(0.01)
+
+    assert await pool.acquire() is fresh
+    assert pool.stats.prepare_failures == 1
+    assert (pool.stats.hits, pool.stats.misses) == (0, 1)
+    failed.shutdown.assert_called_once()
+    fresh.prepare.assert_not_called()
+    await pool.shutdown()
+
+
+async def test_acquire_evicts_stale_runner(mock_logger):
+    clock = _Clock()
+    stale = _create_runner()
+    fresh = _create_runner()
+    created = iter([stale, fresh])
+    pool = _create_pool(
+        factories=[lambda: next(created)],
+        mock_logger=mock_logger,
+        max_idle_seconds=10.0,
+        clock=clock,
+    )
+    pool.start()
+    await asyncio.sleep(0.01)
+    clock.now = 11.0
+
+    assert await pool.acquire() is fresh
+    assert pool.stats.evictions == 1
+    await pool.shutdown()
+    stale.shutdown.assert_called_once()
+
+
+async def test_shutdown_tears_down_unused_runners(mock_logger):
+    runners = [_create_runner() for _ in range(2)]
+    pool = _create_pool(factories=[lambda r=r: r for r in runners], mock_logger=mock_logger)
+    pool.start()
+    await asyncio.sleep(0.01)
+
+    await pool.shutdown()
+
+    for runner in runners:
+        runner.shutdown.assert_called_once()
+
+
+def test_init_when_size_invalid(mock_logger):
+    with pytest.raises(ValueError):
+        _create_pool(factories=[], mock_logger=mock_logger, size=0)
@@ -0,0 +1,185 @@
+import asyncio
+import contextlib
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from livekit_voice_call_runner.outbound.call_record import CallOutcome, CallRecord
+from livekit_voice_call_runner.outbound.campaign_queue import CampaignCallQueue, CampaignProgress, CampaignStore
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    store = CampaignStore(path=str(tmp_path / "campaign.db"), lease_seconds=60.0, max_attempts=2, clock=clock)
+    store.create(instructions=["Do task A."], phone_numbers=["+1111111111", "+2222222222"], rounds=2)
+    yield store
+    store.close()
+
+
+def _create_record(phone_number_to: str = "+1111111111") -> CallRecord:
+    return CallRecord(
+        correlation_id="call-1",
+        phone_number_from="+10000000000",
+        phone_number_to=phone_number_to,
+        sip_trunk_id="ST_1",
+        outcome=CallOutcome.COMPLETED,
+        started_at_unix=0.0,
+        duration_seconds=1.0,
+    )
+
+
+def test_create_adds_every_pair_per_round_once(store):
+    assert store.create(instructions=["Do task B."], phone_numbers=["+3333333333"], rounds=1) == 0
+    assert store.progress() == CampaignProgress(pending=4)
+
+    calls = store.lease(node_id="node-1", limit=10)
+
+    assert [(call.round, call.phone_number_to) for call in calls] == [
+        (0, "+1111111111"),
+        (0, "+2222222222"),
+        (1, "+1111111111"),
+        (1, "+2222222222"),
+    ]
+    assert {call.instructions for call in calls} == {"Do task A."}
+
+
+def test_database_uses_the_rollback_journal(tmp_path):
+    path = str(tmp_path / "campaign.db")
+    with contextlib.closing(sqlite3.connect(path)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+
+    store = CampaignStore(path=path)
+    store.close()
+
+    with contextlib.closing(sqlite3.connect(path)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+
+
+def test_lease_hands_out_each_call_once(store):
+    first = store.lease(node_id="node-1", limit=3)
+    second = store.lease(node_id="node-2", limit=3)
+
+    assert len(first) == 3
+    assert len(second) == 1
+    assert not {call.call_id for call in first} & {call.call_id for call in second}
+    assert store.progress() == CampaignProgress(leased=4)
+    assert store.has_open_calls(node_id="node-1")
+    assert not store.lease(node_id="node-2", limit=3)
+
+
+def test_expired_lease_is_reissued_then_abandoned(store, clock):
+    calls = store.lease(node_id="node-1", limit=1)
+
+    clock.now += 61
+    reissued = store.lease(node_id="node-2", limit=1)
+    assert [call.call_id for call in reissued] == [calls[0].call_id]
+
+    clock.now += 61
+    assert store.reclaim_expired() == 1
+    assert store.progress() == CampaignProgress(pending=3, abandoned=1)
+
+
+def test_renew_keeps_the_lease(store, clock):
+    calls = store.lease(node_id="node-1", limit=1)
+
+    clock.now += 50
+    assert store.renew(node_id="node-1", call_ids=[calls[0].call_id]) == 1
+    assert store.renew(node_id="node-2", call_ids=[calls[0].call_id]) == 0
+    clock.now += 50
+
+    assert store.reclaim_expired() == 0
+    assert store.progress() == CampaignProgress(pending=3, leased=1)
+
+
+def test_complete_keeps_the_first_record(store, clock):
+    call = store.lease(node_id="node-1", limit=1)[0]
+    clock.now += 61
+    store.lease(node_id="node-2", limit=1)
+
+    store.complete(node_id="node-2", call_id=call.call_id, record=_create_record(phone_number_to="+2"))
+    store.complete(node_id="node-1", call_id=call.call_id, record=_create_record(phone_number_to="+1"))
+
+    assert store.progress() == CampaignProgress(pending=3, done=1)
+    assert [record.phone_number_to for record in store.iter_records()] == ["+2"]
+
+
+def test_release_returns_calls_without_an_attempt(store, clock):
+    call = store.lease(node_id="node-1", limit=1)[0]
+
+    store.release(node_id="node-1", call_ids=[call.call_id])
+    assert store.progress() == CampaignProgress(pending=4)
+    store.lease(node_id="node-1", limit=4)
+    clock.now += 61
+
+    # one attempt each so far, under the limit of two
+    assert store.reclaim_expired() == 4
+    assert store.progress() == CampaignProgress(pending=4)
+
+
+def test_release_after_a_failed_run_counts_the_attempt(store):
+    calls = store.lease(node_id="node-1", limit=1)
+    store.release(node_id="node-1", call_ids=[calls[0].call_id], attempted=True)
+
+    calls = store.lease(node_id="node-1", limit=1)
+    store.release(node_id="node-1", call_ids=[calls[0].call_id], attempted=True)
+
+    assert store.progress() == CampaignProgress(pending=3, abandoned=1)
+
+
+def _create_queue(store: CampaignStore, node_id: str, batch_size: int = 2) -> CampaignCallQueue:
+    return CampaignCallQueue(
+        store=store, node_id=node_id, batch_size=batch_size, logger=MagicMock(), poll_interval_seconds=0.01
+    )
+
+
+async def test_queue_leases_in_batches_until_the_campaign_is_done(store):
+    queue = _create_queue(store, node_id="node-1")
+    queue.start()
+
+    leased = []
+    while (call := await queue.lease()) is not None:
+        leased.append(call)
+        assert store.progress().leased == 2 - (len(leased) - 1) % 2
+        await queue.complete(call=call, record=_create_record(phone_number_to=call.phone_number_to))
+    await queue.shutdown()
+
+    assert len(leased) == 4
+    assert store.progress() == CampaignProgress(done=4)
+
+
+async def test_queue_takes_over_calls_of_a_dead_node(store, clock):
+    store.lease(node_id="dead-node", limit=4)
+    queue = _create_queue(store, node_id="node-1")
+    leasing = asyncio.create_task(queue.lease())
+
+    # the other node's leases are live, so the queue polls rather than ending
+    await asyncio.sleep(0.05)
+    assert not leasing.done()
+    clock.now += 61
+    call = await leasing
+
+    assert call is not None
+    await queue.shutdown()
+
+
+async def test_queue_shutdown_releases_unstarted_calls(store):
+    queue = _create_queue(store, node_id="node-1", batch_size=4)
+
+    await queue.lease()
+    await queue.shutdown()
+
+    assert store.progress() == CampaignProgress(pending=3, leased=1)
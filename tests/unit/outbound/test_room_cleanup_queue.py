@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from livekit import api
+
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter
+from livekit_voice_call_runner.outbound.call_room_connector import OutboundCallRoomConnector
+from livekit_voice_call_runner.outbound.room_cleanup_queue import RoomCleanupQueue
+from livekit_voice_call_runner.telemetry.tracing import CallTrace
+
+
+def _create_livekit_api(delete_room: AsyncMock) -> MagicMock:
+    livekit_api = MagicMock()
+    livekit_api.room.delete_room = delete_room
+    return livekit_api
+
+
+def _deleted_room_names(delete_room: AsyncMock) -> list[str]:
+    return [call.args[0].room for call in delete_room.call_args_list]
+
+
+async def test_deletes_rooms_queued_at_once_in_one_batch():
+    in_flight, max_in_flight = 0, 0
+
+    async def delete_room(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    delete_room_mock = AsyncMock(side_effect=delete_room)
+    queue = RoomCleanupQueue(
+        livekit_api=_create_livekit_api(delete_room_mock),
+        rate_limiter=LiveKitRateLimiter(),
+        logger=MagicMock(),
+        batch_size=3,
+    )
+    queue.start()
+
+    for index in range(5):
+        queue.enqueue(f"room-{index}")
+    await queue.shutdown()
+
+    assert _deleted_room_names(delete_room_mock) == [f"room-{index}" for index in range(5)]
+    assert max_in_flight == 3
+    assert queue.stats().model_dump() == {"deleted": 5, "failed": 0, "batches": 2, "largest_batch": 3}
+
+
+async def test_counts_rooms_already_gone_as_deleted_and_others_as_failed():
+    async def delete_room(request):
+        if request.room == "gone":
+            raise api.TwirpError(code=api.TwirpErrorCode.NOT_FOUND, msg="room not found", status=404)
+        if request.room == "slow":
+            await asyncio.sleep(10)
+        raise api.TwirpError(code=api.TwirpErrorCode.UNAVAILABLE, msg="unavailable", status=503)
+
+    logger = MagicMock()
+    queue = RoomCleanupQueue(
+        livekit_api=_create_livekit_api(AsyncMock(side_effect=delete_room)),
+        rate_limiter=LiveKitRateLimiter(),
+        logger=logger,
+        timeout_seconds=0.05,
+    )
+    queue.start()
+
+    for room_name in ["gone", "slow", "down"]:
+        queue.enqueue(room_name)
+    await queue.shutdown()
+
+    stats = queue.stats()
+    assert (stats.deleted, stats.failed) == (1, 2)
+    assert sorted(call.kwargs["extra"]["room_name"] for call in logger.warning.call_args_list) == ["down", "slow"]
+
+
+@pytest.mark.parametrize("disconnect_error", [None, RuntimeError("disconnect failed")])
+async def test_room_connector_queues_its_room_for_deletion_on_shutdown(disconnect_error):
+    room_cleanup_queue = MagicMock(spec=RoomCleanupQueue)
+    connector = OutboundCallRoomConnector(
+        room_name_prefix="test",
+        participant_identity="agent",
+        livekit_url="ws://test",
+        livekit_api=MagicMock(),
+        rate_limiter=LiveKitRateLimiter(),
+        call_trace=CallTrace(correlation_id="call-1"),
+        logger=MagicMock(),
+        room_cleanup_queue=room_cleanup_queue,
+    )
+    room = MagicMock()
+    room.name = "test-call-1"
+    room.disconnect = AsyncMock(side_effect=disconnect_error)
+    connector._room = room
+
+    if disconnect_error:
+        with pytest.raises(RuntimeError):
+            await connector.shutdown()
+    else:
+        await connector.shutdown()
+
+    room_cleanup_queue.enqueue.assert_called_once_with("test-call-1")
+
+
+async def test_room_connector_shutdown_without_a_room():
+    room_cleanup_queue = MagicMock(spec=RoomCleanupQueue)
+    connector = OutboundCallRoomConnector(
+        room_name_prefix="test",
+        participant_identity="agent",
+        livekit_url="ws://test",
+        livekit_api=MagicMock(),
+        rate_limiter=LiveKitRateLimiter(),
+        call_trace=CallTrace(correlation_id="call-1"),
+        logger=MagicMock(),
+        room_cleanup_queue=room_cleanup_queue,
+    )
+
+    await connector.shutdown()
+
+    room_cleanup_queue.enqueue.assert_not_called()
@@ -0,0 +1,108 @@
+import json
+
+from livekit_voice_call_runner.outbound.call_record import CallOutcome, CallRecord
+from livekit_voice_call_runner.outbound.run_summary import (
+    CALL_OVERLAP,
+    DIAL_TO_ANSWER,
+    EVENT_LOOP_LAG,
+    REALTIME_TTFT,
+    TEARDOWN,
+    TIME_TO_FIRST_AGENT_UTTERANCE,
+    TIME_TO_READY,
+    TURN_LATENCY,
+    RunSummary,
+)
+from livekit_voice_call_runner.telemetry.histogram import LatencyHistogram
+
+
+def _create_record(**kwargs) -> CallRecord:
+    return CallRecord(
+        correlation_id="call-1",
+        phone_number_from="+10000000000",
+        phone_number_to="+19999999999",
+        sip_trunk_id="trunk-123",
+        started_at_unix=0.0,
+        **kwargs,
+    )
+
+
+def _create_completed_record() -> CallRecord:
+    return _create_record(
+        outcome=CallOutcome.COMPLETED,
+        disconnect_reason="CLIENT_INITIATED",
+        time_to_ready_seconds=1.5,
+        phase_durations={"dial": 4.0, "shutdown": 0.5},
+        phase_offsets={"answered": 6.0, "first_agent_utterance": 7.0},
+        turn_latencies_seconds=[0.5, 0.9],
+        ttft_seconds=[0.3, 0.4, 0.35],
+        interruptions=2,
+        overlap_seconds=1.25,
+    )
+
+
+def test_dial_to_answer_leaves_out_the_wait_for_the_trunk_rate_limit():
+    summary = RunSummary()
+
+    summary.record(
+        _create_record(
+            outcome=CallOutcome.COMPLETED,
+            phase_durations={"dial_rate_limit_wait": 1.5, "dial": 4.0},
+            phase_offsets={"answered": 6.0},
+        )
+    )
+
+    assert summary.latencies[DIAL_TO_ANSWER].max == 2.5
+
+
+def test_record_counts_outcomes_and_latencies():
+    summary = RunSummary()
+
+    summary.record(_create_completed_record())
+    summary.record(_create_record(outcome=CallOutcome.FAILED, error="SIP_TRUNK_FAILURE"))
+
+    assert summary.calls == 2
+    assert summary.outcomes == {"completed": 1, "failed": 1}
+    assert summary.disconnect_reasons == {"CLIENT_INITIATED": 1}
+    assert summary.errors == {"SIP_TRUNK_FAILURE": 1}
+    assert summary.latencies[TIME_TO_READY].count == 1
+    assert summary.latencies[DIAL_TO_ANSWER].max == 4.0
+    assert summary.latencies[TIME_TO_FIRST_AGENT_UTTERANCE].max == 1.0
+    assert summary.latencies[TURN_LATENCY].count == 2
+    assert summary.latencies[REALTIME_TTFT].count == 3
+    # only answered calls have a conversation to overlap in
+    assert summary.latencies[CALL_OVERLAP].count == 1
+    assert summary.latencies[CALL_OVERLAP].max == 1.25
+    assert summary.latencies[TEARDOWN].count == 1
+    assert summary.latencies[TEARDOWN].max == 0.5
+    assert summary.interruptions == 2
+
+
+def test_merge_restored_summaries():
+    first, second = RunSummary(), RunSummary()
+    first.record(_create_completed_record())
+    second.record(_create_completed_record())
+    lag = LatencyHistogram()
+    lag.record(0.2)
+    first.record_event_loop_lag(histogram=lag, slow_callbacks=1)
+
+    merged = RunSummary.from_mergeable_dict(json.loads(json.dumps(first.to_mergeable_dict())))
+    merged.merge(second)
+
+    assert merged.outcomes == {"completed": 2}
+    assert merged.latencies[TURN_LATENCY].count == 4
+    assert merged.interruptions == 4
+    assert merged.slow_callbacks == 1
+    assert merged.latencies[EVENT_LOOP_LAG].max == 0.2
+    assert json.loads(json.dumps(merged.to_dict()))["latencies_seconds"][DIAL_TO_ANSWER]["count"] == 2
+
+
+def test_format_lists_every_latency():
+    summary = RunSummary()
+    summary.record(_create_completed_record())
+
+    text = summary.format()
+
+    assert "Calls: 1 (completed: 1)" in text
+    assert "CLIENT_INITIATED: 1" in text
+    for name in [TIME_TO_READY, DIAL_TO_ANSWER, TIME_TO_FIRST_AGENT_UTTERANCE, TURN_LATENCY]:
+        assert name in text
@@ -0,0 +1,49 @@
+from livekit_voice_call_runner.simulation.fake_livekit import SimulationProfile
+from livekit_voice_call_runner.simulation.simulator import simulate_inbound, simulate_outbound
+
+
+def _create_profile(**kwargs) -> SimulationProfile:
+    return SimulationProfile(time_scale=0.001, seed=1, **kwargs)
+
+
+async def test_simulate_outbound_runs_every_call_end_to_end():
+    result = await simulate_outbound(calls=20, concurrency=5, profile=_create_profile())
+
+    assert result.calls == 20
+    assert result.rooms_created == 20
+    assert result.calls_dialed == 20
+    assert result.calls_hung_up == 20
+    assert result.summary is not None
+    assert result.summary["outcomes"] == {"completed": 20}
+    assert result.summary["disconnect_reasons"] == {"CLIENT_INITIATED": 20}
+    assert result.summary["latencies_seconds"]["time_to_first_agent_utterance"]["count"] == 20
+    assert result.summary["latencies_seconds"]["turn_latency"]["count"] > 0
+
+
+async def test_simulate_outbound_injects_dial_failures_and_hangup_reasons():
+    profile = _create_profile(
+        dial_failure_rates={"SIP_TRUNK_FAILURE": 1.0},
+        hangup_reasons={"USER_REJECTED": 1.0},
+    )
+
+    result = await simulate_outbound(calls=5, concurrency=5, profile=profile)
+
+    assert result.calls_failed == 5
+    assert result.summary is not None
+    assert result.summary["outcomes"] == {"failed": 5}
+
+
+async def test_simulate_outbound_reports_disconnect_reason():
+    result = await simulate_outbound(
+        calls=3, concurrency=3, profile=_create_profile(hangup_reasons={"USER_REJECTED": 1.0})
+    )
+
+    assert result.summary is not None
+    assert result.summary["disconnect_reasons"] == {"USER_REJECTED": 3}
+
+
+async def test_simulate_inbound_runs_every_call_through_worker():
+    result = await simulate_inbound(calls=10, concurrency=5, profile=_create_profile())
+
+    assert result.calls_answered == 10
+    assert result.calls_hung_up == 10
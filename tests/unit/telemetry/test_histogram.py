@@ -0,0 +1,62 @@
+import pytest
+
+from livekit_voice_call_runner.telemetry.histogram import LatencyHistogram
+
+
+def test_percentiles_are_within_relative_error():
+    histogram = LatencyHistogram()
+    values = [i / 1000 for i in range(1, 1001)]  # 1ms .. 1s
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+    assert histogram.percentile(90) == pytest.approx(0.9, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+    assert histogram.percentile(100) == 1.0
+    assert histogram.min == 0.001
+    assert histogram.mean == pytest.approx(0.5005)
+
+
+def test_values_above_range_are_clamped_but_max_is_exact():
+    histogram = LatencyHistogram(max_value_seconds=10.0)
+
+    histogram.record(5.0)
+    histogram.record(120.0)
+
+    assert histogram.max == 120.0
+    assert histogram.percentile(100) == pytest.approx(10.0, rel=0.01)
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(50) is None
+    assert histogram.summary() == {"count": 0, "p50": None, "p90": None, "p99": None, "max": None, "mean": None}
+
+
+def test_merge_matches_single_histogram():
+    merged, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i in range(1, 101):
+        merged.record(i / 10)
+        (first if i % 2 else second).record(i / 10)
+
+    first.merge(second)
+
+    assert first.summary() == merged.summary()
+
+
+def test_merge_with_different_configuration():
+    with pytest.raises(ValueError, match="different configurations"):
+        LatencyHistogram().merge(LatencyHistogram(sub_bucket_bits=10))
+
+
+def test_round_trips_through_dict():
+    histogram = LatencyHistogram()
+    for value in [0.1, 0.2, 2.5]:
+        histogram.record(value)
+
+    restored = LatencyHistogram.from_dict(histogram.to_dict())
+
+    assert restored.summary() == histogram.summary()
+    assert len(histogram.to_dict()["buckets"]) == 3
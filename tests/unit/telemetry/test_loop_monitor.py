@@ -0,0 +1,79 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+from livekit_voice_call_runner.config.base import get_event_loop_monitor_config
+from livekit_voice_call_runner.telemetry.loop_monitor import (
+    EventLoopMonitor,
+    get_event_loop_monitor,
+    shutdown_event_loop_monitor,
+)
+
+
+def _block_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_monitor_logs_a_stall_with_the_blocking_code():
+    logger = MagicMock()
+    monitor = EventLoopMonitor(logger=logger, interval_seconds=0.01, slow_callback_seconds=0.05)
+    monitor.start()
+
+    with monitor.watch() as window:
+        await asyncio.sleep(0.03)
+        _block_loop(0.2)
+        await asyncio.sleep(0.03)
+    await monitor.shutdown()
+
+    stats = monitor.stats()
+    assert stats.slow_callbacks == 1
+    assert stats.samples >= 3
+    assert stats.max_seconds >= 0.15
+    assert window.max_lag_seconds == stats.max_seconds
+    logger.warning.assert_called_once()
+    extra = logger.warning.call_args.kwargs["extra"]
+    assert extra["lag_seconds"] >= 0.15
+    assert "test_monitor_logs_a_stall_with_the_blocking_code" in extra["blocking_task"]
+    assert any("in _block_loop" in frame for frame in extra["stack"])
+
+
+async def test_monitor_records_lag_without_logging_below_the_threshold():
+    logger = MagicMock()
+    monitor = EventLoopMonitor(logger=logger, interval_seconds=0.01, slow_callback_seconds=1.0)
+    monitor.start()
+
+    await asyncio.sleep(0.05)
+    with monitor.watch() as window:
+        pass
+    await monitor.shutdown()
+
+    assert monitor.stats().samples >= 2
+    assert monitor.slow_callbacks == 0
+    assert window.max_lag_seconds == 0.0
+    logger.warning.assert_not_called()
+
+
+async def test_get_event_loop_monitor_is_shared_until_shut_down(monkeypatch):
+    monkeypatch.setenv("EVENT_LOOP_MONITOR_INTERVAL_SECONDS", "0.01")
+    get_event_loop_monitor_config.cache_clear()
+    try:
+        monitor = get_event_loop_monitor()
+        assert monitor is not None
+        assert get_event_loop_monitor() is monitor
+        await asyncio.sleep(0.03)
+
+        stats = await shutdown_event_loop_monitor()
+
+        assert stats is not None and stats.samples >= 1
+        assert await shutdown_event_loop_monitor() is None
+    finally:
+        get_event_loop_monitor_config.cache_clear()
+
+
+async def test_get_event_loop_monitor_when_disabled(monkeypatch):
+    monkeypatch.setenv("EVENT_LOOP_MONITOR_INTERVAL_SECONDS", "0")
+    get_event_loop_monitor_config.cache_clear()
+    try:
+        assert get_event_loop_monitor() is None
+    finally:
+        get_event_loop_monitor_config.cache_clear()
@@ -0,0 +1,89 @@
+import urllib.request
+from unittest.mock import MagicMock
+
+from prometheus_client import CollectorRegistry
+
+from livekit_voice_call_runner.concurrency.adaptive_limiter import AdaptiveConcurrencyLimiter
+from livekit_voice_call_runner.concurrency.rate_limiter import LiveKitRateLimiter, TokenBucket
+from livekit_voice_call_runner.log_pipeline import LogPipeline
+from livekit_voice_call_runner.telemetry.loop_monitor import EventLoopMonitor
+from livekit_voice_call_runner.telemetry.metrics import CallMetrics, MetricsServer, RunStatsCollector
+
+
+def test_call_metrics_track_calls_by_direction():
+    registry = CollectorRegistry()
+    metrics = CallMetrics(registry=registry)
+
+    metrics.call_started(direction="outbound")
+    metrics.call_started(direction="outbound")
+    metrics.call_ended(
+        direction="outbound",
+        outcome="completed",
+        reason="CLIENT_INITIATED",
+        phase_durations={"create_room": 0.2, "dial": 4.0},
+        turn_latencies_seconds=[0.4, 0.6, 1.2],
+        ttft_seconds=[0.3],
+        interruptions=2,
+    )
+    metrics.call_ended(direction="outbound", outcome="failed", reason=None, phase_durations={})
+
+    def sample(name: str, **labels) -> float:
+        return registry.get_sample_value(name, {"direction": "outbound", **labels})
+
+    assert sample("voice_call_runner_calls_started_total") == 2
+    assert sample("voice_call_runner_calls_in_flight") == 0
+    assert sample("voice_call_runner_calls_ended_total", outcome="completed", reason="CLIENT_INITIATED") == 1
+    assert sample("voice_call_runner_calls_ended_total", outcome="failed", reason="UNKNOWN") == 1
+    assert sample("voice_call_runner_phase_duration_seconds_sum", phase="dial") == 4.0
+    assert sample("voice_call_runner_turn_latency_seconds_bucket", le="0.5") == 1
+    assert sample("voice_call_runner_turn_latency_seconds_count") == 3
+    assert sample("voice_call_runner_realtime_ttft_seconds_count") == 1
+    assert sample("voice_call_runner_interruptions_total") == 2
+    assert registry.get_sample_value("voice_call_runner_calls_started_total", {"direction": "inbound"}) is None
+
+
+async def test_run_stats_collector_reads_component_stats():
+    rate_limiter = LiveKitRateLimiter(room_api=TokenBucket(rate_per_second=1000.0, burst=1))
+    await rate_limiter.acquire_room_api()
+    await rate_limiter.acquire_room_api()
+    concurrency_limiter = AdaptiveConcurrencyLimiter(max_limit=8, logger=MagicMock(), initial_limit=4)
+    log_pipeline = LogPipeline()
+    event_loop_monitor = EventLoopMonitor(logger=MagicMock(), slow_callback_seconds=0.1)
+    event_loop_monitor._record(lag_seconds=0.002, due_at=0.0)
+    event_loop_monitor._record(lag_seconds=0.25, due_at=0.0)
+    registry = CollectorRegistry()
+    registry.register(
+        RunStatsCollector(
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            log_pipeline=log_pipeline,
+            event_loop_monitor=event_loop_monitor,
+        )
+    )
+
+    assert registry.get_sample_value("voice_call_runner_rate_limiter_acquired_total", {"bucket": "room_api"}) == 2
+    assert registry.get_sample_value("voice_call_runner_rate_limiter_delayed_total", {"bucket": "room_api"}) == 1
+    assert registry.get_sample_value("voice_call_runner_rate_limiter_wait_seconds_total", {"bucket": "room_api"}) > 0
+    assert registry.get_sample_value("voice_call_runner_concurrency_limit") == 4
+    assert registry.get_sample_value("voice_call_runner_log_queue_depth") == 0
+    assert registry.get_sample_value("voice_call_runner_log_records_dropped_total") == 0
+    assert registry.get_sample_value("voice_call_runner_event_loop_lag_seconds", {"quantile": "1.0"}) == 0.25
+    assert registry.get_sample_value("voice_call_runner_event_loop_slow_callbacks_total") == 1
+
+
+def test_metrics_server_serves_and_unregisters_its_collectors():
+    registry = CollectorRegistry()
+    CallMetrics(registry=registry).call_started(direction="inbound")
+    collector = RunStatsCollector(rate_limiter=LiveKitRateLimiter(room_api=TokenBucket(rate_per_second=1.0)))
+    server = MetricsServer(port=0, address="127.0.0.1", collectors=[collector], registry=registry)
+
+    server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+
+    assert 'voice_call_runner_calls_in_flight{direction="inbound"} 1.0' in body
+    assert 'voice_call_runner_rate_limiter_acquired_total{bucket="room_api"} 0.0' in body
+    assert registry.get_sample_value("voice_call_runner_rate_limiter_acquired_total", {"bucket": "room_api"}) is None
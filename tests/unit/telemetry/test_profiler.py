@@ -0,0 +1,89 @@
+import asyncio
+import os
+import pstats
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from livekit_voice_call_runner.logger import bind_log_context, set_log_phase
+from livekit_voice_call_runner.telemetry.profiler import (
+    ProfileMode,
+    RunProfiler,
+    get_profile_path,
+    get_run_profiler,
+)
+
+
+def _burn_cpu(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _run_call() -> None:
+    with bind_log_context(correlation_id="call-1"):
+        set_log_phase("prepare")
+        _burn_cpu(0.05)
+        await asyncio.sleep(0.01)
+        set_log_phase("in_call")
+        _burn_cpu(0.2)
+
+
+def test_get_profile_path():
+    assert get_profile_path(path="profile", mode=ProfileMode.CPROFILE) == "profile.prof"
+    assert get_profile_path(path="out/run", mode=ProfileMode.SAMPLING, suffix="42") == "out/run.42.folded"
+    assert get_profile_path(path="out/run.txt", mode=ProfileMode.SAMPLING, suffix="42") == "out/run.42.txt"
+
+
+async def test_sampling_profiler_writes_folded_stacks_and_cpu_by_phase(tmp_path):
+    logger = MagicMock()
+    profiler = RunProfiler(
+        mode=ProfileMode.SAMPLING, path=str(tmp_path / "run.folded"), logger=logger, sample_interval_seconds=0.002
+    )
+    profiler.start()
+
+    await asyncio.create_task(_run_call())
+    await asyncio.sleep(0.02)
+    report = profiler.stop()
+
+    assert report.samples > report.idle_samples > 0
+    assert report.loop_cpu_seconds >= 0.2
+    assert report.phase_cpu_seconds["in_call"] > report.phase_cpu_seconds["prepare"] > 0
+    assert sum(report.phase_cpu_seconds.values()) == pytest.approx(report.loop_cpu_seconds)
+    lines = (tmp_path / "run.folded").read_text().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.endswith("_burn_cpu")
+    assert "tests.unit.telemetry.test_profiler:_run_call" in stack
+    assert int(count) > 0
+    logger.info.assert_called_once()
+    assert logger.info.call_args.kwargs["extra"]["path"] == str(tmp_path / "run.folded")
+
+
+async def test_cprofile_profiler_writes_stats_and_keeps_profiling_after_a_write(tmp_path):
+    path = str(tmp_path / "run.prof")
+    profiler = RunProfiler(mode=ProfileMode.CPROFILE, path=path, logger=MagicMock(), sample_interval_seconds=0.002)
+    profiler.start()
+
+    await _run_call()
+    profiler.write()
+    _burn_cpu(0.01)
+    report = profiler.stop()
+
+    assert report.phase_cpu_seconds["in_call"] > 0
+    calls = {
+        function: stats[1] for (_, _, function), stats in pstats.Stats(path).stats.items()  # type: ignore[attr-defined]
+    }
+    assert calls["_burn_cpu"] == 3
+
+
+async def test_get_run_profiler_is_shared_and_suffixed_with_the_process_id(tmp_path):
+    assert get_run_profiler(mode=None, path=str(tmp_path / "run")) is None
+
+    profiler = get_run_profiler(mode=ProfileMode.SAMPLING, path=str(tmp_path / "run"))
+    try:
+        assert profiler is not None
+        assert profiler.path == str(tmp_path / f"run.{os.getpid()}.folded")
+        assert get_run_profiler(mode=ProfileMode.SAMPLING, path=str(tmp_path / "run")) is profiler
+    finally:
+        profiler.stop()
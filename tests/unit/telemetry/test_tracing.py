@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from livekit_voice_call_runner.telemetry.tracing import (
+    CallTrace,
+    CallTracer,
+    JsonlSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporter,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CollectingExporter(SpanExporter):
+    def __init__(self):
+        self.traces = []
+        self.shut_down = False
+
+    def export(self, traces):
+        self.traces.extend(traces)
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+def test_span_records_duration():
+    clock = _Clock()
+    trace = CallTrace(correlation_id="call-1", clock=clock)
+
+    with trace.span("create_room"):
+        clock.now += 0.5
+    clock.now += 1.0
+    trace.mark("answered")
+
+    assert trace.durations() == {"create_room": 0.5, "answered": 0.0}
+    assert trace.offsets() == {"create_room": 0.0, "answered": 1.5}
+
+
+def test_span_records_error():
+    trace = CallTrace(correlation_id="call-1")
+
+    with pytest.raises(RuntimeError):
+        with trace.span("dial"):
+            raise RuntimeError("busy")
+
+    assert trace.spans[0].error == "RuntimeError"
+    assert trace.spans[0].end is not None
+
+
+def test_tracer_exports_finished_traces_on_shutdown():
+    exporter = _CollectingExporter()
+    tracer = CallTracer(exporters=[exporter])
+
+    traces = [tracer.start_trace(correlation_id=f"call-{i}") for i in range(3)]
+    for trace in traces:
+        trace.finish()
+        trace.finish()
+    tracer.shutdown()
+
+    assert [trace.correlation_id for trace in exporter.traces] == ["call-0", "call-1", "call-2"]
+    assert exporter.shut_down
+
+
+def test_jsonl_exporter_writes_one_line_per_trace(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonlSpanExporter(path=str(path))
+    trace = CallTrace(correlation_id="call-1")
+    with trace.span("dial"):
+        pass
+    trace.finish()
+
+    exporter.export([trace, trace])
+    exporter.shutdown()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record["correlation_id"] == "call-1"
+    assert record["spans"][0]["name"] == "dial"
+
+
+def test_otlp_exporter_payload_nests_phases_under_call_span():
+    exporter = OtlpHttpSpanExporter(endpoint="http://localhost:4318")
+    trace = CallTrace(correlation_id="call-1")
+    with trace.span("dial"):
+        pass
+    trace.finish()
+
+    spans = exporter.to_payload([trace])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+    assert [span["name"] for span in spans] == ["call", "dial"]
+    assert spans[1]["parentSpanId"] == spans[0]["spanId"]
+    assert len(spans[0]["traceId"]) == 32
+    assert int(spans[1]["endTimeUnixNano"]) >= int(spans[1]["startTimeUnixNano"])
+
+
+def test_otlp_exporter_reports_errors_instead_of_raising():
+    errors = []
+    exporter = OtlpHttpSpanExporter(endpoint="http://127.0.0.1:9", timeout_seconds=0.5, on_error=errors.append)
+
+    exporter.export([CallTrace(correlation_id="call-1")])
+
+    assert len(errors) == 1
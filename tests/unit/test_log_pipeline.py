@@ -0,0 +1,114 @@
+import io
+import json
+import logging
+from unittest.mock import patch
+
+from livekit_voice_call_runner.config.base import LogOverflowPolicy
+from livekit_voice_call_runner.log_pipeline import LogPipeline, QueueLogHandler
+from livekit_voice_call_runner.logger import JsonFormatter
+
+
+def _create_logger(pipeline: LogPipeline, name: str = "test-pipeline") -> logging.Logger:
+    logger = logging.Logger(name=name)
+    handler = QueueLogHandler(pipeline=pipeline)
+    handler.setFormatter(JsonFormatter(correlation_id="call-1"))
+    logger.addHandler(handler)
+    return logger
+
+
+def test_records_are_formatted_and_written_in_background():
+    stream = io.StringIO()
+    pipeline = LogPipeline(stream=stream)
+    logger = _create_logger(pipeline)
+
+    pipeline.start()
+    for i in range(100):
+        logger.info("Dialing call %d.", i, extra={"room_name": f"room-{i}"})
+    pipeline.shutdown()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(lines) == 100
+    assert lines[42]["message"] == "Dialing call 42."
+    assert lines[42]["room_name"] == "room-42"
+    assert lines[42]["correlation_id"] == "call-1"
+    assert pipeline.stats().written == 100
+
+
+def test_drop_newest_when_queue_is_full():
+    stream = io.StringIO()
+    pipeline = LogPipeline(max_queue_size=3, stream=stream)
+    logger = _create_logger(pipeline)
+    # a writer that is not draining the queue
+    pipeline._thread = object()  # type: ignore
+
+    for i in range(5):
+        logger.info(f"line {i}")
+
+    assert pipeline.stats().enqueued == 3
+    assert pipeline.stats().dropped == 2
+    assert [item[1].getMessage() for item in list(pipeline._queue.queue)] == ["line 0", "line 1", "line 2"]
+
+
+def test_drop_oldest_when_queue_is_full():
+    pipeline = LogPipeline(max_queue_size=3, overflow_policy=LogOverflowPolicy.DROP_OLDEST)
+    logger = _create_logger(pipeline)
+    pipeline._thread = object()  # type: ignore
+
+    for i in range(5):
+        logger.info(f"line {i}")
+
+    assert pipeline.stats().dropped == 2
+    assert [item[1].getMessage() for item in list(pipeline._queue.queue)] == ["line 2", "line 3", "line 4"]
+
+
+def test_block_waits_for_room_then_drops():
+    pipeline = LogPipeline(max_queue_size=1, overflow_policy=LogOverflowPolicy.BLOCK, block_timeout_seconds=0.01)
+    logger = _create_logger(pipeline)
+    pipeline._thread = object()  # type: ignore
+
+    logger.info("line 0")
+    logger.info("line 1")
+
+    assert pipeline.stats().blocked == 1
+    assert pipeline.stats().dropped == 1
+
+
+def test_dropped_records_are_reported_in_band():
+    stream = io.StringIO()
+    pipeline = LogPipeline(stream=stream)
+    pipeline._stats.dropped = 7
+
+    pipeline.start()
+    _create_logger(pipeline).info("after the burst")
+    pipeline.shutdown()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines[-1]["message"] == "Dropped log records, the log queue was full."
+    assert lines[-1]["dropped"] == 7
+
+
+def test_writes_on_caller_thread_once_shut_down():
+    stream = io.StringIO()
+    pipeline = LogPipeline(stream=stream)
+    pipeline.start()
+    pipeline.shutdown()
+
+    _create_logger(pipeline).info("late line")
+
+    assert json.loads(stream.getvalue())["message"] == "late line"
+
+
+def test_bad_message_arguments_are_reported_not_raised():
+    stream = io.StringIO()
+    pipeline = LogPipeline(stream=stream)
+    logger = _create_logger(pipeline)
+    pipeline.start()
+
+    with patch.object(QueueLogHandler, "handleError") as handle_error:
+        logger.info("Dialing call %d.", "x")
+        logger.info("Dialed call.")
+    pipeline.shutdown()
+
+    handle_error.assert_called_once()
+    assert handle_error.call_args.args[0].msg == "Dialing call %d."
+    assert [json.loads(line)["message"] for line in stream.getvalue().splitlines()] == ["Dialed call."]
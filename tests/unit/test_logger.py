@@ -0,0 +1,213 @@
+import asyncio
+import json
+import logging
+import sys
+
+from livekit_voice_call_runner.logger import (
+    ColoredJsonFormatter,
+    JsonFormatter,
+    LogContextFilter,
+    bind_log_context,
+    create_logger,
+    get_log_context,
+    set_log_phase,
+    use_log_context,
+)
+
+
+def _create_record(msg: str = "Dialing %s.", args: tuple = ("+15550000000",), **extra) -> logging.LogRecord:
+    exc_info = extra.pop("exc_info", None)
+    record = logging.LogRecord(
+        name="OutboundCallDialer",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+def test_format_fields_and_extras():
+    record = _create_record(room_name="room-1", sip_call_id="SCL_1", attempt=2, skipped=None, empty="")
+
+    line = JsonFormatter(correlation_id="call-1").format(record)
+
+    # outside of a task `taskName` is None and skipped like any other empty extra
+    assert json.loads(line) == {
+        "timestamp": logging.Formatter().formatTime(record),
+        "level": "INFO",
+        "logger": "OutboundCallDialer",
+        "message": "Dialing +15550000000.",
+        "correlation_id": "call-1",
+        "room_name": "room-1",
+        "sip_call_id": "SCL_1",
+        "attempt": 2,
+    }
+    assert "\n" not in line
+
+
+def test_format_without_extras_or_correlation_id():
+    line = JsonFormatter().format(_create_record(msg='Said "hello" é', args=()))
+
+    parsed = json.loads(line)
+    assert parsed["message"] == 'Said "hello" é'
+    assert parsed["correlation_id"] is None
+    assert list(parsed) == ["timestamp", "level", "logger", "message", "correlation_id"]
+
+
+def test_format_non_serializable_extra_as_string():
+    parsed = json.loads(JsonFormatter().format(_create_record(path=object)))
+
+    assert parsed["path"] == str(object)
+
+
+def test_format_exc_info():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _create_record(exc_info=sys.exc_info())
+
+    parsed = json.loads(JsonFormatter().format(record))
+
+    assert "ValueError: boom" in parsed["exc_info"]
+
+
+def test_pretty_print_matches_compact():
+    record = _create_record(room_name="room-1")
+
+    compact = JsonFormatter(correlation_id="call-1").format(record)
+    pretty = JsonFormatter(correlation_id="call-1", pretty_print=True).format(record)
+
+    assert "\n" in pretty
+    assert json.loads(pretty) == json.loads(compact)
+
+
+def test_colored_level():
+    formatter = ColoredJsonFormatter(correlation_id="call-1")
+
+    info = formatter.format(_create_record())
+    record = _create_record()
+    record.levelname = "ERROR"
+    error = formatter.format(record)
+
+    assert '"level": "\033[32mINFO\033[0m"' in info
+    assert '"level": "\033[31mERROR\033[0m"' in error
+    assert '"message": "Dialing +15550000000."' in info
+
+
+def _format_in_context(formatter: JsonFormatter, record: logging.LogRecord) -> dict:
+    LogContextFilter().filter(record)
+    return json.loads(formatter.format(record))
+
+
+def test_format_log_context():
+    formatter = JsonFormatter(correlation_id="run-1")
+
+    with bind_log_context(correlation_id="call-1", round=2):
+        with bind_log_context(phone_number="+15550000000"):
+            set_log_phase("dial")
+            parsed = _format_in_context(formatter, _create_record())
+        outer = _format_in_context(formatter, _create_record())
+    outside = _format_in_context(formatter, _create_record())
+
+    assert parsed["correlation_id"] == "call-1"
+    assert parsed["round"] == 2
+    assert parsed["phone_number"] == "+15550000000"
+    assert parsed["phase"] == "dial"
+    assert "phase" not in outer and outer["round"] == 2
+    assert outside["correlation_id"] == "run-1"
+    assert "round" not in outside
+
+
+def test_format_log_context_shard():
+    with bind_log_context(correlation_id="run-1", shard=1):
+        with bind_log_context(correlation_id="call-1", round=0):
+            parsed = _format_in_context(JsonFormatter(), _create_record())
+
+    assert list(parsed)[4:7] == ["correlation_id", "shard", "round"]
+    assert parsed["shard"] == 1
+
+
+def test_format_log_context_pretty_print_matches_compact():
+    record = _create_record()
+    with bind_log_context(correlation_id="call-1", phase="dial"):
+        LogContextFilter().filter(record)
+
+    compact = JsonFormatter().format(record)
+    pretty = JsonFormatter(pretty_print=True).format(record)
+
+    assert json.loads(pretty) == json.loads(compact)
+
+
+async def test_log_context_is_isolated_per_task():
+    async def call(correlation_id: str) -> tuple:
+        with bind_log_context(correlation_id=correlation_id):
+            await asyncio.sleep(0)
+            set_log_phase("in_call")
+            await asyncio.sleep(0)
+            context = get_log_context()
+            return context.correlation_id, context.phase
+
+    results = await asyncio.gather(*(call(f"call-{i}") for i in range(3)))
+
+    assert results == [("call-0", "in_call"), ("call-1", "in_call"), ("call-2", "in_call")]
+    assert get_log_context() is None
+
+
+async def test_log_phase_reaches_tasks_started_earlier():
+    phases = []
+
+    async def on_event(started: asyncio.Event, event: asyncio.Event) -> None:
+        started.set()
+        await event.wait()
+        phases.append(get_log_context().phase)
+
+    with bind_log_context(correlation_id="call-1"):
+        set_log_phase("prepare")
+        started, event = asyncio.Event(), asyncio.Event()
+        task = asyncio.create_task(on_event(started, event))
+        await started.wait()
+        set_log_phase("in_call")
+        event.set()
+        await task
+
+    assert phases == ["in_call"]
+
+
+def test_log_phase_is_captured_when_logged():
+    formatter = JsonFormatter()
+    record = _create_record()
+
+    with bind_log_context(correlation_id="call-1", phase="dial"):
+        LogContextFilter().filter(record)
+        set_log_phase("in_call")
+
+    assert json.loads(formatter.format(record))["phase"] == "dial"
+
+
+def test_use_log_context_fills_in_missing_fields():
+    with bind_log_context(correlation_id="call-1") as context:
+        pass
+
+    with bind_log_context(round=3):
+        with use_log_context(context):
+            assert get_log_context() is context
+    assert get_log_context() is None
+    assert context.round == 3
+    assert context.correlation_id == "call-1"
+
+
+def test_create_logger_shares_one_handler():
+    first = create_logger(name="OutboundCallDialer")
+    second = create_logger(name="OutboundCallDialer")
+    module_logger = create_logger(name="livekit_voice_call_runner.cli.outbound")
+
+    assert first is second
+    assert first.name == "livekit_voice_call_runner.OutboundCallDialer"
+    assert module_logger.name == "livekit_voice_call_runner.cli.outbound"
+    assert not first.handlers
+    assert first.parent is module_logger.parent
+    assert len(first.parent.handlers) == 1